@@ -0,0 +1,49 @@
+"""add composite indexes for hot raw_posts/posts queries
+
+Revision ID: 3b8e6f0c2d91
+Revises: 9d4f2b7e1a6c
+Create Date: 2026-10-18 15:00:00.000000
+
+- raw_posts (raw_feed_id, created_at DESC) restricted to non-blocked rows.
+  Used by RawPostRepository.get_raw_posts_by_prompt (both the offset and
+  timestamp variants) and the raw_posts_processed count in
+  FeedRepository. The predicate is written exactly like the queries'
+  filter (moderation_action IS NULL OR moderation_action != 'block') so
+  the planner can prove the partial index applies.
+- posts (feed_id, created_at DESC, id DESC) matches the keyset
+  pagination in PostRepository (ORDER BY created_at DESC, id DESC and the
+  (created_at, id) < cursor row comparison). It supersedes
+  ix_posts_feed_id_created_at, which is its prefix.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "3b8e6f0c2d91"
+down_revision: str | None = "9d4f2b7e1a6c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_raw_posts_raw_feed_id_created_at_visible
+        ON raw_posts (raw_feed_id, created_at DESC)
+        WHERE moderation_action IS NULL OR moderation_action != 'block'
+    """)
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_posts_feed_id_created_at_id
+        ON posts (feed_id, created_at DESC, id DESC)
+    """)
+    op.execute("DROP INDEX IF EXISTS ix_posts_feed_id_created_at")
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_posts_feed_id_created_at
+        ON posts (feed_id, created_at DESC)
+    """)
+    op.execute("DROP INDEX IF EXISTS ix_posts_feed_id_created_at_id")
+    op.execute("DROP INDEX IF EXISTS ix_raw_posts_raw_feed_id_created_at_visible")
@@ -0,0 +1,90 @@
+"""add next_run_at to prompts
+
+Revision ID: 4ef72c85ab7e
+Revises: b2c3d4e5f700
+Create Date: 2026-10-18 12:00:00.000000
+
+Stores the next background run time (last_execution + type interval) so that
+PromptRepository.claim_prompts_for_background_processing can pick due prompts
+with an index range scan instead of computing now() - last_execution per row.
+
+next_run_at is maintained by a trigger because last_execution is also written
+by the Go services; a generated column is not possible since timestamptz
+arithmetic is not immutable.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "4ef72c85ab7e"
+down_revision: str | None = "b2c3d4e5f700"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "prompts",
+        sa.Column(
+            "next_run_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Next background run: last_execution + interval (2 min SINGLE_POST, digest_interval_hours DIGEST). NULL means never run.",
+        ),
+    )
+
+    # Partial indexes below are keyed on prompts.feed_type, fill it for old rows
+    op.execute("""
+        UPDATE prompts p
+        SET feed_type = pp.type
+        FROM pre_prompts pp
+        WHERE p.pre_prompt_id = pp.id
+          AND p.feed_type IS NULL
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION prompts_set_next_run_at() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.last_execution IS NULL THEN
+                NEW.next_run_at := NULL;
+            ELSIF NEW.feed_type = 'DIGEST' THEN
+                NEW.next_run_at := NEW.last_execution
+                    + make_interval(hours => COALESCE(NEW.digest_interval_hours, 12));
+            ELSE
+                NEW.next_run_at := NEW.last_execution + interval '2 minutes';
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("""
+        CREATE TRIGGER trg_prompts_set_next_run_at
+        BEFORE INSERT OR UPDATE OF last_execution, digest_interval_hours, feed_type
+        ON prompts
+        FOR EACH ROW EXECUTE FUNCTION prompts_set_next_run_at()
+    """)
+
+    # Backfill through the trigger
+    op.execute("UPDATE prompts SET last_execution = last_execution")
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_prompts_next_run_at_single_post
+        ON prompts (next_run_at ASC NULLS FIRST)
+        WHERE feed_type = 'SINGLE_POST'
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_prompts_next_run_at_digest
+        ON prompts (next_run_at ASC NULLS FIRST)
+        WHERE feed_type = 'DIGEST'
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_prompts_next_run_at_digest")
+    op.execute("DROP INDEX IF EXISTS ix_prompts_next_run_at_single_post")
+    op.execute("DROP TRIGGER IF EXISTS trg_prompts_set_next_run_at ON prompts")
+    op.execute("DROP FUNCTION IF EXISTS prompts_set_next_run_at()")
+    op.drop_column("prompts", "next_run_at")
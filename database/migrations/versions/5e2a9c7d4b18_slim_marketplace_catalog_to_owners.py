@@ -0,0 +1,84 @@
+"""keep only owner metadata in marketplace_catalog
+
+Revision ID: 5e2a9c7d4b18
+Revises: 3b8e6f0c2d91
+Create Date: 2026-10-18 23:30:00.000000
+
+go-api renames, retags and deletes feeds without refreshing
+marketplace_catalog, so its copies of name and tags went stale.
+MarketplaceRepository now joins the catalog back to feeds for those and
+for is_marketplace; the view only precomputes the owner lookup (users_feeds
+x auth.users) and the internal-account exclusion.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "5e2a9c7d4b18"
+down_revision: str | None = "3b8e6f0c2d91"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_EXCLUDED_OWNERS = """
+          AND NOT EXISTS (
+              SELECT 1
+              FROM users_feeds excluded
+              WHERE excluded.feed_id = feeds.id
+                AND excluded.user_id IN (
+                    '19e01875-c620-4292-aa4b-1c7994574e6a',
+                    'f2482b55-5184-4a52-89c5-a95e64e96a1d'
+                )
+          )
+"""
+
+
+def upgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS marketplace_catalog")
+    op.execute(f"""
+        CREATE MATERIALIZED VIEW marketplace_catalog AS
+        SELECT DISTINCT ON (feeds.id)
+               feeds.id AS feed_id,
+               users.id AS user_id,
+               users.raw_user_meta_data ->> 'avatar_url' AS picture,
+               users.raw_user_meta_data ->> 'full_name' AS full_name
+        FROM feeds
+                 JOIN users_feeds ON feeds.id = users_feeds.feed_id
+                 JOIN auth.users ON users_feeds.user_id = users.id
+        WHERE feeds.is_marketplace = true
+        {_EXCLUDED_OWNERS}
+        ORDER BY feeds.id, feeds.created_at DESC
+    """)
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute("""
+        CREATE UNIQUE INDEX ux_marketplace_catalog_feed_id
+        ON marketplace_catalog (feed_id)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS marketplace_catalog")
+    op.execute(f"""
+        CREATE MATERIALIZED VIEW marketplace_catalog AS
+        SELECT DISTINCT ON (feeds.id)
+               feeds.id AS feed_id,
+               feeds.name,
+               COALESCE(feeds.tags, '{{}}') AS tags,
+               users.id AS user_id,
+               users.raw_user_meta_data ->> 'avatar_url' AS picture,
+               users.raw_user_meta_data ->> 'full_name' AS full_name
+        FROM feeds
+                 JOIN users_feeds ON feeds.id = users_feeds.feed_id
+                 JOIN auth.users ON users_feeds.user_id = users.id
+        WHERE feeds.is_marketplace = true
+        {_EXCLUDED_OWNERS}
+        ORDER BY feeds.id, feeds.created_at DESC
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX ux_marketplace_catalog_feed_id
+        ON marketplace_catalog (feed_id)
+    """)
+    op.execute("""
+        CREATE INDEX ix_marketplace_catalog_tags
+        ON marketplace_catalog USING GIN (tags)
+    """)
@@ -0,0 +1,63 @@
+"""create marketplace_catalog materialized view
+
+Revision ID: 7c1e5a9d3b20
+Revises: 4ef72c85ab7e
+Create Date: 2026-10-18 12:30:00.000000
+
+Precomputes the marketplace feed list (feed, tags, owner metadata) that
+MarketplaceRepository.get_marketplace_feeds used to rebuild on every request.
+Feeds of the internal accounts are excluded here once; per-user filtering is
+reduced to a tag overlap (GIN) plus a subscription anti-join.
+
+Refreshed by MarketplaceRepository.refresh_marketplace_catalog.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "7c1e5a9d3b20"
+down_revision: str | None = "4ef72c85ab7e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS marketplace_catalog AS
+        SELECT DISTINCT ON (feeds.id)
+               feeds.id AS feed_id,
+               feeds.name,
+               COALESCE(feeds.tags, '{}') AS tags,
+               users.id AS user_id,
+               users.raw_user_meta_data ->> 'avatar_url' AS picture,
+               users.raw_user_meta_data ->> 'full_name' AS full_name
+        FROM feeds
+                 JOIN users_feeds ON feeds.id = users_feeds.feed_id
+                 JOIN auth.users ON users_feeds.user_id = users.id
+        WHERE feeds.is_marketplace = true
+          AND NOT EXISTS (
+              SELECT 1
+              FROM users_feeds excluded
+              WHERE excluded.feed_id = feeds.id
+                AND excluded.user_id IN (
+                    '19e01875-c620-4292-aa4b-1c7994574e6a',
+                    'f2482b55-5184-4a52-89c5-a95e64e96a1d'
+                )
+          )
+        ORDER BY feeds.id, feeds.created_at DESC
+    """)
+
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS ux_marketplace_catalog_feed_id
+        ON marketplace_catalog (feed_id)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_marketplace_catalog_tags
+        ON marketplace_catalog USING GIN (tags)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS marketplace_catalog")
@@ -0,0 +1,44 @@
+"""add digest_scheduled_at to prompts
+
+Revision ID: 8c4f1a2b6d37
+Revises: 5e2a9c7d4b18
+Create Date: 2026-10-19 10:00:00.000000
+
+Stores the run time of a DIGEST prompt's pending JetStream message as
+DigestScheduler placed it (after schedule shaping). next_run_at can't hold
+it: its trigger rewrites it to last_execution + interval whenever
+go-processor records a run, which would drop the shaping. The shaper's
+slot histogram is seeded from this column.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "8c4f1a2b6d37"
+down_revision: str | None = "5e2a9c7d4b18"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "prompts",
+        sa.Column(
+            "digest_scheduled_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Run time of the pending scheduled digest message (after shaping). Only for DIGEST type.",
+        ),
+    )
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_prompts_digest_scheduled_at
+        ON prompts (digest_scheduled_at)
+        WHERE feed_type = 'DIGEST'
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_prompts_digest_scheduled_at")
+    op.drop_column("prompts", "digest_scheduled_at")
@@ -0,0 +1,44 @@
+"""add indexes for time-based retention of raw_posts and posts
+
+Revision ID: 9d4f2b7e1a6c
+Revises: 7c1e5a9d3b20
+Create Date: 2026-10-18 14:00:00.000000
+
+RetentionJob deletes old raw_posts/posts in created_at order, batch by
+batch. ix_raw_posts_created_at already exists; posts only had
+(feed_id, created_at). The other two indexes serve the FK actions fired by
+those deletes (prompts_raw_posts ON DELETE CASCADE, offsets NOT EXISTS
+check), which were sequential scans before.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "9d4f2b7e1a6c"
+down_revision: str | None = "7c1e5a9d3b20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_posts_created_at
+        ON posts (created_at ASC)
+    """)
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_prompts_raw_posts_raw_post_id
+        ON prompts_raw_posts (raw_post_id)
+    """)
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_prompts_raw_feeds_offsets_last_processed
+        ON prompts_raw_feeds_offsets (last_processed_raw_post_id)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_prompts_raw_feeds_offsets_last_processed")
+    op.execute("DROP INDEX IF EXISTS ix_prompts_raw_posts_raw_post_id")
+    op.execute("DROP INDEX IF EXISTS ix_posts_created_at")
@@ -0,0 +1,31 @@
+"""add GIN index on marketplace feeds' tags
+
+Revision ID: c1d5e8f2a940
+Revises: 8c4f1a2b6d37
+Create Date: 2026-10-19 12:00:00.000000
+
+MarketplaceRepository matches the user's tags against feeds.tags (the
+catalog view no longer copies them), so the tag overlap needs its own
+index. Partial on is_marketplace, like the catalog query's filter.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "c1d5e8f2a940"
+down_revision: str | None = "8c4f1a2b6d37"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_feeds_tags_marketplace
+        ON feeds USING GIN (tags)
+        WHERE is_marketplace = true
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_feeds_tags_marketplace")
@@ -19,6 +19,26 @@ class AgentsSettings(BaseSettings):
     database_pool_recycle: int = Field(
         default=300, description="Connection recycle time"
     )
+    database_prepared_statement_cache_size: int = Field(
+        default=500, description="asyncpg prepared statements cached per connection"
+    )
+    database_pgbouncer: bool = Field(
+        default=False, description="Connect through PgBouncer (transaction pooling)"
+    )
+    database_pool_pre_ping: bool = Field(
+        default=True,
+        description="Ping connections on checkout (skipped with database_pgbouncer)",
+    )
+    database_replica_url: str = Field(
+        default="",
+        description="Read replica URL for read-only sessions (empty: primary only)",
+    )
+    database_replica_max_lag_seconds: float = Field(
+        default=5.0, description="Read from the primary when replica lag exceeds this"
+    )
+    database_read_your_writes_seconds: float = Field(
+        default=5.0, description="Read from the primary this long after a write"
+    )
 
     # AI/LLM settings (global defaults)
     ai_api_key: str = Field(
@@ -42,6 +62,49 @@ class AgentsSettings(BaseSettings):
         default=90.0,
         description="Timeout for unseen_summary agent (longer due to complex prompt)",
     )
+    llm_pricing_reload_interval: float = Field(
+        default=300.0,
+        description="Seconds between LLM pricing reloads (also on pricing.updated)",
+    )
+
+    # Time-based retention (RetentionJob); unset keeps rows forever
+    raw_posts_retention_days: int | None = Field(
+        default=None, description="Delete raw_posts older than this many days"
+    )
+    posts_retention_days: int | None = Field(
+        default=None, description="Delete posts older than this many days"
+    )
+    retention_batch_size: int = Field(
+        default=5000, description="Rows deleted per retention transaction"
+    )
+    retention_interval: float = Field(
+        default=3600.0, description="Seconds between retention runs"
+    )
+    orphaned_feed_purge_enabled: bool = Field(
+        default=False,
+        description="Also delete feeds without subscribers (and their posts)",
+    )
+
+    # Marketplace catalog (MarketplaceCatalogRefresher); unset never refreshes
+    marketplace_catalog_refresh_interval: float | None = Field(
+        default=600.0, description="Seconds between marketplace_catalog refreshes"
+    )
+
+    # Digest rescheduling (DigestScheduler with DigestScheduleShaper)
+    digest_rescheduling_enabled: bool = Field(
+        default=False,
+        description="Schedule each DIGEST prompt's next run when digest.execute fires",
+    )
+    digest_schedule_slot_minutes: int = Field(
+        default=15, description="Width of the schedule shaping slots"
+    )
+    digest_schedule_tolerance_minutes: dict[str, int] = Field(
+        default_factory=lambda: {"FREE": 90, "PRO": 20},
+        description="Shaping tolerance per subscription plan, in minutes",
+    )
+    digest_schedule_histogram_refresh: float = Field(
+        default=60.0, description="Seconds before the slot histogram is reloaded"
+    )
 
     # Per-agent model configuration (fallback to ai_model if not set)
     chat_message_model: str = "meta-llama/llama-3.1-8b-instruct"
@@ -12,12 +12,31 @@ import signal
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
-from faststream.nats import NatsBroker
+from faststream.nats import JStream, NatsBroker
 from faststream.nats.opentelemetry import NatsTelemetryMiddleware
 from loguru import logger
-from shared.database.connection import create_db_engine
+from nats.js.api import DeliverPolicy
+from shared.database.connection import (
+    SessionMaker,
+    create_db_engine,
+    create_session_maker,
+)
+from shared.events.cache_invalidated import CacheInvalidatedEvent
+from shared.events.digest_scheduled import DigestScheduledEvent
+from shared.events.pricing_updated import PricingUpdatedEvent
+from shared.faststream.digest_stream import DIGEST_EXECUTE_SUBJECT, DIGEST_STREAM_NAME
+from shared.nats.cache_invalidation import (
+    CACHE_INVALIDATE_SUBJECT,
+    apply_cache_invalidation,
+)
+from shared.nats.pricing_updates import PRICING_UPDATED_SUBJECT
+from shared.services.digest_scheduler import DigestScheduler
+from shared.services.digest_shaping import DigestScheduleShaper
+from shared.services.marketplace_catalog_refresher import MarketplaceCatalogRefresher
+from shared.services.pricing_reloader import PricingReloader
+from shared.services.retention_job import RetentionJob
 from shared.setup_sentry import setup_sentry
-from shared.utils.llm_pricing import load_pricing_from_db
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from .config import settings
 from .handlers import setup_agent_handlers
@@ -46,6 +65,11 @@ class AgentsApp:
     def __init__(self) -> None:
         self._running = False
         self._broker: NatsBroker | None = None
+        self._pricing_reloader: PricingReloader | None = None
+        self._replica_engine: AsyncEngine | None = None
+        self._retention_job: RetentionJob | None = None
+        self._catalog_refresher: MarketplaceCatalogRefresher | None = None
+        self._session_maker: SessionMaker | None = None
 
     @asynccontextmanager
     async def lifespan(self) -> AsyncIterator[None]:
@@ -67,6 +91,9 @@ class AgentsApp:
                 pool_size=settings.database_pool_size,
                 max_overflow=settings.database_max_overflow,
                 pool_recycle=settings.database_pool_recycle,
+                prepared_statement_cache_size=settings.database_prepared_statement_cache_size,
+                pgbouncer=settings.database_pgbouncer,
+                pool_pre_ping=settings.database_pool_pre_ping,
                 echo=settings.debug,
                 otel_enabled=settings.otel_enabled,
                 trace_sql_enabled=settings.otel_trace_sql_enabled,
@@ -74,10 +101,59 @@ class AgentsApp:
             set_db_engine(engine)
             logger.info("Database engine created for LLM cost tracking")
 
-            # Load LLM pricing from database into cache
-            async with engine.connect() as conn:
-                await load_pricing_from_db(conn)
-            logger.info("LLM pricing cache loaded from database")
+            if settings.database_replica_url:
+                self._replica_engine = create_db_engine(
+                    database_url=settings.database_replica_url,
+                    pool_size=settings.database_pool_size,
+                    max_overflow=settings.database_max_overflow,
+                    pool_recycle=settings.database_pool_recycle,
+                    prepared_statement_cache_size=settings.database_prepared_statement_cache_size,
+                    pgbouncer=settings.database_pgbouncer,
+                    pool_pre_ping=settings.database_pool_pre_ping,
+                    echo=settings.debug,
+                    otel_enabled=settings.otel_enabled,
+                    trace_sql_enabled=settings.otel_trace_sql_enabled,
+                    pool_name="replica",
+                )
+                logger.info("Read replica engine created for read-only sessions")
+
+            session_maker = self._session_maker = create_session_maker(
+                engine,
+                replica_engine=self._replica_engine,
+                max_replica_lag_seconds=settings.database_replica_max_lag_seconds,
+                read_your_writes_seconds=settings.database_read_your_writes_seconds,
+            )
+
+            # Load LLM pricing now and keep it fresh in the background
+            self._pricing_reloader = PricingReloader(
+                session_maker,
+                interval=settings.llm_pricing_reload_interval,
+            )
+            await self._pricing_reloader.start()
+
+            if (
+                settings.raw_posts_retention_days is not None
+                or settings.posts_retention_days is not None
+                or settings.orphaned_feed_purge_enabled
+            ):
+                # Batches skip locked rows, so replicas running it concurrently
+                # don't block each other
+                self._retention_job = RetentionJob(
+                    session_maker,
+                    raw_posts_retention_days=settings.raw_posts_retention_days,
+                    posts_retention_days=settings.posts_retention_days,
+                    batch_size=settings.retention_batch_size,
+                    interval=settings.retention_interval,
+                    purge_orphaned_feeds=settings.orphaned_feed_purge_enabled,
+                )
+                await self._retention_job.start()
+
+            if settings.marketplace_catalog_refresh_interval is not None:
+                self._catalog_refresher = MarketplaceCatalogRefresher(
+                    session_maker,
+                    interval=settings.marketplace_catalog_refresh_interval,
+                )
+                await self._catalog_refresher.start()
         else:
             logger.warning(
                 "database_url not configured - LLM cost tracking to database will be disabled"
@@ -88,6 +164,18 @@ class AgentsApp:
 
         # Setup RPC handlers (registers subscribers)
         setup_agent_handlers(self._broker)
+        self._setup_cache_invalidation_subscriber(self._broker)
+        if self._pricing_reloader is not None:
+            self._setup_pricing_subscriber(self._broker, self._pricing_reloader)
+        if settings.digest_rescheduling_enabled and self._session_maker is not None:
+            scheduler = DigestScheduler(
+                self._broker,
+                shaper=DigestScheduleShaper(
+                    slot_minutes=settings.digest_schedule_slot_minutes,
+                    plan_tolerance_minutes=settings.digest_schedule_tolerance_minutes,
+                ),
+            )
+            self._setup_digest_rescheduler(self._broker, scheduler, self._session_maker)
 
         # Pre-configure FastStream loggers BEFORE broker starts
         # This adds placeholder handlers that prevent FastStream from adding its own
@@ -103,6 +191,56 @@ class AgentsApp:
 
         logger.info(f"makefeed-agents started (NATS: {settings.nats_url})")
 
+    @staticmethod
+    def _setup_cache_invalidation_subscriber(broker: NatsBroker) -> None:
+        """Drop reference caches on cache.invalidate (no queue group)."""
+
+        @broker.subscriber(CACHE_INVALIDATE_SUBJECT)
+        async def handle_cache_invalidated(event: CacheInvalidatedEvent) -> None:
+            apply_cache_invalidation(event)
+
+    @staticmethod
+    def _setup_pricing_subscriber(
+        broker: NatsBroker, reloader: PricingReloader
+    ) -> None:
+        """Reload pricing on pricing.updated (no queue group: every replica)."""
+
+        @broker.subscriber(PRICING_UPDATED_SUBJECT)
+        async def handle_pricing_updated(event: PricingUpdatedEvent) -> None:
+            reloader.request_reload(event)
+
+    @staticmethod
+    def _setup_digest_rescheduler(
+        broker: NatsBroker, scheduler: DigestScheduler, session_maker: SessionMaker
+    ) -> None:
+        """Schedule a prompt's next digest when its digest.execute fires.
+
+        A durable pull consumer of its own next to go-processor's, so the
+        replicas share its messages. The DIGESTS stream is declared by
+        go-processor and used as is. A failed publish raises so the message
+        is redelivered; the Nats-Msg-Id is keyed on the run that fired
+        (event.scheduled_at), so repeats that did get through are dropped.
+        """
+
+        @broker.subscriber(
+            DIGEST_EXECUTE_SUBJECT,
+            durable="agents-digest-rescheduler",
+            pull_sub=True,
+            # The stream keeps 30 days of runs; only reschedule new ones
+            deliver_policy=DeliverPolicy.NEW,
+            stream=JStream(DIGEST_STREAM_NAME, declare=False),
+        )
+        async def handle_digest_executed(event: DigestScheduledEvent) -> None:
+            results = await scheduler.schedule_prompts(
+                session_maker,
+                [event.prompt_id],
+                histogram_max_age=settings.digest_schedule_histogram_refresh,
+                replaces={event.prompt_id: event.scheduled_at},
+            )
+            for result in results:
+                if result.error is not None:
+                    raise result.error
+
     async def _shutdown(self) -> None:
         """Cleanup application components."""
         logger.info("Shutting down makefeed-agents service...")
@@ -112,11 +250,22 @@ class AgentsApp:
         if self._broker:
             await self._broker.close()
 
+        if self._pricing_reloader:
+            await self._pricing_reloader.stop()
+
+        if self._retention_job:
+            await self._retention_job.stop()
+
+        if self._catalog_refresher:
+            await self._catalog_refresher.stop()
+
         # Dispose database engine
         engine = get_db_engine()
         if engine:
             await engine.dispose()
             logger.info("Database engine disposed")
+        if self._replica_engine:
+            await self._replica_engine.dispose()
 
         # Cancel any remaining tasks
         pending_tasks = [
@@ -1,5 +1,5 @@
 from agno.agent import Agent
-from agno.db.postgres import PostgresDb
+from agno.db.postgres import AsyncPostgresDb
 from agno.models.openrouter import OpenRouter
 
 from agno_assistant.config import settings
@@ -29,7 +29,13 @@ def create_agent() -> Agent:
         api_key=settings.openrouter_api_key,
     )
 
-    db = PostgresDb(db_url=settings.agno_database_url) if settings.database_url else None
+    # Async DB: arun() loads and saves sessions without blocking the event
+    # loop that serves the other chats
+    db = (
+        AsyncPostgresDb(db_url=settings.agno_database_url)
+        if settings.database_url
+        else None
+    )
 
     return Agent(
         id="infatium-assistant",
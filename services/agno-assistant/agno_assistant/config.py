@@ -6,6 +6,8 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     api_base_url: str = "http://app-api-go:8080"
     internal_service_token: str = ""
+    api_timeout: float = 30.0
+    api_max_connections: int = 50
     openrouter_api_key: str = ""
     llm_model: str = "anthropic/claude-haiku-4.5"
     host: str = "0.0.0.0"
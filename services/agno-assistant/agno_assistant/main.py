@@ -1,15 +1,30 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from agno_assistant.agent import create_agent
 from agno_assistant.config import settings
+from agno_assistant.streaming import stream_chat
+from agno_assistant.tools._http import close_client, open_client
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Infatium Assistant", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    await open_client()
+    try:
+        yield
+    finally:
+        await close_client()
+
+
+app = FastAPI(title="Infatium Assistant", version="0.1.0", lifespan=lifespan)
 
 agent = create_agent()
 
@@ -30,9 +45,11 @@ def healthz():
 
 
 @app.post("/v1/chat")
-def chat(req: ChatRequest):
+async def chat(req: ChatRequest):
+    # Async run: the event loop serves other chats while this one waits on
+    # the LLM or tools, and independent tool calls run concurrently
     session_id = req.session_id or req.user_id
-    response = agent.run(
+    response = await agent.arun(
         req.message,
         user_id=req.user_id,
         session_id=session_id,
@@ -41,6 +58,16 @@ def chat(req: ChatRequest):
     return ChatResponse(content=content)
 
 
+@app.post("/v1/chat/stream")
+async def chat_stream(req: ChatRequest):
+    session_id = req.session_id or req.user_id
+    return StreamingResponse(
+        stream_chat(agent, req.message, req.user_id, session_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 def main():
     logging.basicConfig(
         level=logging.DEBUG if settings.debug else logging.INFO,
@@ -0,0 +1,67 @@
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator
+from typing import Any
+
+from agno.agent import Agent
+from agno.run.agent import RunEvent
+
+logger = logging.getLogger(__name__)
+
+
+def sse(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def stream_chat(
+    agent: Agent, message: str, user_id: str, session_id: str
+) -> AsyncIterator[str]:
+    """Run the agent and yield its progress as Server-Sent Events.
+
+    Events: "token" (content delta), "tool_started" / "tool_completed",
+    "done" (full content) and "error". If the client disconnects, Starlette
+    cancels or closes this generator; the run is then cancelled in agno and
+    the model stream closed, so an abandoned chat stops consuming tokens.
+    """
+    run_id: str | None = None
+    content: list[str] = []
+    stream = agent.arun(
+        message,
+        user_id=user_id,
+        session_id=session_id,
+        stream=True,
+        stream_events=True,
+    )
+    try:
+        async for event in stream:
+            run_id = run_id or getattr(event, "run_id", None)
+            kind = event.event
+            if kind == RunEvent.run_content and event.content:
+                delta = str(event.content)
+                content.append(delta)
+                yield sse("token", {"content": delta})
+            elif kind == RunEvent.tool_call_started and event.tool:
+                yield sse("tool_started", {"tool": event.tool.tool_name})
+            elif kind == RunEvent.tool_call_completed and event.tool:
+                yield sse(
+                    "tool_completed",
+                    {
+                        "tool": event.tool.tool_name,
+                        "error": bool(event.tool.tool_call_error),
+                    },
+                )
+            elif kind == RunEvent.run_error:
+                yield sse("error", {"message": str(event.content or "Run failed")})
+                return
+        yield sse("done", {"content": "".join(content)})
+    except (asyncio.CancelledError, GeneratorExit):
+        logger.info(f"Client disconnected, cancelling run {run_id}")
+        if run_id:
+            agent.cancel_run(run_id)
+        raise
+    except Exception as e:
+        logger.exception("Streaming chat failed")
+        yield sse("error", {"message": str(e)})
+    finally:
+        await stream.aclose()
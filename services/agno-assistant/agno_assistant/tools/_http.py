@@ -2,16 +2,42 @@ import httpx
 
 from agno_assistant.config import settings
 
+# Shared by all tools so calls to app-api-go reuse keep-alive connections;
+# opened and closed by the FastAPI lifespan in main.py
+_client: httpx.AsyncClient | None = None
 
-def api_call(method: str, path: str, user_id: str, **kwargs) -> str:
-    headers = {
-        "Authorization": f"Bearer {settings.internal_service_token}",
-        "X-On-Behalf-Of": user_id,
-        "Content-Type": "application/json",
-    }
-    with httpx.Client(
-        base_url=settings.api_base_url, timeout=30, headers=headers
-    ) as client:
-        resp = client.request(method, path, **kwargs)
-        resp.raise_for_status()
-        return resp.text
+
+async def open_client() -> None:
+    global _client
+    if _client is not None:
+        return
+    _client = httpx.AsyncClient(
+        base_url=settings.api_base_url,
+        timeout=settings.api_timeout,
+        headers={
+            "Authorization": f"Bearer {settings.internal_service_token}",
+            "Content-Type": "application/json",
+        },
+        limits=httpx.Limits(
+            max_connections=settings.api_max_connections,
+            max_keepalive_connections=settings.api_max_connections,
+        ),
+    )
+
+
+async def close_client() -> None:
+    global _client
+    if _client is None:
+        return
+    client, _client = _client, None
+    await client.aclose()
+
+
+async def api_call(method: str, path: str, user_id: str, **kwargs) -> str:
+    if _client is None:
+        raise RuntimeError("API client is not open")
+    resp = await _client.request(
+        method, path, headers={"X-On-Behalf-Of": user_id}, **kwargs
+    )
+    resp.raise_for_status()
+    return resp.text
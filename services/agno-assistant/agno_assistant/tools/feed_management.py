@@ -5,13 +5,13 @@ from agno_assistant.tools._http import api_call
 
 
 @tool
-def list_feeds(run_context: RunContext) -> str:
+async def list_feeds(run_context: RunContext) -> str:
     """List all feeds for the current user. Returns feed names, types, source counts and unread counts."""
-    return api_call("GET", "/internal/feeds", run_context.user_id)
+    return await api_call("GET", "/internal/feeds", run_context.user_id)
 
 
 @tool
-def create_feed(
+async def create_feed(
     run_context: RunContext,
     name: str,
     sources: list[dict],
@@ -36,11 +36,13 @@ def create_feed(
     }
     if filters_raw:
         body["filters_raw"] = filters_raw
-    return api_call("POST", "/internal/feeds/create", run_context.user_id, json=body)
+    return await api_call(
+        "POST", "/internal/feeds/create", run_context.user_id, json=body
+    )
 
 
 @tool
-def update_feed(
+async def update_feed(
     run_context: RunContext,
     feed_id: str,
     name: str | None = None,
@@ -66,19 +68,19 @@ def update_feed(
         body["views_raw"] = views_raw
     if filters_raw is not None:
         body["filters_raw"] = filters_raw
-    return api_call(
+    return await api_call(
         "PATCH", f"/internal/feeds/{feed_id}", run_context.user_id, json=body
     )
 
 
 @tool
-def delete_feed(run_context: RunContext, feed_id: str) -> str:
+async def delete_feed(run_context: RunContext, feed_id: str) -> str:
     """Delete a feed.
 
     Args:
         feed_id: UUID of the feed to delete.
     """
-    return api_call(
+    return await api_call(
         "DELETE",
         "/internal/users_feeds",
         run_context.user_id,
@@ -87,7 +89,7 @@ def delete_feed(run_context: RunContext, feed_id: str) -> str:
 
 
 @tool
-def get_feed_posts(
+async def get_feed_posts(
     run_context: RunContext,
     feed_id: str,
     limit: int = 20,
@@ -100,7 +102,7 @@ def get_feed_posts(
         limit: Max number of posts to return (default 20).
         offset: Pagination offset (default 0).
     """
-    return api_call(
+    return await api_call(
         "GET",
         f"/internal/posts/feed/{feed_id}",
         run_context.user_id,
@@ -109,38 +111,38 @@ def get_feed_posts(
 
 
 @tool
-def read_all_posts(run_context: RunContext, feed_id: str) -> str:
+async def read_all_posts(run_context: RunContext, feed_id: str) -> str:
     """Mark all posts in a feed as read.
 
     Args:
         feed_id: UUID of the feed.
     """
-    return api_call(
+    return await api_call(
         "POST", f"/internal/feeds/read_all/{feed_id}", run_context.user_id
     )
 
 
 @tool
-def summarize_unseen(run_context: RunContext, feed_id: str) -> str:
+async def summarize_unseen(run_context: RunContext, feed_id: str) -> str:
     """Get a summary of unread posts in a feed.
 
     Args:
         feed_id: UUID of the feed.
     """
-    return api_call(
+    return await api_call(
         "POST", f"/internal/feeds/summarize_unseen/{feed_id}", run_context.user_id
     )
 
 
 @tool
-def rename_feed(run_context: RunContext, feed_id: str, name: str) -> str:
+async def rename_feed(run_context: RunContext, feed_id: str, name: str) -> str:
     """Rename a feed.
 
     Args:
         feed_id: UUID of the feed.
         name: New name for the feed.
     """
-    return api_call(
+    return await api_call(
         "POST",
         "/internal/feeds/rename",
         run_context.user_id,
@@ -149,13 +151,13 @@ def rename_feed(run_context: RunContext, feed_id: str, name: str) -> str:
 
 
 @tool
-def generate_title(run_context: RunContext, feed_id: str) -> str:
+async def generate_title(run_context: RunContext, feed_id: str) -> str:
     """Auto-generate a title for a feed based on its sources.
 
     Args:
         feed_id: UUID of the feed.
     """
-    return api_call(
+    return await api_call(
         "POST",
         "/internal/feeds/generate_title",
         run_context.user_id,
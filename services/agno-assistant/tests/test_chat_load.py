@@ -0,0 +1,209 @@
+"""Load test: many chat sessions at once on one worker.
+
+The model (OpenRouter) and app-api-go are replaced by httpx MockTransports
+with fixed latency, so the test measures only how the worker overlaps
+chats: every chat makes two model calls and one tool call. With
+TEST_DATABASE_URL set, chats also load and save their sessions through
+agno's AsyncPostgresDb.
+
+    pytest tests/test_chat_load.py
+"""
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+from agno.db.base import SessionType
+from agno.db.postgres import AsyncPostgresDb
+from agno.models.openrouter import OpenRouter
+
+from agno_assistant import main
+from agno_assistant.config import settings
+from agno_assistant.tools import _http
+
+CHATS = 50
+MODEL_LATENCY = 0.2
+API_LATENCY = 0.2
+# A chat makes two model calls around one tool call, plus a memory
+# extraction call when the agent has a db
+CHAT_LATENCY = 3 * MODEL_LATENCY + API_LATENCY
+# Run one after another, CHATS would take CHATS * CHAT_LATENCY; the rest
+# of the budget is agno's own per-run CPU
+MAX_ELAPSED = 5 * CHAT_LATENCY
+# Chats drift apart on agno CPU and DB round trips, so not all CHATS are
+# inside the same call at once; sequential chats would peak at 1
+MIN_PEAK = CHATS // 5
+
+
+class _Gauge:
+    def __init__(self) -> None:
+        self.current = 0
+        self.peak = 0
+
+    def __enter__(self) -> None:
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+
+    def __exit__(self, *_: object) -> None:
+        self.current -= 1
+
+
+def _completion(message: dict) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": "stub",
+            "choices": [{"index": 0, "message": message, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        },
+    )
+
+
+class _StubOpenRouter(OpenRouter):
+    def __deepcopy__(self, memo: dict) -> "_StubOpenRouter":
+        # agno's MemoryManager runs on a deep copy of the model, which
+        # drops http_client; keep the stub transport on the copy
+        model = super().__deepcopy__(memo)
+        model.http_client = self.http_client
+        return model
+
+
+def _stub_model(gauge: _Gauge) -> OpenRouter:
+    """Calls list_feeds once, then answers with the user's message.
+
+    Memory extraction requests (no list_feeds tool) get a plain answer,
+    so no memories are added.
+    """
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        messages = body["messages"]
+        tools = {tool["function"]["name"] for tool in body.get("tools", [])}
+        with gauge:
+            await asyncio.sleep(MODEL_LATENCY)
+        if "list_feeds" not in tools:
+            return _completion({"role": "assistant", "content": "No memories."})
+        if messages[-1]["role"] != "tool":
+            return _completion(
+                {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": "call_1",
+                            "type": "function",
+                            "function": {"name": "list_feeds", "arguments": "{}"},
+                        }
+                    ],
+                }
+            )
+        question = next(m for m in reversed(messages) if m["role"] == "user")
+        return _completion(
+            {
+                "role": "assistant",
+                "content": f"{question['content']}: {messages[-1]['content']}",
+            }
+        )
+
+    return _StubOpenRouter(
+        id="stub",
+        api_key="test",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handle)),
+    )
+
+
+@pytest.fixture
+async def api_gauge() -> AsyncIterator[_Gauge]:
+    """Stub app-api-go behind the tools' shared client."""
+    gauge = _Gauge()
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        with gauge:
+            await asyncio.sleep(API_LATENCY)
+        return httpx.Response(200, text=f"feeds of {request.headers['X-On-Behalf-Of']}")
+
+    _http._client = httpx.AsyncClient(
+        base_url=settings.api_base_url, transport=httpx.MockTransport(handle)
+    )
+    try:
+        yield gauge
+    finally:
+        await _http.close_client()
+
+
+@pytest.fixture(params=["no_db", "postgres"])
+async def agent_db(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[AsyncPostgresDb | None]:
+    """The agent's session storage: none, or AsyncPostgresDb."""
+    db = None
+    if request.param == "postgres":
+        url = os.environ.get("TEST_DATABASE_URL", "")
+        if not url:
+            pytest.skip("TEST_DATABASE_URL is not set")
+        monkeypatch.setattr(settings, "database_url", url)
+        db = AsyncPostgresDb(db_url=settings.agno_database_url)
+    monkeypatch.setattr(main.agent, "db", db)
+    monkeypatch.setattr(main.agent, "telemetry", False)
+    # Rebuilt on the next run with the stub model and this db
+    monkeypatch.setattr(main.agent, "memory_manager", None)
+    yield db
+    if db is not None:
+        await db.db_engine.dispose()
+
+
+async def test_concurrent_chat_sessions(
+    api_gauge: _Gauge,
+    agent_db: AsyncPostgresDb | None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    model_gauge = _Gauge()
+    monkeypatch.setattr(main.agent, "model", _stub_model(model_gauge))
+
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        # Warm-up: agno and the OpenAI client import and build lazily on
+        # the first run
+        warmup = await client.post(
+            "/v1/chat", json={"message": "hi", "user_id": "warmup"}, timeout=30
+        )
+        assert warmup.status_code == 200, warmup.text
+
+        run = uuid.uuid4().hex
+        started = time.perf_counter()
+        responses = await asyncio.gather(
+            *(
+                client.post(
+                    "/v1/chat",
+                    json={
+                        "message": f"question {i}",
+                        "user_id": f"user-{i}",
+                        "session_id": f"load-{run}-{i}",
+                    },
+                    timeout=30,
+                )
+                for i in range(CHATS)
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+    for i, response in enumerate(responses):
+        assert response.status_code == 200, response.text
+        # Each session got its own question and tool result back
+        assert response.json()["content"] == f"question {i}: feeds of user-{i}"
+    assert elapsed < MAX_ELAPSED, elapsed
+    assert model_gauge.peak >= MIN_PEAK, model_gauge.peak
+    assert api_gauge.peak >= MIN_PEAK, api_gauge.peak
+
+    if agent_db is not None:
+        for i in range(CHATS):
+            session = await agent_db.get_session(f"load-{run}-{i}", SessionType.AGENT)
+            assert session is not None, i
@@ -39,6 +39,7 @@ type App struct {
 	shutdownOTEL         func(context.Context) error
 	wsManager            *websocket.Manager
 	notificationConsumer *websocket.NotificationConsumer
+	postSeenBuffer       *repository.PostSeenBuffer
 }
 
 func New(cfg *config.Config) *App {
@@ -160,6 +161,8 @@ func (a *App) Run(ctx context.Context) error {
 	feedRepo := repository.NewFeedRepository(pool.Pool)
 	postRepo := repository.NewPostRepository(pool.Pool)
 	postSeenRepo := repository.NewPostSeenRepository(pool.Pool)
+	a.postSeenBuffer = repository.NewPostSeenBuffer(postSeenRepo, a.cfg.PostSeenFlushInterval, a.cfg.PostSeenMaxPending)
+	a.postSeenBuffer.Start()
 	userRepo := repository.NewUserRepository(pool.Pool)
 	usersFeedRepo := repository.NewUsersFeedRepository(pool.Pool)
 	subscriptionRepo := repository.NewSubscriptionRepository(pool.Pool)
@@ -184,7 +187,7 @@ func (a *App) Run(ctx context.Context) error {
 		a.cfg.AdminTelegramFeedThreadID, nc,
 	)
 	feedViewHandler := handlers.NewFeedViewHandler(feedRepo, postRepo, rawFeedRepo, marketplaceRepo, agentsClient)
-	postHandler := handlers.NewPostHandler(feedRepo, postRepo, postSeenRepo)
+	postHandler := handlers.NewPostHandler(feedRepo, postRepo, postSeenRepo, a.postSeenBuffer)
 	userHandler := handlers.NewUserHandler(userRepo, adminNotifyClient, a.cfg.AdminTelegramUserThreadID)
 	subscriptionHandler := handlers.NewSubscriptionHandler(subscriptionRepo, usersFeedRepo, ruStoreClient)
 	marketplaceHandler := handlers.NewMarketplaceHandler(marketplaceRepo, validationClient)
@@ -231,7 +234,7 @@ func (a *App) Run(ctx context.Context) error {
 	router.Get("/ws/feeds", wsHandler.HandleFeedNotifications)
 
 	adminMiddleware := middleware.NewAdminMiddleware(userRepo)
-	adminHandler := handlers.NewAdminHandler(suggestionRepo, tagRepo, marketplaceRepo)
+	adminHandler := handlers.NewAdminHandler(suggestionRepo, tagRepo, marketplaceRepo, nc)
 
 	router.Group(func(r chi.Router) {
 		r.Use(func(next http.Handler) http.Handler {
@@ -355,6 +358,10 @@ func (a *App) shutdown() {
 		a.notificationConsumer.Stop()
 	}
 
+	if a.postSeenBuffer != nil {
+		a.postSeenBuffer.Stop(shutdownCtx)
+	}
+
 	if a.redisClient != nil {
 		if err := a.redisClient.Close(); err != nil {
 			log.Error().Err(err).Msg("Redis close error")
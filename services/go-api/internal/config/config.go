@@ -15,6 +15,9 @@ type Config struct {
 	DatabasePoolMin int    `envconfig:"DATABASE_POOL_MIN" default:"5"`
 	DatabasePoolMax int    `envconfig:"DATABASE_POOL_MAX" default:"20"`
 
+	PostSeenFlushInterval time.Duration `envconfig:"POST_SEEN_FLUSH_INTERVAL" default:"500ms"`
+	PostSeenMaxPending    int           `envconfig:"POST_SEEN_MAX_PENDING" default:"10000"`
+
 	NATSURL string `envconfig:"NATS_URL" required:"true"`
 
 	JWTSecret string `envconfig:"JWT_SECRET" required:"true"`
@@ -4,29 +4,56 @@ import (
 	"encoding/json"
 	"errors"
 	"net/http"
+	"time"
 
 	"github.com/go-chi/chi/v5"
 	"github.com/google/uuid"
 	"github.com/jackc/pgx/v5"
 	"github.com/MargoRSq/infatium-mono/services/go-api/repository"
+	"github.com/nats-io/nats.go"
 	"github.com/rs/zerolog/log"
 )
 
+// cacheInvalidateSubject tells the Python services to drop cached reference
+// data (see shared.nats.cache_invalidation).
+const cacheInvalidateSubject = "cache.invalidate"
+
 type AdminHandler struct {
 	suggestionRepo  *repository.SuggestionRepository
 	tagRepo         *repository.TagRepository
 	marketplaceRepo *repository.MarketplaceRepository
+	nc              *nats.Conn
 }
 
 func NewAdminHandler(
 	suggestionRepo *repository.SuggestionRepository,
 	tagRepo *repository.TagRepository,
 	marketplaceRepo *repository.MarketplaceRepository,
+	nc *nats.Conn,
 ) *AdminHandler {
 	return &AdminHandler{
 		suggestionRepo:  suggestionRepo,
 		tagRepo:         tagRepo,
 		marketplaceRepo: marketplaceRepo,
+		nc:              nc,
+	}
+}
+
+// invalidateCaches publishes cache.invalidate for each named cache.
+func (h *AdminHandler) invalidateCaches(caches ...string) {
+	if h.nc == nil {
+		return
+	}
+	for _, cache := range caches {
+		data, _ := json.Marshal(map[string]interface{}{
+			"event_type": "cache.invalidated",
+			"timestamp":  time.Now().UTC().Format(time.RFC3339Nano),
+			"cache":      cache,
+			"key":        nil,
+		})
+		if err := h.nc.Publish(cacheInvalidateSubject, data); err != nil {
+			log.Warn().Err(err).Str("cache", cache).Msg("Failed to publish cache.invalidate")
+		}
 	}
 }
 
@@ -133,6 +160,8 @@ func (h *AdminHandler) CreateSuggestion(w http.ResponseWriter, r *http.Request)
 		return
 	}
 
+	h.invalidateCaches("suggestions")
+
 	writeJSON(w, http.StatusCreated, AdminSuggestionResponse{
 		ID:         s.ID.String(),
 		Name:       SuggestionNameResponse{En: s.Name.En, Ru: s.Name.Ru},
@@ -170,6 +199,8 @@ func (h *AdminHandler) UpdateSuggestion(w http.ResponseWriter, r *http.Request)
 		return
 	}
 
+	h.invalidateCaches("suggestions")
+
 	writeJSON(w, http.StatusOK, AdminSuggestionResponse{
 		ID:         s.ID.String(),
 		Name:       SuggestionNameResponse{En: s.Name.En, Ru: s.Name.Ru},
@@ -195,6 +226,8 @@ func (h *AdminHandler) DeleteSuggestion(w http.ResponseWriter, r *http.Request)
 		return
 	}
 
+	h.invalidateCaches("suggestions")
+
 	w.WriteHeader(http.StatusNoContent)
 }
 
@@ -249,6 +282,8 @@ func (h *AdminHandler) CreateTag(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
+	h.invalidateCaches("tags", "prompt_examples")
+
 	writeJSON(w, http.StatusCreated, TagResponse{
 		ID:   t.ID.String(),
 		Name: t.Name,
@@ -280,6 +315,8 @@ func (h *AdminHandler) UpdateTag(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
+	h.invalidateCaches("tags", "prompt_examples")
+
 	writeJSON(w, http.StatusOK, TagResponse{
 		ID:   t.ID.String(),
 		Name: t.Name,
@@ -304,6 +341,8 @@ func (h *AdminHandler) DeleteTag(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
+	h.invalidateCaches("tags", "prompt_examples")
+
 	w.WriteHeader(http.StatusNoContent)
 }
 
@@ -17,17 +17,20 @@ type PostHandler struct {
 	feedRepo     *repository.FeedRepository
 	postRepo     *repository.PostRepository
 	postSeenRepo *repository.PostSeenRepository
+	seenBuffer   *repository.PostSeenBuffer
 }
 
 func NewPostHandler(
 	feedRepo *repository.FeedRepository,
 	postRepo *repository.PostRepository,
 	postSeenRepo *repository.PostSeenRepository,
+	seenBuffer *repository.PostSeenBuffer,
 ) *PostHandler {
 	return &PostHandler{
 		feedRepo:     feedRepo,
 		postRepo:     postRepo,
 		postSeenRepo: postSeenRepo,
+		seenBuffer:   seenBuffer,
 	}
 }
 
@@ -58,7 +61,7 @@ func (h *PostHandler) MarkSeen(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	if err := h.postSeenRepo.MarkSeen(r.Context(), userID, req.PostIDs); err != nil {
+	if err := h.seenBuffer.Mark(r.Context(), userID, req.PostIDs); err != nil {
 		log.Error().Err(err).Msg("Failed to mark posts seen")
 		http.Error(w, "internal error", http.StatusInternalServerError)
 		return
@@ -194,7 +194,7 @@ func TestEmptyIfNil(t *testing.T) {
 }
 
 func TestPostHandler_Routes(t *testing.T) {
-	handler := NewPostHandler(nil, nil, nil)
+	handler := NewPostHandler(nil, nil, nil, nil)
 	router := handler.Routes()
 
 	if router == nil {
@@ -203,7 +203,7 @@ func TestPostHandler_Routes(t *testing.T) {
 }
 
 func TestPostHandler_MarkSeen_Unauthorized(t *testing.T) {
-	handler := NewPostHandler(nil, nil, nil)
+	handler := NewPostHandler(nil, nil, nil, nil)
 
 	req := newTestRequest(t, http.MethodPost, "/posts/seen", map[string]interface{}{
 		"post_ids": []string{uuid.New().String()},
@@ -216,7 +216,7 @@ func TestPostHandler_MarkSeen_Unauthorized(t *testing.T) {
 }
 
 func TestPostHandler_MarkSeen_InvalidBody(t *testing.T) {
-	handler := NewPostHandler(nil, nil, nil)
+	handler := NewPostHandler(nil, nil, nil, nil)
 	userID := uuid.New()
 
 	req := newAuthenticatedRequest(t, http.MethodPost, "/posts/seen", "invalid json", userID)
@@ -228,7 +228,7 @@ func TestPostHandler_MarkSeen_InvalidBody(t *testing.T) {
 }
 
 func TestPostHandler_GetPost_Unauthorized(t *testing.T) {
-	handler := NewPostHandler(nil, nil, nil)
+	handler := NewPostHandler(nil, nil, nil, nil)
 
 	req := newTestRequest(t, http.MethodGet, "/posts/"+uuid.New().String(), nil)
 	req = withURLParam(req, "post_id", uuid.New().String())
@@ -240,7 +240,7 @@ func TestPostHandler_GetPost_Unauthorized(t *testing.T) {
 }
 
 func TestPostHandler_GetPost_InvalidPostID(t *testing.T) {
-	handler := NewPostHandler(nil, nil, nil)
+	handler := NewPostHandler(nil, nil, nil, nil)
 	userID := uuid.New()
 
 	req := newAuthenticatedRequest(t, http.MethodGet, "/posts/invalid", nil, userID)
@@ -253,7 +253,7 @@ func TestPostHandler_GetPost_InvalidPostID(t *testing.T) {
 }
 
 func TestPostHandler_GetFeedPosts_Unauthorized(t *testing.T) {
-	handler := NewPostHandler(nil, nil, nil)
+	handler := NewPostHandler(nil, nil, nil, nil)
 
 	req := newTestRequest(t, http.MethodGet, "/posts/feed/"+uuid.New().String(), nil)
 	req = withURLParam(req, "feed_id", uuid.New().String())
@@ -265,7 +265,7 @@ func TestPostHandler_GetFeedPosts_Unauthorized(t *testing.T) {
 }
 
 func TestPostHandler_GetFeedPosts_InvalidFeedID(t *testing.T) {
-	handler := NewPostHandler(nil, nil, nil)
+	handler := NewPostHandler(nil, nil, nil, nil)
 	userID := uuid.New()
 
 	req := newAuthenticatedRequest(t, http.MethodGet, "/posts/feed/invalid", nil, userID)
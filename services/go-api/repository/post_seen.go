@@ -35,6 +35,27 @@ func (r *PostSeenRepository) MarkSeen(ctx context.Context, userID uuid.UUID, pos
 	return err
 }
 
+// MarkSeenPairs marks userIDs[i] as having seen postIDs[i] in one statement.
+// Pairs must be unique; pairs whose post no longer exists are skipped.
+func (r *PostSeenRepository) MarkSeenPairs(ctx context.Context, userIDs, postIDs []uuid.UUID) (int64, error) {
+	if len(postIDs) == 0 {
+		return 0, nil
+	}
+
+	query := `
+		INSERT INTO posts_seen (user_id, post_id, seen)
+		SELECT m.user_id, m.post_id, true
+		FROM unnest($1::uuid[], $2::uuid[]) AS m(user_id, post_id)
+		JOIN posts p ON p.id = m.post_id
+		ON CONFLICT (user_id, post_id) DO UPDATE SET seen = true`
+
+	result, err := r.pool.Exec(ctx, query, userIDs, postIDs)
+	if err != nil {
+		return 0, err
+	}
+	return result.RowsAffected(), nil
+}
+
 func (r *PostSeenRepository) MarkAllSeenInFeed(ctx context.Context, userID, feedID uuid.UUID) (int, error) {
 	query := `
 		INSERT INTO posts_seen (user_id, post_id, seen)
@@ -0,0 +1,187 @@
+package repository
+
+import (
+	"context"
+	"sync"
+	"time"
+
+	"github.com/google/uuid"
+	"github.com/rs/zerolog/log"
+)
+
+// postSeenFlushTimeout bounds one periodic flush.
+const postSeenFlushTimeout = 10 * time.Second
+
+// SeenPairsWriter writes (user, post) seen marks; PostSeenRepository implements it.
+type SeenPairsWriter interface {
+	MarkSeenPairs(ctx context.Context, userIDs, postIDs []uuid.UUID) (int64, error)
+}
+
+// PostSeenBuffer coalesces mark-as-seen requests and writes them in batches.
+//
+// Clients send many small, overlapping batches while scrolling. Marks are
+// merged per user (duplicate post ids collapse) and written every flush
+// interval with one MarkSeenPairs statement.
+//
+// The buffer is bounded: when a batch would push it past maxPending marks,
+// Mark flushes in the caller's goroutine before accepting the batch, so
+// callers are slowed down instead of marks being dropped. If that flush
+// fails, Mark returns the error and does not take the batch. Marks of a
+// failed flush are kept and retried on the next one.
+type PostSeenBuffer struct {
+	writer        SeenPairsWriter
+	flushInterval time.Duration
+	maxPending    int
+
+	mu           sync.Mutex
+	pending      map[uuid.UUID]map[uuid.UUID]struct{}
+	pendingCount int
+
+	flushMu sync.Mutex
+	stop    chan struct{}
+	done    chan struct{}
+}
+
+func NewPostSeenBuffer(writer SeenPairsWriter, flushInterval time.Duration, maxPending int) *PostSeenBuffer {
+	return &PostSeenBuffer{
+		writer:        writer,
+		flushInterval: flushInterval,
+		maxPending:    maxPending,
+		pending:       make(map[uuid.UUID]map[uuid.UUID]struct{}),
+	}
+}
+
+// Start runs the periodic flush until Stop is called.
+func (b *PostSeenBuffer) Start() {
+	if b.stop != nil {
+		return
+	}
+	b.stop = make(chan struct{})
+	b.done = make(chan struct{})
+	go b.run()
+
+	log.Info().
+		Dur("interval", b.flushInterval).
+		Int("max_pending", b.maxPending).
+		Msg("Post seen buffer started")
+}
+
+// Stop ends the periodic flush and writes all pending marks.
+func (b *PostSeenBuffer) Stop(ctx context.Context) {
+	if b.stop != nil {
+		close(b.stop)
+		<-b.done
+		b.stop = nil
+	}
+
+	if _, err := b.Flush(ctx); err != nil {
+		log.Error().Err(err).Int("pending", b.PendingCount()).Msg("Final post seen flush failed")
+	}
+}
+
+// PendingCount returns the number of marks waiting to be written.
+func (b *PostSeenBuffer) PendingCount() int {
+	b.mu.Lock()
+	defer b.mu.Unlock()
+	return b.pendingCount
+}
+
+// Mark queues postIDs to be marked as seen by userID.
+func (b *PostSeenBuffer) Mark(ctx context.Context, userID uuid.UUID, postIDs []uuid.UUID) error {
+	if len(postIDs) == 0 {
+		return nil
+	}
+
+	b.mu.Lock()
+	if b.pendingCount+len(postIDs) <= b.maxPending {
+		b.merge(userID, postIDs)
+		b.mu.Unlock()
+		return nil
+	}
+	b.mu.Unlock()
+
+	if _, err := b.Flush(ctx); err != nil {
+		return err
+	}
+
+	b.mu.Lock()
+	b.merge(userID, postIDs)
+	b.mu.Unlock()
+	return nil
+}
+
+// Flush writes all pending marks and returns the number of rows written.
+func (b *PostSeenBuffer) Flush(ctx context.Context) (int64, error) {
+	b.flushMu.Lock()
+	defer b.flushMu.Unlock()
+
+	b.mu.Lock()
+	pending := b.pending
+	b.pending = make(map[uuid.UUID]map[uuid.UUID]struct{})
+	b.pendingCount = 0
+	b.mu.Unlock()
+
+	if len(pending) == 0 {
+		return 0, nil
+	}
+
+	var userIDs, postIDs []uuid.UUID
+	for userID, posts := range pending {
+		for postID := range posts {
+			userIDs = append(userIDs, userID)
+			postIDs = append(postIDs, postID)
+		}
+	}
+
+	written, err := b.writer.MarkSeenPairs(ctx, userIDs, postIDs)
+	if err != nil {
+		b.mu.Lock()
+		for i := range userIDs {
+			b.merge(userIDs[i], postIDs[i:i+1])
+		}
+		b.mu.Unlock()
+		return 0, err
+	}
+
+	log.Debug().
+		Int("marks", len(postIDs)).
+		Int("users", len(pending)).
+		Int64("written", written).
+		Msg("Flushed post seen marks")
+	return written, nil
+}
+
+// merge adds marks to the pending set; b.mu must be held.
+func (b *PostSeenBuffer) merge(userID uuid.UUID, postIDs []uuid.UUID) {
+	posts, ok := b.pending[userID]
+	if !ok {
+		posts = make(map[uuid.UUID]struct{}, len(postIDs))
+		b.pending[userID] = posts
+	}
+	for _, postID := range postIDs {
+		if _, seen := posts[postID]; !seen {
+			posts[postID] = struct{}{}
+			b.pendingCount++
+		}
+	}
+}
+
+func (b *PostSeenBuffer) run() {
+	defer close(b.done)
+
+	ticker := time.NewTicker(b.flushInterval)
+	defer ticker.Stop()
+
+	for {
+		select {
+		case <-b.stop:
+			return
+		case <-ticker.C:
+			ctx, cancel := context.WithTimeout(context.Background(), postSeenFlushTimeout)
+			if _, err := b.Flush(ctx); err != nil {
+				log.Error().Err(err).Int("pending", b.PendingCount()).Msg("Post seen flush failed")
+			}
+			cancel()
+		}
+	}
+}
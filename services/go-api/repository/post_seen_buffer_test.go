@@ -0,0 +1,110 @@
+package repository
+
+import (
+	"context"
+	"errors"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/google/uuid"
+)
+
+type fakeSeenWriter struct {
+	mu    sync.Mutex
+	err   error
+	calls int
+	pairs map[[2]uuid.UUID]int
+}
+
+func newFakeSeenWriter() *fakeSeenWriter {
+	return &fakeSeenWriter{pairs: make(map[[2]uuid.UUID]int)}
+}
+
+func (w *fakeSeenWriter) MarkSeenPairs(_ context.Context, userIDs, postIDs []uuid.UUID) (int64, error) {
+	w.mu.Lock()
+	defer w.mu.Unlock()
+	w.calls++
+	if w.err != nil {
+		return 0, w.err
+	}
+	for i := range userIDs {
+		w.pairs[[2]uuid.UUID{userIDs[i], postIDs[i]}]++
+	}
+	return int64(len(userIDs)), nil
+}
+
+func TestPostSeenBuffer_CoalescesDuplicates(t *testing.T) {
+	writer := newFakeSeenWriter()
+	buffer := NewPostSeenBuffer(writer, time.Hour, 100)
+	userID, postA, postB := uuid.New(), uuid.New(), uuid.New()
+
+	ctx := context.Background()
+	if err := buffer.Mark(ctx, userID, []uuid.UUID{postA, postB}); err != nil {
+		t.Fatalf("Mark() error = %v", err)
+	}
+	if err := buffer.Mark(ctx, userID, []uuid.UUID{postB, postA}); err != nil {
+		t.Fatalf("Mark() error = %v", err)
+	}
+	if got := buffer.PendingCount(); got != 2 {
+		t.Errorf("PendingCount() = %d, want 2", got)
+	}
+
+	written, err := buffer.Flush(ctx)
+	if err != nil {
+		t.Fatalf("Flush() error = %v", err)
+	}
+	if written != 2 || writer.calls != 1 {
+		t.Errorf("Flush() wrote %d rows in %d calls, want 2 in 1", written, writer.calls)
+	}
+}
+
+func TestPostSeenBuffer_FullBufferFlushesInline(t *testing.T) {
+	writer := newFakeSeenWriter()
+	buffer := NewPostSeenBuffer(writer, time.Hour, 3)
+	userID := uuid.New()
+
+	ctx := context.Background()
+	first := []uuid.UUID{uuid.New(), uuid.New(), uuid.New()}
+	second := []uuid.UUID{uuid.New(), uuid.New()}
+	if err := buffer.Mark(ctx, userID, first); err != nil {
+		t.Fatalf("Mark() error = %v", err)
+	}
+	if err := buffer.Mark(ctx, userID, second); err != nil {
+		t.Fatalf("Mark() error = %v", err)
+	}
+
+	if writer.calls != 1 || len(writer.pairs) != 3 {
+		t.Errorf("writer got %d calls / %d pairs, want 1 / 3", writer.calls, len(writer.pairs))
+	}
+	if got := buffer.PendingCount(); got != 2 {
+		t.Errorf("PendingCount() = %d, want 2", got)
+	}
+}
+
+func TestPostSeenBuffer_FailedFlushKeepsMarks(t *testing.T) {
+	writer := newFakeSeenWriter()
+	writer.err = errors.New("database down")
+	buffer := NewPostSeenBuffer(writer, time.Hour, 2)
+	userID := uuid.New()
+
+	ctx := context.Background()
+	kept := []uuid.UUID{uuid.New(), uuid.New()}
+	if err := buffer.Mark(ctx, userID, kept); err != nil {
+		t.Fatalf("Mark() error = %v", err)
+	}
+	if err := buffer.Mark(ctx, userID, []uuid.UUID{uuid.New()}); err == nil {
+		t.Fatal("Mark() on a full buffer with a failing writer should return an error")
+	}
+	if got := buffer.PendingCount(); got != 2 {
+		t.Errorf("PendingCount() = %d, want 2 (failed flush re-queued)", got)
+	}
+
+	writer.err = nil
+	buffer.Stop(ctx)
+	for _, postID := range kept {
+		if writer.pairs[[2]uuid.UUID{userID, postID}] != 1 {
+			t.Errorf("post %s was not written after the writer recovered", postID)
+		}
+	}
+}
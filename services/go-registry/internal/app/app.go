@@ -17,6 +17,7 @@ import (
 	"github.com/MargoRSq/infatium-mono/services/go-registry/pkg/db"
 	"github.com/MargoRSq/infatium-mono/services/go-registry/pkg/observability"
 	"github.com/MargoRSq/infatium-mono/services/go-registry/repository"
+	"github.com/nats-io/nats.go"
 	"github.com/rs/zerolog/log"
 )
 
@@ -24,6 +25,7 @@ type App struct {
 	cfg *config.Config
 
 	dbPool         *db.Pool
+	natsConn       *nats.Conn
 	llmSyncService *services.LLMSyncService
 	httpServer     *http.Server
 	shutdownOTEL   func(context.Context) error
@@ -84,6 +86,19 @@ func (a *App) Run(ctx context.Context) error {
 	}
 	a.dbPool = pool
 
+	// Connect to NATS; without it prices still reach the agents on their poll
+	var pricingPublisher services.Publisher
+	if a.cfg.NATSURL != "" {
+		nc, err := nats.Connect(a.cfg.NATSURL)
+		if err != nil {
+			log.Warn().Err(err).Msg("Failed to connect to NATS, pricing.updated disabled")
+		} else {
+			a.natsConn = nc
+			pricingPublisher = nc
+			log.Info().Str("url", a.cfg.NATSURL).Msg("Connected to NATS")
+		}
+	}
+
 	// Create clients
 	openRouterClient := clients.NewOpenRouterClient(a.cfg.OpenRouterAPIKey)
 	telegramClient := clients.NewTelegramClient(
@@ -101,6 +116,7 @@ func (a *App) Run(ctx context.Context) error {
 		openRouterClient,
 		telegramClient,
 		llmModelsRepo,
+		pricingPublisher,
 	)
 
 	// Start HTTP server for health checks
@@ -189,6 +205,12 @@ func (a *App) shutdown() {
 		}
 	}
 
+	if a.natsConn != nil {
+		if err := a.natsConn.Drain(); err != nil {
+			log.Error().Err(err).Msg("NATS drain error")
+		}
+	}
+
 	if a.dbPool != nil {
 		a.dbPool.Close()
 	}
@@ -78,8 +78,18 @@ func NewOpenRouterClient(apiKey string) *OpenRouterClient {
 	}
 }
 
-// FetchModels retrieves all models from OpenRouter API
-func (c *OpenRouterClient) FetchModels(ctx context.Context) ([]ParsedModel, error) {
+// FetchResult is the outcome of a conditional models request
+type FetchResult struct {
+	Models       []ParsedModel // nil when NotModified
+	NotModified  bool
+	ETag         string
+	LastModified string
+}
+
+// FetchModelsIfChanged retrieves all models unless they are unchanged since
+// the response that returned etag / lastModified. Servers that ignore the
+// conditional headers just return the full catalog.
+func (c *OpenRouterClient) FetchModelsIfChanged(ctx context.Context, etag, lastModified string) (*FetchResult, error) {
 	req, err := http.NewRequestWithContext(ctx, http.MethodGet, c.baseURL, nil)
 	if err != nil {
 		return nil, fmt.Errorf("create request: %w", err)
@@ -89,6 +99,12 @@ func (c *OpenRouterClient) FetchModels(ctx context.Context) ([]ParsedModel, erro
 		req.Header.Set("Authorization", "Bearer "+c.apiKey)
 	}
 	req.Header.Set("Accept", "application/json")
+	if etag != "" {
+		req.Header.Set("If-None-Match", etag)
+	}
+	if lastModified != "" {
+		req.Header.Set("If-Modified-Since", lastModified)
+	}
 
 	resp, err := c.client.Do(req)
 	if err != nil {
@@ -96,6 +112,15 @@ func (c *OpenRouterClient) FetchModels(ctx context.Context) ([]ParsedModel, erro
 	}
 	defer resp.Body.Close()
 
+	if resp.StatusCode == http.StatusNotModified {
+		log.Info().Msg("OpenRouter models unchanged (304 Not Modified)")
+		return &FetchResult{
+			NotModified:  true,
+			ETag:         headerOr(resp.Header, "ETag", etag),
+			LastModified: headerOr(resp.Header, "Last-Modified", lastModified),
+		}, nil
+	}
+
 	if resp.StatusCode != http.StatusOK {
 		return nil, fmt.Errorf("unexpected status: %d", resp.StatusCode)
 	}
@@ -116,7 +141,18 @@ func (c *OpenRouterClient) FetchModels(ctx context.Context) ([]ParsedModel, erro
 	}
 
 	log.Info().Int("count", len(models)).Msg("Fetched models from OpenRouter")
-	return models, nil
+	return &FetchResult{
+		Models:       models,
+		ETag:         resp.Header.Get("ETag"),
+		LastModified: resp.Header.Get("Last-Modified"),
+	}, nil
+}
+
+func headerOr(h http.Header, key, fallback string) string {
+	if v := h.Get(key); v != "" {
+		return v
+	}
+	return fallback
 }
 
 // ParseModel converts API model to internal representation
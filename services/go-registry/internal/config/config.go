@@ -12,6 +12,10 @@ type Config struct {
 	DatabasePoolMin int    `envconfig:"DATABASE_POOL_MIN" default:"2"`
 	DatabasePoolMax int    `envconfig:"DATABASE_POOL_MAX" default:"5"`
 
+	// NATS (optional): pricing.updated is published after each sync that
+	// changed prices; without it the agents only pick changes up on their poll
+	NATSURL string `envconfig:"NATS_URL" default:""`
+
 	// OpenRouter API
 	OpenRouterAPIKey string `envconfig:"OPENROUTER_API_KEY"`
 
@@ -5,7 +5,6 @@ import (
 	"math"
 	"time"
 
-	"github.com/google/uuid"
 	"github.com/MargoRSq/infatium-mono/services/go-registry/internal/clients"
 	"github.com/MargoRSq/infatium-mono/services/go-registry/internal/config"
 	"github.com/MargoRSq/infatium-mono/services/go-registry/repository"
@@ -15,12 +14,24 @@ import (
 
 const MinPriceChangePercent = 0.001
 
-// LLMSyncService syncs LLM models from OpenRouter API
+// priceScale is the scale of the llm_models price columns (NUMERIC(20, 12))
+const priceScale = 12
+
+// LLMSyncService syncs LLM models from OpenRouter API.
+//
+// Each sync asks OpenRouter for the catalog with the validators of the last
+// successful sync and stops on 304 Not Modified. Otherwise it reads all
+// llm_models rows with one query, diffs them against the catalog in memory
+// and writes new models, changed models and price history with one
+// statement each, in one transaction. Unchanged models are not written.
 type LLMSyncService struct {
 	cfg            *config.Config
 	openRouter     *clients.OpenRouterClient
 	telegram       *clients.TelegramClient
 	repo           *repository.LLMModelsRepository
+	publisher      Publisher
+	etag           string
+	lastModified   string
 	running        bool
 	stopCh         chan struct{}
 }
@@ -30,12 +41,14 @@ func NewLLMSyncService(
 	openRouter *clients.OpenRouterClient,
 	telegram *clients.TelegramClient,
 	repo *repository.LLMModelsRepository,
+	publisher Publisher,
 ) *LLMSyncService {
 	return &LLMSyncService{
 		cfg:        cfg,
 		openRouter: openRouter,
 		telegram:   telegram,
 		repo:       repo,
+		publisher:  publisher,
 		stopCh:     make(chan struct{}),
 	}
 }
@@ -94,69 +107,48 @@ func (s *LLMSyncService) Sync(ctx context.Context) error {
 	start := time.Now()
 
 	// Fetch models from API
-	apiModels, err := s.openRouter.FetchModels(ctx)
+	fetched, err := s.openRouter.FetchModelsIfChanged(ctx, s.etag, s.lastModified)
 	if err != nil {
 		return err
 	}
+	if fetched.NotModified {
+		s.etag, s.lastModified = fetched.ETag, fetched.LastModified
+		return nil
+	}
 
-	// Get existing model IDs
-	existingIDs, err := s.repo.GetAllModelIDs(ctx)
+	existing, err := s.repo.GetModelsForSync(ctx)
 	if err != nil {
 		return err
 	}
 
-	var newModels []clients.ParsedModel
-	var priceChanges []clients.PriceChange
-
-	for _, model := range apiModels {
-		if _, exists := existingIDs[model.ModelID]; exists {
-			// Check for price changes
-			change, err := s.checkAndUpdatePrices(ctx, model)
-			if err != nil {
-				log.Warn().Err(err).Str("model_id", model.ModelID).Msg("Failed to check prices")
-				continue
-			}
-			if change != nil {
-				priceChanges = append(priceChanges, *change)
-			}
-		} else {
-			// Insert new model
-			dbModel := &repository.LLMModel{
-				ID:              uuid.New(),
-				ModelID:         model.ModelID,
-				Name:            model.Name,
-				ContextLength:   model.ContextLen,
-				PricePrompt:     model.PricePrompt,
-				PriceCompletion: model.PriceCompletion,
-				ModelCreatedAt:  model.ModelCreatedAt,
-				CreatedAt:       time.Now(),
-			}
-			if err := s.repo.InsertModel(ctx, dbModel); err != nil {
-				log.Warn().Err(err).Str("model_id", model.ModelID).Msg("Failed to insert model")
-				continue
-			}
-			newModels = append(newModels, model)
-			log.Debug().Str("model_id", model.ModelID).Msg("Inserted new model")
-		}
+	plan := planModelSync(existing, fetched.Models)
+	if err := s.repo.SaveSyncChanges(ctx, plan.inserts, plan.updates, plan.history); err != nil {
+		return err
 	}
+	// Only remember the validators once the catalog is stored
+	s.etag, s.lastModified = fetched.ETag, fetched.LastModified
 
 	duration := time.Since(start)
 	log.Info().
-		Int("new_models", len(newModels)).
-		Int("price_changes", len(priceChanges)).
-		Int("total_synced", len(apiModels)).
+		Int("new_models", len(plan.inserts)).
+		Int("updated_models", len(plan.updates)).
+		Int("price_changes", len(plan.history)).
+		Int("unchanged", len(fetched.Models)-len(plan.inserts)-len(plan.updates)).
+		Int("total_synced", len(fetched.Models)).
 		Dur("duration", duration).
 		Msg("LLM models sync complete")
 
+	s.publishPricingUpdated(plan.repricedIDs(), plan.newModels)
+
 	// Send notifications
-	if len(newModels) > 0 {
-		if err := s.telegram.NotifyNewModels(ctx, newModels); err != nil {
+	if len(plan.newModels) > 0 {
+		if err := s.telegram.NotifyNewModels(ctx, plan.newModels); err != nil {
 			log.Error().Err(err).Msg("Failed to send new models notification")
 		}
 	}
 
-	if len(priceChanges) > 0 {
-		if err := s.telegram.NotifyPriceChanges(ctx, priceChanges); err != nil {
+	if len(plan.priceChanges) > 0 {
+		if err := s.telegram.NotifyPriceChanges(ctx, plan.priceChanges); err != nil {
 			log.Error().Err(err).Msg("Failed to send price changes notification")
 		}
 	}
@@ -164,38 +156,111 @@ func (s *LLMSyncService) Sync(ctx context.Context) error {
 	return nil
 }
 
-func (s *LLMSyncService) checkAndUpdatePrices(ctx context.Context, model clients.ParsedModel) (*clients.PriceChange, error) {
-	existing, err := s.repo.GetModelByID(ctx, model.ModelID)
-	if err != nil || existing == nil {
-		return nil, err
+// publishPricingUpdated lets the agents reload pricing now instead of on
+// their next periodic reload. Without a publisher only the poll applies.
+func (s *LLMSyncService) publishPricingUpdated(repricedIDs []string, newModels []clients.ParsedModel) {
+	if s.publisher == nil || (len(repricedIDs) == 0 && len(newModels) == 0) {
+		return
+	}
+	addedIDs := make([]string, len(newModels))
+	for i, model := range newModels {
+		addedIDs[i] = model.ModelID
+	}
+	if err := publishPricingUpdated(s.publisher, repricedIDs, addedIDs); err != nil {
+		log.Warn().Err(err).Msg("Failed to publish pricing update")
 	}
+}
 
-	promptChanged := !existing.PricePrompt.Equal(model.PricePrompt)
-	completionChanged := !existing.PriceCompletion.Equal(model.PriceCompletion)
+// modelSyncPlan is what one sync writes and reports
+type modelSyncPlan struct {
+	inserts      []*repository.LLMModel
+	updates      []*repository.LLMModel
+	history      []repository.PriceHistoryEntry
+	newModels    []clients.ParsedModel
+	priceChanges []clients.PriceChange // only changes worth notifying about
+}
 
-	if !promptChanged && !completionChanged {
-		// Just update last_synced_at
-		return nil, s.repo.UpdateLastSyncedAt(ctx, model.ModelID)
+func (p *modelSyncPlan) repricedIDs() []string {
+	ids := make([]string, len(p.history))
+	for i, h := range p.history {
+		ids[i] = h.ModelID
 	}
+	return ids
+}
 
-	// Calculate percent changes
-	percentPrompt := calcPercentChange(existing.PricePrompt, model.PricePrompt)
-	percentCompletion := calcPercentChange(existing.PriceCompletion, model.PriceCompletion)
+// planModelSync diffs the fetched catalog against the stored models.
+// Prices are rounded to the column scale first, so a model whose prices only
+// differ beyond what the database stores counts as unchanged.
+func planModelSync(existing map[string]*repository.LLMModel, models []clients.ParsedModel) *modelSyncPlan {
+	plan := &modelSyncPlan{}
+	seen := make(map[string]struct{}, len(models))
 
-	// Update prices in DB
-	if err := s.repo.UpdateModelPrices(
-		ctx,
-		existing.ID,
-		model.ModelID,
-		existing.PricePrompt,
-		existing.PriceCompletion,
-		model.PricePrompt,
-		model.PriceCompletion,
-	); err != nil {
-		return nil, err
+	for _, model := range models {
+		if _, dup := seen[model.ModelID]; dup || model.ModelID == "" {
+			continue
+		}
+		seen[model.ModelID] = struct{}{}
+
+		model.PricePrompt = model.PricePrompt.Round(priceScale)
+		model.PriceCompletion = model.PriceCompletion.Round(priceScale)
+
+		current, ok := existing[model.ModelID]
+		if !ok {
+			plan.inserts = append(plan.inserts, &repository.LLMModel{
+				ModelID:         model.ModelID,
+				Name:            model.Name,
+				ContextLength:   model.ContextLen,
+				PricePrompt:     model.PricePrompt,
+				PriceCompletion: model.PriceCompletion,
+				ModelCreatedAt:  model.ModelCreatedAt,
+			})
+			plan.newModels = append(plan.newModels, model)
+			continue
+		}
+
+		pricesChanged := !current.PricePrompt.Equal(model.PricePrompt) ||
+			!current.PriceCompletion.Equal(model.PriceCompletion)
+		if !pricesChanged &&
+			current.Name == model.Name &&
+			current.ContextLength == model.ContextLen &&
+			equalInt64Ptr(current.ModelCreatedAt, model.ModelCreatedAt) {
+			continue
+		}
+
+		plan.updates = append(plan.updates, &repository.LLMModel{
+			ID:              current.ID,
+			ModelID:         model.ModelID,
+			Name:            model.Name,
+			ContextLength:   model.ContextLen,
+			PricePrompt:     model.PricePrompt,
+			PriceCompletion: model.PriceCompletion,
+			ModelCreatedAt:  model.ModelCreatedAt,
+		})
+		if !pricesChanged {
+			continue
+		}
+
+		plan.history = append(plan.history, repository.PriceHistoryEntry{
+			LLMModelID:          current.ID,
+			ModelID:             model.ModelID,
+			PrevPricePrompt:     current.PricePrompt,
+			PrevPriceCompletion: current.PriceCompletion,
+			NewPricePrompt:      model.PricePrompt,
+			NewPriceCompletion:  model.PriceCompletion,
+		})
+		if change := notableChange(current, model); change != nil {
+			plan.priceChanges = append(plan.priceChanges, *change)
+		}
 	}
 
-	// Check if change is significant enough to notify
+	return plan
+}
+
+// notableChange returns the change if it is large enough to notify about
+func notableChange(existing *repository.LLMModel, model clients.ParsedModel) *clients.PriceChange {
+	percentPrompt := calcPercentChange(existing.PricePrompt, model.PricePrompt)
+	percentCompletion := calcPercentChange(existing.PriceCompletion, model.PriceCompletion)
+
 	significantPrompt := percentPrompt != nil && math.Abs(*percentPrompt) >= MinPriceChangePercent
 	significantCompletion := percentCompletion != nil && math.Abs(*percentCompletion) >= MinPriceChangePercent
 
@@ -203,7 +268,7 @@ func (s *LLMSyncService) checkAndUpdatePrices(ctx context.Context, model clients
 		log.Debug().
 			Str("model_id", model.ModelID).
 			Msg("Price change below threshold, skipping notification")
-		return nil, nil
+		return nil
 	}
 
 	log.Info().
@@ -223,7 +288,14 @@ func (s *LLMSyncService) checkAndUpdatePrices(ctx context.Context, model clients
 		NewPriceCompletion:      model.PriceCompletion,
 		ChangePercentPrompt:     percentPrompt,
 		ChangePercentCompletion: percentCompletion,
-	}, nil
+	}
+}
+
+func equalInt64Ptr(a, b *int64) bool {
+	if a == nil || b == nil {
+		return a == b
+	}
+	return *a == *b
 }
 
 func calcPercentChange(old, new decimal.Decimal) *float64 {
@@ -0,0 +1,47 @@
+package services
+
+import (
+	"encoding/json"
+	"fmt"
+	"time"
+)
+
+// PricingUpdatedSubject is the core NATS subject the agents' PricingReloader
+// listens on (shared.nats.pricing_updates in shared-python).
+const PricingUpdatedSubject = "pricing.updated"
+
+// Publisher publishes a core NATS message; *nats.Conn implements it.
+type Publisher interface {
+	Publish(subject string, data []byte) error
+}
+
+// PricingUpdatedEvent mirrors shared.events.PricingUpdatedEvent.
+type PricingUpdatedEvent struct {
+	EventType     string    `json:"event_type"`
+	Timestamp     time.Time `json:"timestamp"`
+	ModelIDs      []string  `json:"model_ids"`
+	AddedModelIDs []string  `json:"added_model_ids"`
+}
+
+// publishPricingUpdated tells every agents replica to reload its pricing.
+func publishPricingUpdated(p Publisher, modelIDs, addedModelIDs []string) error {
+	if modelIDs == nil {
+		modelIDs = []string{}
+	}
+	if addedModelIDs == nil {
+		addedModelIDs = []string{}
+	}
+	data, err := json.Marshal(PricingUpdatedEvent{
+		EventType:     PricingUpdatedSubject,
+		Timestamp:     time.Now().UTC(),
+		ModelIDs:      modelIDs,
+		AddedModelIDs: addedModelIDs,
+	})
+	if err != nil {
+		return fmt.Errorf("marshal pricing event: %w", err)
+	}
+	if err := p.Publish(PricingUpdatedSubject, data); err != nil {
+		return fmt.Errorf("publish %s: %w", PricingUpdatedSubject, err)
+	}
+	return nil
+}
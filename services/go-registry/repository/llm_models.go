@@ -3,10 +3,10 @@ package repository
 import (
 	"context"
 	"fmt"
+	"strings"
 	"time"
 
 	"github.com/google/uuid"
-	"github.com/jackc/pgx/v5"
 	"github.com/jackc/pgx/v5/pgxpool"
 	"github.com/shopspring/decimal"
 )
@@ -33,133 +33,199 @@ func NewLLMModelsRepository(pool *pgxpool.Pool) *LLMModelsRepository {
 	return &LLMModelsRepository{pool: pool}
 }
 
-// GetAllModelIDs returns all model IDs in the database
-func (r *LLMModelsRepository) GetAllModelIDs(ctx context.Context) (map[string]struct{}, error) {
-	query := `SELECT model_id FROM llm_models`
-
-	rows, err := r.pool.Query(ctx, query)
-	if err != nil {
-		return nil, fmt.Errorf("query model ids: %w", err)
-	}
-	defer rows.Close()
-
-	result := make(map[string]struct{})
-	for rows.Next() {
-		var id string
-		if err := rows.Scan(&id); err != nil {
-			return nil, fmt.Errorf("scan model id: %w", err)
-		}
-		result[id] = struct{}{}
-	}
-
-	return result, rows.Err()
+// PriceHistoryEntry is one llm_model_price_history row
+type PriceHistoryEntry struct {
+	LLMModelID          uuid.UUID
+	ModelID             string
+	PrevPricePrompt     decimal.Decimal
+	PrevPriceCompletion decimal.Decimal
+	NewPricePrompt      decimal.Decimal
+	NewPriceCompletion  decimal.Decimal
 }
 
-// GetModelByID returns a model by its model_id
-func (r *LLMModelsRepository) GetModelByID(ctx context.Context, modelID string) (*LLMModel, error) {
+// GetModelsForSync returns every model keyed by model_id
+func (r *LLMModelsRepository) GetModelsForSync(ctx context.Context) (map[string]*LLMModel, error) {
 	query := `
-		SELECT id, model_id, name, context_length,
+		SELECT id, model_id, name, COALESCE(context_length, 0),
 		       price_prompt, price_completion, model_created_at,
 		       prices_changed_at, last_synced_at, created_at
 		FROM llm_models
-		WHERE model_id = $1
 	`
 
-	row := r.pool.QueryRow(ctx, query, modelID)
-
-	var m LLMModel
-	err := row.Scan(
-		&m.ID, &m.ModelID, &m.Name, &m.ContextLength,
-		&m.PricePrompt, &m.PriceCompletion, &m.ModelCreatedAt,
-		&m.PricesChangedAt, &m.LastSyncedAt, &m.CreatedAt,
-	)
+	rows, err := r.pool.Query(ctx, query)
 	if err != nil {
-		if err == pgx.ErrNoRows {
-			return nil, nil
+		return nil, fmt.Errorf("query models: %w", err)
+	}
+	defer rows.Close()
+
+	result := make(map[string]*LLMModel)
+	for rows.Next() {
+		var m LLMModel
+		if err := rows.Scan(
+			&m.ID, &m.ModelID, &m.Name, &m.ContextLength,
+			&m.PricePrompt, &m.PriceCompletion, &m.ModelCreatedAt,
+			&m.PricesChangedAt, &m.LastSyncedAt, &m.CreatedAt,
+		); err != nil {
+			return nil, fmt.Errorf("scan model: %w", err)
 		}
-		return nil, fmt.Errorf("scan model: %w", err)
+		result[m.ModelID] = &m
 	}
 
-	return &m, nil
+	return result, rows.Err()
 }
 
-// InsertModel inserts a new model
-func (r *LLMModelsRepository) InsertModel(ctx context.Context, model *LLMModel) error {
-	query := `
-		INSERT INTO llm_models (id, model_id, name, context_length,
-		                        price_prompt, price_completion, model_created_at, last_synced_at, created_at)
-		VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-	`
-
-	if model.ID == uuid.Nil {
-		model.ID = uuid.New()
-	}
-	if model.CreatedAt.IsZero() {
-		model.CreatedAt = time.Now()
+// SaveSyncChanges writes the result of one sync in a single transaction:
+// one INSERT for new models, one UPDATE for changed models and one INSERT
+// for price history. Updates are matched by ModelID; prices_changed_at only
+// moves for models whose token prices differ from the stored ones.
+func (r *LLMModelsRepository) SaveSyncChanges(ctx context.Context, inserts, updates []*LLMModel, history []PriceHistoryEntry) error {
+	if len(inserts) == 0 && len(updates) == 0 && len(history) == 0 {
+		return nil
 	}
 
-	now := time.Now()
-	_, err := r.pool.Exec(ctx, query,
-		model.ID, model.ModelID, model.Name, model.ContextLength,
-		model.PricePrompt, model.PriceCompletion, model.ModelCreatedAt, now, model.CreatedAt,
-	)
-	if err != nil {
-		return fmt.Errorf("insert model: %w", err)
-	}
-
-	return nil
-}
-
-// UpdateModelPrices updates prices and records change to history
-func (r *LLMModelsRepository) UpdateModelPrices(ctx context.Context, modelID uuid.UUID, modelIDStr string, oldPrompt, oldCompletion, newPrompt, newCompletion decimal.Decimal) error {
 	tx, err := r.pool.Begin(ctx)
 	if err != nil {
 		return fmt.Errorf("begin tx: %w", err)
 	}
 	defer tx.Rollback(ctx)
 
-	// Record price change
-	historyQuery := `
-		INSERT INTO llm_model_price_history (id, llm_model_uuid, model_id,
-		                                     prev_price_prompt, prev_price_completion,
-		                                     new_price_prompt, new_price_completion, created_at)
-		VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-	`
-
 	now := time.Now()
-	_, err = tx.Exec(ctx, historyQuery,
-		uuid.New(), modelID, modelIDStr,
-		oldPrompt, oldCompletion,
-		newPrompt, newCompletion, now,
-	)
-	if err != nil {
-		return fmt.Errorf("insert price history: %w", err)
+
+	if len(inserts) > 0 {
+		ids := make([]uuid.UUID, len(inserts))
+		modelIDs := make([]string, len(inserts))
+		providers := make([]string, len(inserts))
+		names := make([]string, len(inserts))
+		contextLengths := make([]int32, len(inserts))
+		pricesPrompt := make([]string, len(inserts))
+		pricesCompletion := make([]string, len(inserts))
+		createdAts := make([]*int64, len(inserts))
+		for i, m := range inserts {
+			if m.ID == uuid.Nil {
+				m.ID = uuid.New()
+			}
+			ids[i] = m.ID
+			modelIDs[i] = m.ModelID
+			providers[i] = providerOf(m.ModelID)
+			names[i] = m.Name
+			contextLengths[i] = int32(m.ContextLength)
+			pricesPrompt[i] = m.PricePrompt.String()
+			pricesCompletion[i] = m.PriceCompletion.String()
+			createdAts[i] = m.ModelCreatedAt
+		}
+
+		insertQuery := `
+			INSERT INTO llm_models (id, model_id, provider, name, context_length,
+			                        price_prompt, price_completion, model_created_at,
+			                        last_synced_at, created_at)
+			SELECT u.id, u.model_id, u.provider, u.name, u.context_length,
+			       u.price_prompt::numeric, u.price_completion::numeric, u.model_created_at,
+			       $9, $9
+			FROM unnest($1::uuid[], $2::text[], $3::text[], $4::text[], $5::int[],
+			            $6::text[], $7::text[], $8::bigint[])
+			     AS u(id, model_id, provider, name, context_length,
+			          price_prompt, price_completion, model_created_at)
+			ON CONFLICT (model_id) DO NOTHING
+		`
+		if _, err := tx.Exec(ctx, insertQuery,
+			ids, modelIDs, providers, names, contextLengths,
+			pricesPrompt, pricesCompletion, createdAts, now,
+		); err != nil {
+			return fmt.Errorf("insert models: %w", err)
+		}
 	}
 
-	// Update model prices
-	updateQuery := `
-		UPDATE llm_models
-		SET price_prompt = $2, price_completion = $3,
-		    prices_changed_at = $4, last_synced_at = $4
-		WHERE id = $1
-	`
+	if len(updates) > 0 {
+		modelIDs := make([]string, len(updates))
+		names := make([]string, len(updates))
+		contextLengths := make([]int32, len(updates))
+		pricesPrompt := make([]string, len(updates))
+		pricesCompletion := make([]string, len(updates))
+		createdAts := make([]*int64, len(updates))
+		for i, m := range updates {
+			modelIDs[i] = m.ModelID
+			names[i] = m.Name
+			contextLengths[i] = int32(m.ContextLength)
+			pricesPrompt[i] = m.PricePrompt.String()
+			pricesCompletion[i] = m.PriceCompletion.String()
+			createdAts[i] = m.ModelCreatedAt
+		}
 
-	_, err = tx.Exec(ctx, updateQuery, modelID, newPrompt, newCompletion, now)
-	if err != nil {
-		return fmt.Errorf("update model prices: %w", err)
+		// SET expressions see the old row, so the CASE compares old and new prices
+		updateQuery := `
+			UPDATE llm_models m
+			SET name = u.name,
+			    context_length = u.context_length,
+			    model_created_at = u.model_created_at,
+			    price_prompt = u.price_prompt::numeric,
+			    price_completion = u.price_completion::numeric,
+			    prices_changed_at = CASE
+			        WHEN m.price_prompt <> u.price_prompt::numeric
+			          OR m.price_completion <> u.price_completion::numeric
+			        THEN $7
+			        ELSE m.prices_changed_at
+			    END,
+			    updated_at = $7,
+			    last_synced_at = $7
+			FROM unnest($1::text[], $2::text[], $3::int[], $4::bigint[], $5::text[], $6::text[])
+			     AS u(model_id, name, context_length, model_created_at,
+			          price_prompt, price_completion)
+			WHERE m.model_id = u.model_id
+		`
+		if _, err := tx.Exec(ctx, updateQuery,
+			modelIDs, names, contextLengths, createdAts,
+			pricesPrompt, pricesCompletion, now,
+		); err != nil {
+			return fmt.Errorf("update models: %w", err)
+		}
+	}
+
+	if len(history) > 0 {
+		ids := make([]uuid.UUID, len(history))
+		llmModelIDs := make([]uuid.UUID, len(history))
+		modelIDs := make([]string, len(history))
+		prevPrompt := make([]string, len(history))
+		prevCompletion := make([]string, len(history))
+		newPrompt := make([]string, len(history))
+		newCompletion := make([]string, len(history))
+		for i, h := range history {
+			ids[i] = uuid.New()
+			llmModelIDs[i] = h.LLMModelID
+			modelIDs[i] = h.ModelID
+			prevPrompt[i] = h.PrevPricePrompt.String()
+			prevCompletion[i] = h.PrevPriceCompletion.String()
+			newPrompt[i] = h.NewPricePrompt.String()
+			newCompletion[i] = h.NewPriceCompletion.String()
+		}
+
+		historyQuery := `
+			INSERT INTO llm_model_price_history (id, llm_model_uuid, model_id,
+			                                     prev_price_prompt, prev_price_completion,
+			                                     new_price_prompt, new_price_completion, created_at)
+			SELECT u.id, u.llm_model_uuid, u.model_id,
+			       u.prev_prompt::numeric, u.prev_completion::numeric,
+			       u.new_prompt::numeric, u.new_completion::numeric, $8
+			FROM unnest($1::uuid[], $2::uuid[], $3::text[], $4::text[], $5::text[],
+			            $6::text[], $7::text[])
+			     AS u(id, llm_model_uuid, model_id,
+			          prev_prompt, prev_completion, new_prompt, new_completion)
+		`
+		if _, err := tx.Exec(ctx, historyQuery,
+			ids, llmModelIDs, modelIDs,
+			prevPrompt, prevCompletion, newPrompt, newCompletion, now,
+		); err != nil {
+			return fmt.Errorf("insert price history: %w", err)
+		}
 	}
 
 	return tx.Commit(ctx)
 }
 
-// UpdateLastSyncedAt updates the last_synced_at timestamp
-func (r *LLMModelsRepository) UpdateLastSyncedAt(ctx context.Context, modelID string) error {
-	query := `UPDATE llm_models SET last_synced_at = $2 WHERE model_id = $1`
-
-	_, err := r.pool.Exec(ctx, query, modelID, time.Now())
-	if err != nil {
-		return fmt.Errorf("update last synced: %w", err)
+// providerOf returns the provider part of an OpenRouter model ID
+// ("google/gemini-3-flash" -> "google").
+func providerOf(modelID string) string {
+	if provider, _, found := strings.Cut(modelID, "/"); found {
+		return provider
 	}
-
-	return nil
+	return "unknown"
 }
@@ -43,6 +43,37 @@ class IntegrationsSettings(BaseSettings):
         description="Telegram thread/topic ID for Sentry webhook notifications",
     )
 
+    # Telegram notifier
+    telegram_notifier_queue_size: int = Field(
+        default=1000,
+        description="Maximum queued Telegram notifications before dropping",
+    )
+    telegram_notifier_workers: int = Field(
+        default=2,
+        description="Concurrent Telegram send workers",
+    )
+    telegram_notifier_timeout: float = Field(
+        default=30.0,
+        description="Telegram Bot API request timeout in seconds",
+    )
+
+    # Alert deduplication (Sentry, GlitchTip)
+    alert_dedup_enabled: bool = Field(
+        default=True, description="Collapse repeated alerts for the same issue"
+    )
+    alert_dedup_window_seconds: float = Field(
+        default=600.0,
+        description="Quiet time after which a repeated issue alerts again",
+    )
+    alert_summary_interval_seconds: float = Field(
+        default=300.0,
+        description="Interval between summaries of repeated alerts",
+    )
+    alert_dedup_state_path: str = Field(
+        default="",
+        description="JSON file to persist dedup state across restarts (optional)",
+    )
+
     # OpenTelemetry
     otel_enabled: bool = Field(default=True, description="Enable OpenTelemetry")
     otel_service_name: str = Field(
@@ -24,25 +24,43 @@ from .controllers import (
     SentryWebhookController,
 )
 from .services import (
+    AlertDeduplicator,
     AppStoreWebhookService,
     GlitchTipWebhookService,
     SentryWebhookService,
+    TelegramNotifier,
+)
+
+notifier = TelegramNotifier(
+    max_queue_size=settings.telegram_notifier_queue_size,
+    workers=settings.telegram_notifier_workers,
+    timeout=settings.telegram_notifier_timeout,
+)
+deduplicator = (
+    AlertDeduplicator(
+        notifier,
+        window_seconds=settings.alert_dedup_window_seconds,
+        summary_interval=settings.alert_summary_interval_seconds,
+        state_path=settings.alert_dedup_state_path or None,
+    )
+    if settings.alert_dedup_enabled
+    else None
 )
 
 
 def provide_appstore_webhook_service() -> AppStoreWebhookService:
     """Provide App Store webhook service."""
-    return AppStoreWebhookService()
+    return AppStoreWebhookService(notifier)
 
 
 def provide_sentry_webhook_service() -> SentryWebhookService:
     """Provide Sentry webhook service."""
-    return SentryWebhookService()
+    return SentryWebhookService(notifier, deduplicator)
 
 
 def provide_glitchtip_webhook_service() -> GlitchTipWebhookService:
     """Provide GlitchTip webhook service."""
-    return GlitchTipWebhookService()
+    return GlitchTipWebhookService(notifier, deduplicator)
 
 
 @asynccontextmanager
@@ -53,9 +71,17 @@ async def lifespan(_app: Litestar) -> AsyncGenerator[None, None]:
     setup_sentry_logging(settings.sentry_enabled, settings.debug)
     logger.info("Starting makefeed-integrations service...")
     setup_otel()
+    await notifier.start()
+    if deduplicator is not None:
+        await deduplicator.start()
     logger.info(f"makefeed-integrations listening on {settings.host}:{settings.port}")
-    yield
-    logger.info("Shutting down makefeed-integrations service...")
+    try:
+        yield
+    finally:
+        logger.info("Shutting down makefeed-integrations service...")
+        if deduplicator is not None:
+            await deduplicator.stop()
+        await notifier.stop()
 
 
 def setup_otel() -> None:
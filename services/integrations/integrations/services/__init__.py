@@ -1,12 +1,17 @@
 """Webhook services."""
 
+from .alert_dedup import AlertDeduplicator
 from .appstore_webhook import AppStoreWebhookService, SignatureVerificationError
 from .glitchtip_webhook import GlitchTipWebhookService
 from .sentry_webhook import SentryWebhookService
+from .telegram_notifier import TelegramNotifier, TelegramTarget
 
 __all__ = [
+    "AlertDeduplicator",
     "AppStoreWebhookService",
     "GlitchTipWebhookService",
     "SignatureVerificationError",
     "SentryWebhookService",
+    "TelegramNotifier",
+    "TelegramTarget",
 ]
@@ -0,0 +1,199 @@
+"""Deduplication of repeated error alerts (Sentry, GlitchTip).
+
+One bad deploy makes the same issue fire again and again. Only the first
+occurrence is sent as a full alert; repeats within a sliding window are
+counted, and every summary interval one message per chat lists how often
+each issue fired since its last notification.
+"""
+
+import asyncio
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from .telegram_notifier import TelegramNotifier, TelegramTarget
+
+DEFAULT_WINDOW_SECONDS = 600.0
+DEFAULT_SUMMARY_INTERVAL_SECONDS = 300.0
+
+# Issues listed in one summary message; the rest are only counted
+MAX_SUMMARY_ISSUES = 20
+
+
+@dataclass
+class _AlertState:
+    label: str
+    first_seen: float
+    last_seen: float
+    total: int = 1
+    # Occurrences not yet reported (neither alerted nor summarized)
+    unreported: int = 0
+
+
+class AlertDeduplicator:
+    """Collapses repeated alerts per issue key.
+
+    An issue stays "open" while it keeps firing: each occurrence extends
+    its window to last_seen + window_seconds. An issue that has been quiet
+    for a whole window is forgotten, so its next occurrence alerts again.
+
+    State is kept in memory. With state_path it is also written to a JSON
+    file on every summary and loaded on start, so a restart doesn't
+    re-alert every open issue. Summary targets (bot tokens) are not
+    persisted; counts restored from the file are reported once the issue
+    fires again.
+    """
+
+    def __init__(
+        self,
+        notifier: TelegramNotifier,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        summary_interval: float = DEFAULT_SUMMARY_INTERVAL_SECONDS,
+        state_path: str | None = None,
+    ) -> None:
+        self._notifier = notifier
+        self._window = window_seconds
+        self._summary_interval = summary_interval
+        self._state_path = Path(state_path) if state_path else None
+
+        self._alerts: dict[str, _AlertState] = {}
+        self._targets: dict[str, TelegramTarget] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Load persisted state and start sending periodic summaries."""
+        if self._task is not None:
+            return
+        if self._state_path is not None:
+            await asyncio.to_thread(self._load)
+        self._task = asyncio.create_task(self._run(), name="alert-dedup-summary")
+        logger.info(
+            f"AlertDeduplicator started (window={self._window}s, "
+            f"summary_interval={self._summary_interval}s)"
+        )
+
+    async def stop(self) -> None:
+        """Send a final summary, persist state and stop the periodic task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self.flush()
+        logger.info("AlertDeduplicator stopped")
+
+    def record(self, key: str, label: str, target: TelegramTarget) -> bool:
+        """Register one occurrence of an alert.
+
+        Args:
+            key: Issue identity, e.g. "sentry:created:4711"
+            label: Short HTML-safe description used in summaries
+            target: Chat the issue's alerts go to
+
+        Returns:
+            True if the full alert should be sent now (first occurrence in
+            the window), False if it was counted for the next summary
+        """
+        now = time.time()
+        self._targets[key] = target
+        state = self._alerts.get(key)
+        if state is None or now - state.last_seen > self._window:
+            self._alerts[key] = _AlertState(label=label, first_seen=now, last_seen=now)
+            return True
+
+        state.label = label
+        state.last_seen = now
+        state.total += 1
+        state.unreported += 1
+        return False
+
+    async def flush(self) -> int:
+        """Send summaries for repeated alerts and forget expired issues.
+
+        Returns:
+            Number of summary messages queued
+        """
+        now = time.time()
+        by_target: dict[TelegramTarget, list[_AlertState]] = {}
+        for key, state in list(self._alerts.items()):
+            target = self._targets.get(key)
+            if state.unreported and target is not None:
+                by_target.setdefault(target, []).append(state)
+            elif now - state.last_seen > self._window:
+                del self._alerts[key]
+                self._targets.pop(key, None)
+
+        sent = 0
+        for target, states in by_target.items():
+            message = self._format_summary(states)
+            if self._notifier.enqueue(target, message):
+                sent += 1
+                for state in states:
+                    state.unreported = 0
+
+        if self._state_path is not None:
+            await asyncio.to_thread(self._save)
+        return sent
+
+    def _format_summary(self, states: list[_AlertState]) -> str:
+        """Format one summary message for a chat."""
+        states = sorted(states, key=lambda state: state.unreported, reverse=True)
+        minutes = max(1, round(self._summary_interval / 60))
+        lines = [f"🔁 <b>Repeated alerts</b> (last {minutes} min)", ""]
+        for state in states[:MAX_SUMMARY_ISSUES]:
+            lines.append(f"• {state.label}: +{state.unreported} (total {state.total})")
+        if len(states) > MAX_SUMMARY_ISSUES:
+            rest = states[MAX_SUMMARY_ISSUES:]
+            lines.append(
+                f"• …and {len(rest)} more issues "
+                f"(+{sum(state.unreported for state in rest)})"
+            )
+        return "\n".join(lines)
+
+    async def _run(self) -> None:
+        """Flush every summary interval."""
+        while True:
+            await asyncio.sleep(self._summary_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Alert summary failed: {e}")
+
+    def _load(self) -> None:
+        """Read persisted state, skipping issues whose window has passed."""
+        assert self._state_path is not None
+        try:
+            raw = json.loads(self._state_path.read_text())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable alert state {self._state_path}: {e}")
+            return
+
+        now = time.time()
+        for key, fields in raw.items():
+            try:
+                state = _AlertState(**fields)
+            except TypeError:
+                continue
+            if now - state.last_seen <= self._window:
+                self._alerts[key] = state
+        logger.info(f"Loaded {len(self._alerts)} open alerts from {self._state_path}")
+
+    def _save(self) -> None:
+        """Write state atomically (temp file + rename)."""
+        assert self._state_path is not None
+        data = {key: asdict(state) for key, state in self._alerts.items()}
+        tmp_path = self._state_path.with_suffix(self._state_path.suffix + ".tmp")
+        try:
+            tmp_path.write_text(json.dumps(data))
+            os.replace(tmp_path, self._state_path)
+        except OSError as e:
+            logger.warning(f"Failed to persist alert state: {e}")
@@ -4,7 +4,6 @@ import hashlib
 import hmac
 from typing import Any
 
-import httpx
 from loguru import logger
 
 from shared.models.appstore_webhook import (
@@ -12,6 +11,7 @@ from shared.models.appstore_webhook import (
 )
 
 from ..config import settings
+from .telegram_notifier import TelegramNotifier, TelegramTarget
 
 
 class SignatureVerificationError(Exception):
@@ -21,6 +21,9 @@ class SignatureVerificationError(Exception):
 class AppStoreWebhookService:
     """Service for processing App Store Connect webhooks."""
 
+    def __init__(self, notifier: TelegramNotifier) -> None:
+        self.notifier = notifier
+
     EVENT_EMOJIS: dict[str, str] = {
         "appStoreVersionAppVersionStateUpdated": "🚀",
         "buildUploadStateUpdated": "📦",
@@ -112,53 +115,33 @@ class AppStoreWebhookService:
 
         return "\n".join(lines)
 
-    async def send_telegram_notification(self, message: str) -> bool:
-        """Send notification to Telegram.
+    def send_telegram_notification(
+        self, message: str, dedup_key: str | None = None
+    ) -> bool:
+        """Queue notification to Telegram.
 
         Args:
             message: HTML-formatted message to send
+            dedup_key: Key for merging with a still-queued duplicate
+                (defaults to the message text)
 
         Returns:
-            True if sent successfully, False otherwise
+            True if queued, False if not configured or the queue is full
         """
         bot_token = settings.appstore_telegram_bot_token
         chat_id = settings.appstore_telegram_chat_id
-        thread_id = settings.appstore_telegram_thread_id
 
         if not bot_token or not chat_id:
             logger.warning("Telegram credentials not configured for App Store webhook")
             return False
 
-        url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-        payload = {
-            "chat_id": chat_id,
-            "text": message,
-            "parse_mode": "HTML",
-        }
-
-        if thread_id:
-            payload["message_thread_id"] = thread_id
-
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, json=payload)
-
-                if response.status_code == 200:
-                    logger.info("App Store webhook notification sent to Telegram")
-                    return True
-
-                logger.error(
-                    f"Failed to send Telegram notification: "
-                    f"{response.status_code} - {response.text[:200]}"
-                )
-                return False
-
-        except httpx.TimeoutException:
-            logger.error("Timeout sending App Store notification to Telegram")
-            return False
-        except httpx.RequestError as e:
-            logger.error(f"Network error sending App Store notification: {e}")
-            return False
+        target = TelegramTarget(
+            bot_token=bot_token,
+            chat_id=chat_id,
+            thread_id=settings.appstore_telegram_thread_id,
+            disable_web_page_preview=False,
+        )
+        return self.notifier.enqueue(target, message, dedup_key=dedup_key)
 
     async def process_webhook(
         self,
@@ -178,7 +161,7 @@ class AppStoreWebhookService:
             logger.info(f"App Store webhook received: type={event_type}")
 
             message = self.format_telegram_message(payload)
-            telegram_sent = await self.send_telegram_notification(message)
+            telegram_sent = self.send_telegram_notification(message)
 
             return AppStoreWebhookProcessingResult(
                 success=True,
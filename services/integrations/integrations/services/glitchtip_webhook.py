@@ -4,7 +4,6 @@ GlitchTip sends Slack-compatible webhooks with attachments containing error info
 This service processes them and sends notifications to Telegram.
 """
 
-import httpx
 from loguru import logger
 
 from shared.models.glitchtip_webhook import (
@@ -13,11 +12,21 @@ from shared.models.glitchtip_webhook import (
 )
 
 from ..config import settings
+from .alert_dedup import AlertDeduplicator
+from .telegram_notifier import TelegramNotifier, TelegramTarget
 
 
 class GlitchTipWebhookService:
     """Service for processing GlitchTip webhooks."""
 
+    def __init__(
+        self,
+        notifier: TelegramNotifier,
+        deduplicator: AlertDeduplicator | None = None,
+    ) -> None:
+        self.notifier = notifier
+        self.deduplicator = deduplicator
+
     def _extract_issue_id(self, title_link: str | None) -> str | None:
         """Extract issue ID from GlitchTip URL."""
         if not title_link:
@@ -74,50 +83,33 @@ class GlitchTipWebhookService:
         """Escape HTML special characters."""
         return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
-    async def send_telegram_notification(self, message: str) -> bool:
-        """Send notification to Telegram.
+    def _telegram_target(self) -> TelegramTarget | None:
+        """Telegram chat for GlitchTip alerts, None if not configured.
 
         Uses the same Telegram config as Sentry webhook.
         """
         bot_token = settings.sentry_webhook_telegram_bot_token
         chat_id = settings.sentry_webhook_telegram_chat_id
-        thread_id = settings.sentry_webhook_telegram_thread_id
 
         if not bot_token or not chat_id:
             logger.warning("Telegram credentials not configured for GlitchTip webhook")
-            return False
-
-        url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-        payload = {
-            "chat_id": chat_id,
-            "text": message,
-            "parse_mode": "HTML",
-            "disable_web_page_preview": True,
-        }
-
-        if thread_id:
-            payload["message_thread_id"] = thread_id
-
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, json=payload)
-
-                if response.status_code == 200:
-                    logger.info("GlitchTip webhook notification sent to Telegram")
-                    return True
+            return None
 
-                logger.error(
-                    f"Failed to send Telegram notification: "
-                    f"{response.status_code} - {response.text[:200]}"
-                )
-                return False
+        return TelegramTarget(
+            bot_token=bot_token,
+            chat_id=chat_id,
+            thread_id=settings.sentry_webhook_telegram_thread_id,
+            disable_web_page_preview=True,
+        )
 
-        except httpx.TimeoutException:
-            logger.error("Timeout sending GlitchTip notification to Telegram")
-            return False
-        except httpx.RequestError as e:
-            logger.error(f"Network error sending GlitchTip notification: {e}")
+    def send_telegram_notification(
+        self, message: str, dedup_key: str | None = None
+    ) -> bool:
+        """Queue notification to Telegram."""
+        target = self._telegram_target()
+        if target is None:
             return False
+        return self.notifier.enqueue(target, message, dedup_key=dedup_key)
 
     async def process_webhook(
         self,
@@ -126,13 +118,28 @@ class GlitchTipWebhookService:
         """Process an incoming GlitchTip webhook."""
         try:
             error_title = None
+            issue_id = None
             if payload.attachments:
                 error_title = payload.attachments[0].title
+                issue_id = self._extract_issue_id(payload.attachments[0].title_link)
 
             logger.info(f"GlitchTip webhook received: error={error_title}")
 
+            dedup_key = f"glitchtip:{issue_id}" if issue_id else None
+            if dedup_key and self._is_repeat(dedup_key, issue_id, error_title):
+                logger.info(
+                    f"GlitchTip alert {dedup_key} repeated, counted for summary"
+                )
+                return GlitchTipWebhookProcessingResult(
+                    success=True,
+                    error_title=error_title,
+                    telegram_sent=False,
+                )
+
             message = self.format_telegram_message(payload)
-            telegram_sent = await self.send_telegram_notification(message)
+            telegram_sent = self.send_telegram_notification(
+                message, dedup_key=dedup_key
+            )
 
             return GlitchTipWebhookProcessingResult(
                 success=True,
@@ -146,3 +153,18 @@ class GlitchTipWebhookService:
                 success=False,
                 error_message=str(e),
             )
+
+    def _is_repeat(
+        self, dedup_key: str, issue_id: str | None, error_title: str | None
+    ) -> bool:
+        """Record the alert; True if it repeats one already sent."""
+        if self.deduplicator is None:
+            return False
+        target = self._telegram_target()
+        if target is None:
+            return False
+        title = error_title or "alert"
+        if len(title) > 80:
+            title = title[:77] + "..."
+        label = f"<b>GlitchTip #{issue_id}</b> {self._escape_html(title)}"
+        return not self.deduplicator.record(dedup_key, label, target)
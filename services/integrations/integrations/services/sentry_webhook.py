@@ -1,6 +1,5 @@
 """Sentry webhook service for Telegram notifications."""
 
-import httpx
 from loguru import logger
 
 from shared.models.sentry_webhook import (
@@ -9,11 +8,21 @@ from shared.models.sentry_webhook import (
 )
 
 from ..config import settings
+from .alert_dedup import AlertDeduplicator
+from .telegram_notifier import TelegramNotifier, TelegramTarget
 
 
 class SentryWebhookService:
     """Service for processing Sentry webhooks."""
 
+    def __init__(
+        self,
+        notifier: TelegramNotifier,
+        deduplicator: AlertDeduplicator | None = None,
+    ) -> None:
+        self.notifier = notifier
+        self.deduplicator = deduplicator
+
     ACTION_EMOJIS: dict[str, str] = {
         "created": "🔴",
         "resolved": "✅",
@@ -100,47 +109,30 @@ class SentryWebhookService:
             return text
         return text[: max_length - 3] + "..."
 
-    async def send_telegram_notification(self, message: str) -> bool:
-        """Send notification to Telegram."""
+    def _telegram_target(self) -> TelegramTarget | None:
+        """Telegram chat for Sentry alerts, None if not configured."""
         bot_token = settings.sentry_webhook_telegram_bot_token
         chat_id = settings.sentry_webhook_telegram_chat_id
-        thread_id = settings.sentry_webhook_telegram_thread_id
 
         if not bot_token or not chat_id:
             logger.warning("Telegram credentials not configured for Sentry webhook")
+            return None
+
+        return TelegramTarget(
+            bot_token=bot_token,
+            chat_id=chat_id,
+            thread_id=settings.sentry_webhook_telegram_thread_id,
+            disable_web_page_preview=True,
+        )
+
+    def send_telegram_notification(
+        self, message: str, dedup_key: str | None = None
+    ) -> bool:
+        """Queue notification to Telegram."""
+        target = self._telegram_target()
+        if target is None:
             return False
-
-        url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-        payload = {
-            "chat_id": chat_id,
-            "text": message,
-            "parse_mode": "HTML",
-            "disable_web_page_preview": True,
-        }
-
-        if thread_id:
-            payload["message_thread_id"] = thread_id
-
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, json=payload)
-
-                if response.status_code == 200:
-                    logger.info("Sentry webhook notification sent to Telegram")
-                    return True
-
-                logger.error(
-                    f"Failed to send Telegram notification: "
-                    f"{response.status_code} - {response.text[:200]}"
-                )
-                return False
-
-        except httpx.TimeoutException:
-            logger.error("Timeout sending Sentry notification to Telegram")
-            return False
-        except httpx.RequestError as e:
-            logger.error(f"Network error sending Sentry notification: {e}")
-            return False
+        return self.notifier.enqueue(target, message, dedup_key=dedup_key)
 
     async def process_webhook(
         self,
@@ -152,8 +144,23 @@ class SentryWebhookService:
             issue_id = payload.data.issue.shortId
             logger.info(f"Sentry webhook received: action={action}, issue={issue_id}")
 
+            issue = payload.data.issue
+            dedup_key = f"sentry:{action}:{issue.id}"
+            if self._is_repeat(dedup_key, payload):
+                logger.info(f"Sentry alert {dedup_key} repeated, counted for summary")
+                return SentryWebhookProcessingResult(
+                    success=True,
+                    action=action,
+                    issue_id=issue_id,
+                    telegram_sent=False,
+                )
+
             message = self.format_telegram_message(payload)
-            telegram_sent = await self.send_telegram_notification(message)
+            # Repeats of the same event while it waits in the queue are
+            # sent once, with the latest counts
+            telegram_sent = self.send_telegram_notification(
+                message, dedup_key=dedup_key
+            )
 
             return SentryWebhookProcessingResult(
                 success=True,
@@ -168,3 +175,17 @@ class SentryWebhookService:
                 success=False,
                 error_message=str(e),
             )
+
+    def _is_repeat(self, dedup_key: str, payload: SentryWebhookPayload) -> bool:
+        """Record the alert; True if it repeats one already sent."""
+        if self.deduplicator is None:
+            return False
+        target = self._telegram_target()
+        if target is None:
+            return False
+        issue = payload.data.issue
+        label = (
+            f"<b>Sentry {self._escape_html(issue.shortId)}</b> "
+            f"{self._escape_html(self._truncate(issue.title, 80))}"
+        )
+        return not self.deduplicator.record(dedup_key, label, target)
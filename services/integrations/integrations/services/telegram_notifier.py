@@ -0,0 +1,357 @@
+"""Queued Telegram notifier shared by the webhook services.
+
+Webhook handlers only enqueue a message and return; background workers
+send it through one pooled httpx client, respecting Telegram's rate limits.
+"""
+
+import asyncio
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+from loguru import logger
+
+TELEGRAM_API_URL = "https://api.telegram.org"
+
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_WORKERS = 2
+DEFAULT_TIMEOUT_SECONDS = 30.0
+MAX_SEND_ATTEMPTS = 3
+
+# Telegram Bot API limits: about one message per second in a single chat
+# and at most 20 messages per minute in a group
+CHAT_MIN_INTERVAL_SECONDS = 1.0
+GROUP_MESSAGES_PER_MINUTE = 20
+
+# Telegram rejects messages longer than this
+MAX_MESSAGE_LENGTH = 4096
+
+# Tags, entities and the text between them; a stray < or & is plain text
+_HTML_TOKEN_RE = re.compile(r"<[^<>]*>|&#?\w+;|[^<&]+|[<&]")
+_TAG_NAME_RE = re.compile(r"</?([\w-]+)")
+
+
+def _truncate_html(text: str, limit: int) -> str:
+    """Cut Telegram HTML to at most limit characters, ending with "...".
+
+    Only cuts between tags and entities, never inside one, and closes the
+    tags left open at the cut, so Telegram can still parse the result.
+    """
+    if len(text) <= limit:
+        return text
+    ellipsis = "..."
+    parts: list[str] = []
+    length = 0
+    open_tags: list[str] = []
+    for match in _HTML_TOKEN_RE.finditer(text):
+        token = match.group()
+        closers = sum(len(name) + 3 for name in open_tags)
+        room = limit - len(ellipsis) - length - closers
+        tag = _TAG_NAME_RE.match(token) if token.endswith(">") else None
+        if tag is not None:
+            name = tag.group(1)
+            if token.startswith("</"):
+                # Replaces its closer, which is already reserved
+                if name in open_tags and len(token) > room + len(name) + 3:
+                    break
+                if name in open_tags:
+                    del open_tags[len(open_tags) - 1 - open_tags[::-1].index(name)]
+            else:
+                if len(token) + len(name) + 3 > room:
+                    break
+                open_tags.append(name)
+        elif token.startswith("&") and len(token) > 1:
+            if len(token) > room:
+                break
+        elif len(token) > room:
+            parts.append(token[: max(room, 0)])
+            break
+        parts.append(token)
+        length += len(token)
+    parts.append(ellipsis)
+    parts.extend(f"</{name}>" for name in reversed(open_tags))
+    return "".join(parts)
+
+
+@dataclass(frozen=True)
+class TelegramTarget:
+    """Bot and chat (optionally a forum topic) a message is sent to."""
+
+    bot_token: str
+    chat_id: str
+    thread_id: int | None = None
+    disable_web_page_preview: bool = True
+
+    @property
+    def is_group(self) -> bool:
+        """Group and channel chat ids are negative."""
+        return self.chat_id.startswith("-")
+
+
+@dataclass
+class _PendingMessage:
+    target: TelegramTarget
+    text: str
+    count: int = 1
+    attempts: int = 0
+
+
+@dataclass
+class _ChatState:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    next_send_at: float = 0.0
+    sent_at: deque[float] = field(default_factory=deque)
+
+
+class TelegramNotifier:
+    """Sends Telegram messages from a bounded queue.
+
+    - One httpx.AsyncClient (keep-alive connection pool) is created in
+      start() and shared by every send.
+    - enqueue() never waits: when the queue is full the message is dropped
+      and False is returned, so a webhook storm can't pile up memory.
+    - Messages to the same chat are sent one at a time, at most one per
+      second and 20 per minute in groups; a 429 response pushes the chat's
+      next send back by Telegram's retry_after.
+    - A message with the same chat and dedup key (by default the text) as
+      one still waiting in the queue is not queued again; the waiting
+      message takes the newer text and is sent once with a "repeated N
+      times" note.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = DEFAULT_QUEUE_SIZE,
+        workers: int = DEFAULT_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ) -> None:
+        self._max_queue_size = max_queue_size
+        self._workers = workers
+        self._timeout = timeout
+
+        self._queue: asyncio.Queue[tuple[Any, ...]] | None = None
+        self._pending: dict[tuple[Any, ...], _PendingMessage] = {}
+        self._chats: dict[tuple[str, str], _ChatState] = {}
+        self._client: httpx.AsyncClient | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether start() has been called and stop() hasn't."""
+        return self._client is not None
+
+    async def start(self) -> None:
+        """Create the HTTP client and start the send workers."""
+        if self._client is not None:
+            return
+        self._client = httpx.AsyncClient(
+            base_url=TELEGRAM_API_URL,
+            timeout=self._timeout,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+        )
+        self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"telegram-notifier-{i}")
+            for i in range(self._workers)
+        ]
+        logger.info(
+            f"TelegramNotifier started (workers={self._workers}, "
+            f"queue={self._max_queue_size})"
+        )
+
+    async def stop(self, drain_timeout: float = 10.0) -> None:
+        """Send what is queued (up to drain_timeout seconds), then stop."""
+        if self._client is None or self._queue is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"TelegramNotifier stopping with {len(self._pending)} unsent messages"
+            )
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        await self._client.aclose()
+        self._client = None
+        self._queue = None
+        self._pending.clear()
+        logger.info(
+            f"TelegramNotifier stopped (sent={self.sent}, "
+            f"coalesced={self.coalesced}, dropped={self.dropped})"
+        )
+
+    def enqueue(
+        self,
+        target: TelegramTarget,
+        text: str,
+        dedup_key: str | None = None,
+    ) -> bool:
+        """Queue a message for sending.
+
+        Args:
+            target: Bot and chat to send to
+            text: HTML-formatted message
+            dedup_key: Identity for coalescing duplicates (defaults to text)
+
+        Returns:
+            True if the message is queued (or merged into a queued
+            duplicate), False if the notifier is not running or full
+        """
+        if self._queue is None:
+            logger.warning("TelegramNotifier is not running, message dropped")
+            self.dropped += 1
+            return False
+
+        key = (
+            target.bot_token,
+            target.chat_id,
+            target.thread_id,
+            dedup_key if dedup_key is not None else text,
+        )
+        pending = self._pending.get(key)
+        if pending is not None:
+            pending.text = text
+            pending.count += 1
+            self.coalesced += 1
+            return True
+
+        try:
+            self._queue.put_nowait(key)
+        except asyncio.QueueFull:
+            logger.warning("Telegram notification queue is full, message dropped")
+            self.dropped += 1
+            return False
+        self._pending[key] = _PendingMessage(target=target, text=text)
+        return True
+
+    async def _worker(self) -> None:
+        """Take queued messages and send them."""
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            key = await queue.get()
+            try:
+                await self._deliver(key)
+            except Exception as e:
+                logger.error(f"Unexpected error sending Telegram notification: {e}")
+                self._pending.pop(key, None)
+            finally:
+                queue.task_done()
+
+    async def _deliver(self, key: tuple[Any, ...]) -> None:
+        """Send one queued message, waiting for its chat's rate limit."""
+        message = self._pending[key]
+        target = message.target
+        chat = self._chats.setdefault((target.bot_token, target.chat_id), _ChatState())
+
+        async with chat.lock:
+            await self._wait_for_slot(chat, target.is_group)
+            # Duplicates that arrived while waiting are folded into this send
+            self._pending.pop(key, None)
+            message.attempts += 1
+            retry_after = await self._send(message)
+
+            now = time.monotonic()
+            chat.sent_at.append(now)
+            chat.next_send_at = now + max(CHAT_MIN_INTERVAL_SECONDS, retry_after or 0.0)
+
+        if retry_after is not None and message.attempts < MAX_SEND_ATTEMPTS:
+            self._requeue(key, message)
+
+    async def _wait_for_slot(self, chat: _ChatState, is_group: bool) -> None:
+        """Sleep until the chat may receive another message."""
+        while True:
+            now = time.monotonic()
+            while chat.sent_at and chat.sent_at[0] <= now - 60.0:
+                chat.sent_at.popleft()
+            wait = chat.next_send_at - now
+            if is_group and len(chat.sent_at) >= GROUP_MESSAGES_PER_MINUTE:
+                wait = max(wait, chat.sent_at[0] + 60.0 - now)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def _requeue(self, key: tuple[Any, ...], message: _PendingMessage) -> None:
+        """Put a rate-limited message back, merging with a newer duplicate."""
+        newer = self._pending.get(key)
+        if newer is not None:
+            newer.count += message.count
+            newer.attempts = message.attempts
+            return
+        assert self._queue is not None
+        try:
+            self._queue.put_nowait(key)
+        except asyncio.QueueFull:
+            logger.warning("Telegram notification queue is full, retry dropped")
+            self.dropped += 1
+            return
+        self._pending[key] = message
+
+    async def _send(self, message: _PendingMessage) -> float | None:
+        """Call sendMessage.
+
+        Returns:
+            Telegram's retry_after in seconds on 429, else None
+        """
+        assert self._client is not None
+        target = message.target
+        # Cut the body, not the repeat note, to fit the length limit
+        note = ""
+        if message.count > 1:
+            note = f"\n\n<i>🔁 Repeated {message.count} times</i>"
+        text = _truncate_html(message.text, MAX_MESSAGE_LENGTH - len(note)) + note
+
+        payload: dict[str, Any] = {
+            "chat_id": target.chat_id,
+            "text": text,
+            "parse_mode": "HTML",
+            "disable_web_page_preview": target.disable_web_page_preview,
+        }
+        if target.thread_id:
+            payload["message_thread_id"] = target.thread_id
+
+        try:
+            response = await self._client.post(
+                f"/bot{target.bot_token}/sendMessage", json=payload
+            )
+        except httpx.TimeoutException:
+            logger.error("Timeout sending Telegram notification")
+            return None
+        except httpx.RequestError as e:
+            logger.error(f"Network error sending Telegram notification: {e}")
+            return None
+
+        if response.status_code == 200:
+            self.sent += 1
+            logger.info(f"Telegram notification sent to chat {target.chat_id}")
+            return None
+
+        if response.status_code == 429:
+            retry_after = 1.0
+            try:
+                retry_after = float(
+                    response.json().get("parameters", {}).get("retry_after", 1)
+                )
+            except ValueError:
+                pass
+            logger.warning(
+                f"Telegram rate limit for chat {target.chat_id}, "
+                f"retrying in {retry_after}s"
+            )
+            return retry_after
+
+        logger.error(
+            f"Failed to send Telegram notification: "
+            f"{response.status_code} - {response.text[:200]}"
+        )
+        return None
@@ -0,0 +1,7 @@
+"""Database benchmarks for shared repositories.
+
+Run from services/shared-python against a throwaway database, e.g.:
+
+    BENCH_DATABASE_URL=postgresql://postgres@localhost/bench \
+        python -m benchmarks.raw_post_ingest
+"""
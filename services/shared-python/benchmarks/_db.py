@@ -0,0 +1,63 @@
+"""Database setup shared by the benchmarks."""
+
+import os
+import sys
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from shared.database import tables
+from shared.database.connection import create_db_engine
+
+# Tables that need extensions (pgvector) not present on a plain server
+_SKIPPED_TABLES = {"documents"}
+
+
+def bench_database_url() -> str:
+    """BENCH_DATABASE_URL, or exit with a usage message."""
+    url = os.environ.get("BENCH_DATABASE_URL", "")
+    if not url:
+        sys.exit(
+            "Set BENCH_DATABASE_URL to a throwaway database "
+            "(its public schema is dropped and recreated)"
+        )
+    return url
+
+
+async def create_bench_engine(**engine_kwargs) -> AsyncEngine:
+    """Engine on a freshly created schema (public and auth are recreated)."""
+    engine = create_db_engine(bench_database_url(), **engine_kwargs)
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP SCHEMA IF EXISTS public CASCADE"))
+        await conn.execute(text("CREATE SCHEMA public"))
+        await conn.execute(text("CREATE SCHEMA IF NOT EXISTS auth"))
+        await conn.execute(
+            text(
+                "CREATE TABLE IF NOT EXISTS auth.users "
+                "(id uuid PRIMARY KEY, email text, raw_user_meta_data jsonb)"
+            )
+        )
+        bench_tables = [
+            table
+            for table in tables.metadata.sorted_tables
+            if table.name not in _SKIPPED_TABLES
+        ]
+        await conn.run_sync(
+            lambda sync_conn: tables.metadata.create_all(sync_conn, tables=bench_tables)
+        )
+    return engine
+
+
+async def timed(
+    label: str, func: Callable[[], Awaitable[object]], repeat: int = 1
+) -> float:
+    """Run func repeat times and print the best wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<48} {best * 1000:10.2f} ms")
+    return best
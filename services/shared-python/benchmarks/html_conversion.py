@@ -0,0 +1,183 @@
+"""HTML to Markdown conversion cost per parser backend.
+
+Builds a corpus shaped like RSS content (full articles with headings, links,
+lists and images; short HTML summaries; plain-text posts) and reports, per
+document kind:
+
+- HTMLToMarkdownConverter.convert as used today (markdownify on
+  BeautifulSoup's html.parser; plain text takes the shortcut);
+- the same markdownify conversion with BeautifulSoup on lxml;
+- parse-only time for html.parser, lxml and selectolax (lexbor), i.e. the
+  floor a parser switch could reach before any Markdown is written.
+
+lxml and selectolax are not dependencies; rows for a missing one are
+skipped.
+
+    python -m benchmarks.html_conversion [documents per kind]
+"""
+
+import random
+import sys
+import time
+from collections.abc import Callable
+from typing import cast
+
+from bs4 import BeautifulSoup
+from markdownify import markdownify as md
+
+from shared.utils.html_converter import HTMLToMarkdownConverter
+
+DEFAULT_DOCUMENTS = 200
+RUNS = 3
+
+_MD_OPTIONS = {
+    "strip": ["script", "style"],
+    "heading_style": "ATX",
+    "bullets": "-",
+    "strong_em_symbol": "**",
+    "escape_asterisks": False,
+    "escape_underscores": False,
+}
+
+_WORDS = (
+    "market update release model feed agent price launch report source "
+    "channel digest summary article research policy user data network"
+).split()
+
+
+def _sentence(rng: random.Random) -> str:
+    words = rng.choices(_WORDS, k=rng.randint(8, 20))
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraph(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(2, 5)):
+        text = _sentence(rng)
+        kind = rng.random()
+        if kind < 0.2:
+            text = f'<a href="https://example.com/{rng.randint(1, 9999)}">{text}</a>'
+        elif kind < 0.3:
+            text = f"<strong>{text}</strong>"
+        elif kind < 0.4:
+            text = f"{text} &mdash; &#8220;quoted&#8221; &amp; more"
+        parts.append(text)
+    return f"<p>{' '.join(parts)}</p>"
+
+
+def article(rng: random.Random) -> str:
+    """Full article as RSS content:encoded carries it (~5-15 KB)."""
+    blocks = [f"<h2>{_sentence(rng)}</h2>"]
+    for _ in range(rng.randint(8, 25)):
+        kind = rng.random()
+        if kind < 0.1:
+            items = "".join(f"<li>{_sentence(rng)}</li>" for _ in range(4))
+            blocks.append(f"<ul>{items}</ul>")
+        elif kind < 0.2:
+            blocks.append(
+                f'<figure><img src="https://example.com/{rng.randint(1, 9999)}.jpg"'
+                f' alt="{_sentence(rng)}"><figcaption>{_sentence(rng)}'
+                "</figcaption></figure>"
+            )
+        elif kind < 0.25:
+            blocks.append(f"<blockquote>{_paragraph(rng)}</blockquote>")
+        else:
+            blocks.append(_paragraph(rng))
+    blocks.append("<script>track();</script><style>p{}</style>")
+    return "\n".join(blocks)
+
+
+def summary(rng: random.Random) -> str:
+    """Short HTML description (~300-800 bytes)."""
+    return _paragraph(rng) + (_paragraph(rng) if rng.random() < 0.5 else "")
+
+
+def plain_text(rng: random.Random) -> str:
+    """Plain-text post (Telegram-style, no markup)."""
+    return "\n\n".join(_sentence(rng) for _ in range(rng.randint(2, 8)))
+
+
+def corpus(documents: int) -> dict[str, list[str]]:
+    """Deterministic corpus, documents per kind."""
+    rng = random.Random(42)
+    return {
+        "article": [article(rng) for _ in range(documents)],
+        "summary": [summary(rng) for _ in range(documents)],
+        "plain text": [plain_text(rng) for _ in range(documents)],
+    }
+
+
+def _markdownify_lxml(html: str) -> str:
+    markdown = cast(str, md(html, bs4_options="lxml", **_MD_OPTIONS))
+    return HTMLToMarkdownConverter._clean_whitespace(markdown)
+
+
+def _parse_html_parser(html: str) -> object:
+    return BeautifulSoup(html, "html.parser")
+
+
+def _parse_lxml(html: str) -> object:
+    return BeautifulSoup(html, "lxml")
+
+
+def _parse_selectolax(html: str) -> object:
+    from selectolax.lexbor import LexborHTMLParser
+
+    return LexborHTMLParser(html).body
+
+
+def _available(module: str) -> bool:
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
+
+
+def candidates() -> dict[str, Callable[[str], object]]:
+    """Conversions and parse-only baselines whose libraries are installed."""
+    result: dict[str, Callable[[str], object]] = {
+        "convert (markdownify, html.parser)": HTMLToMarkdownConverter.convert,
+    }
+    if _available("lxml"):
+        result["markdownify, lxml"] = _markdownify_lxml
+    result["parse only: html.parser"] = _parse_html_parser
+    if _available("lxml"):
+        result["parse only: lxml"] = _parse_lxml
+    if _available("selectolax"):
+        result["parse only: selectolax"] = _parse_selectolax
+    return result
+
+
+def measure(func: Callable[[str], object], documents: list[str]) -> float:
+    """Best per-document time in milliseconds over RUNS passes."""
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        for html in documents:
+            func(html)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000 / len(documents)
+
+
+def main(documents: int) -> None:
+    docs = corpus(documents)
+    for kind, htmls in docs.items():
+        size = sum(len(html) for html in htmls) // len(htmls)
+        print(f"\n{kind}: {len(htmls)} documents, {size} bytes on average")
+        for name, func in candidates().items():
+            print(f"  {name:<40} {measure(func, htmls):8.3f} ms/doc")
+
+    # The lxml backend is only a candidate if it writes the same Markdown
+    if _available("lxml"):
+        differing = sum(
+            HTMLToMarkdownConverter.convert(html) != _markdownify_lxml(html)
+            for htmls in docs.values()
+            for html in htmls
+        )
+        print(f"\nmarkdownify output differs with lxml for {differing} documents")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DOCUMENTS
+    main(count)
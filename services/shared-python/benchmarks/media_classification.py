@@ -0,0 +1,290 @@
+"""Media URL classification cost on a 100-post feed page.
+
+Compares adapt_post_to_v1 and convert_media_urls_to_objects, which now
+share classify_media_url, with the helpers they replaced (copied below as
+_legacy_*). Pages are built like feed pages from the posts table, in
+three shapes:
+
+- string media: media_objects holds plain URL strings, three per post,
+  which adapt_post_to_v1 has to classify;
+- dict media: media_objects is already normalized;
+- media_urls: the raw URL lists convert_media_urls_to_objects gets.
+
+classify_media_url is memoized, so each shape is timed twice: on pages
+with URLs never seen before (cache cleared before every pass), and on the
+same page over and over.
+
+    python -m benchmarks.media_classification [pages]
+"""
+
+import random
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from shared.repositories.post import adapt_post_to_v1
+from shared.utils.media_converter import (
+    classify_media_url,
+    convert_media_urls_to_objects,
+)
+
+DEFAULT_PAGES = 200
+POSTS_PER_PAGE = 100
+MEDIA_PER_POST = 3
+RUNS = 3
+
+_URL_SHAPES = (
+    "https://cdn.example.com/{n}/photo.jpg",
+    "https://cdn.example.com/{n}/image.PNG?width=1200&sig=abc",
+    "https://media.example.org/{n}/clip.mp4",
+    "https://media.example.org/{n}/loop.gif",
+    "https://files.example.net/{n}/report.pdf",
+    "https://www.youtube.com/watch?v={n}",
+    "https://t.me/channel/{n}",
+    "https://img.example.com/media/{n}",
+)
+
+
+# --- Helpers as they were before classify_media_url ---
+
+
+def _legacy_infer_mime_type_from_url(url: str) -> str:
+    url_lower = url.lower()
+    if any(ext in url_lower for ext in [".jpg", ".jpeg"]):
+        return "image/jpeg"
+    if ".png" in url_lower:
+        return "image/png"
+    if ".webp" in url_lower:
+        return "image/webp"
+    if ".gif" in url_lower:
+        return "image/gif"
+    if ".mp4" in url_lower:
+        return "video/mp4"
+    if ".webm" in url_lower:
+        return "video/webm"
+    if ".pdf" in url_lower:
+        return "application/pdf"
+    return "application/octet-stream"
+
+
+def _legacy_infer_media_type_from_url(url: str) -> str:
+    url_lower = url.lower()
+    if any(ext in url_lower for ext in [".mp4", ".webm", ".mov", ".avi"]):
+        return "video"
+    if ".gif" in url_lower:
+        return "animation"
+    if ".pdf" in url_lower:
+        return "document"
+    return "photo"
+
+
+def _legacy_normalize_media_objects(media_objects: list | None) -> list[dict]:
+    if not media_objects:
+        return []
+
+    normalized = []
+    for item in media_objects:
+        if isinstance(item, dict):
+            normalized.append(item)
+        elif isinstance(item, str):
+            media_type = _legacy_infer_media_type_from_url(item)
+            mime_type = _legacy_infer_mime_type_from_url(item)
+            media_obj: dict = {
+                "type": media_type,
+                "url": item,
+                "mime_type": mime_type,
+            }
+            if media_type == "video":
+                media_obj["preview_url"] = item
+            normalized.append(media_obj)
+    return normalized
+
+
+def _legacy_adapt_post_to_v1(post: dict) -> dict:
+    views = post.get("views", {})
+    summary = (
+        views.get("summary") or views.get("ai_generation") or views.get("overview")
+    )
+    return {
+        **post,
+        "full_text": views.get("full_text", ""),
+        "summary": summary,
+        "media_objects": _legacy_normalize_media_objects(post.get("media_objects")),
+    }
+
+
+def _legacy_convert_media_urls_to_objects(
+    media_urls: list[str] | None,
+) -> list[dict[str, Any]]:
+    if not media_urls:
+        return []
+
+    media_objects = []
+
+    for url in media_urls:
+        url_lower = url.lower()
+
+        video_exts = [".mp4", ".webm", ".ogg", ".mov", ".avi", ".mkv"]
+        is_video = any(url_lower.endswith(ext) for ext in video_exts)
+
+        is_embedded = any(
+            domain in url_lower
+            for domain in [
+                "youtube.com",
+                "youtu.be",
+                "vimeo.com",
+                "dailymotion.com",
+            ]
+        )
+
+        if is_video or is_embedded:
+            mime_type = "video/mp4"
+            if url_lower.endswith(".webm"):
+                mime_type = "video/webm"
+            elif url_lower.endswith(".ogg"):
+                mime_type = "video/ogg"
+            elif url_lower.endswith(".mov"):
+                mime_type = "video/quicktime"
+            elif url_lower.endswith(".avi"):
+                mime_type = "video/x-msvideo"
+            elif url_lower.endswith(".mkv"):
+                mime_type = "video/x-matroska"
+
+            media_objects.append(
+                {
+                    "type": "video",
+                    "url": url,
+                    "mime_type": mime_type,
+                    "preview_url": url,
+                    "width": None,
+                    "height": None,
+                    "duration": None,
+                }
+            )
+        else:
+            mime_type = "image/jpeg"
+            if url_lower.endswith(".png"):
+                mime_type = "image/png"
+            elif url_lower.endswith(".gif"):
+                mime_type = "image/gif"
+            elif url_lower.endswith(".webp"):
+                mime_type = "image/webp"
+            elif url_lower.endswith(".svg"):
+                mime_type = "image/svg+xml"
+            elif url_lower.endswith(".bmp"):
+                mime_type = "image/bmp"
+            elif url_lower.endswith(".ico"):
+                mime_type = "image/x-icon"
+
+            media_objects.append(
+                {
+                    "type": "photo",
+                    "url": url,
+                    "mime_type": mime_type,
+                    "width": None,
+                    "height": None,
+                }
+            )
+
+    return media_objects
+
+
+# --- Pages ---
+
+
+def _urls(rng: random.Random) -> list[str]:
+    return [
+        rng.choice(_URL_SHAPES).format(n=rng.getrandbits(48))
+        for _ in range(MEDIA_PER_POST)
+    ]
+
+
+def _post(rng: random.Random, media_objects: list[Any]) -> dict[str, Any]:
+    return {
+        "id": rng.getrandbits(64),
+        "title": "Post title",
+        "views": {"full_text": "Full text " * 50, "summary": "Summary " * 10},
+        "media_objects": media_objects,
+    }
+
+
+def string_media_page(rng: random.Random) -> list[dict[str, Any]]:
+    return [_post(rng, _urls(rng)) for _ in range(POSTS_PER_PAGE)]
+
+
+def dict_media_page(rng: random.Random) -> list[dict[str, Any]]:
+    return [
+        _post(rng, convert_media_urls_to_objects(_urls(rng)))
+        for _ in range(POSTS_PER_PAGE)
+    ]
+
+
+def media_urls_page(rng: random.Random) -> list[list[str]]:
+    return [_urls(rng) for _ in range(POSTS_PER_PAGE)]
+
+
+def measure(func: Callable[[Any], object], pages: list[list[Any]]) -> float:
+    """Best per-page time in milliseconds over RUNS passes.
+
+    The classify_media_url cache is cleared before each pass, so pages with
+    distinct URLs are classified from scratch.
+    """
+    best = float("inf")
+    for _ in range(RUNS):
+        classify_media_url.cache_clear()
+        start = time.perf_counter()
+        for page in pages:
+            for item in page:
+                func(item)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000 / len(pages)
+
+
+def main(page_count: int) -> None:
+    rng = random.Random(42)
+    shapes: dict[
+        str, tuple[Callable[[random.Random], list[Any]], Callable, Callable]
+    ] = {
+        "string media, adapt_post_to_v1": (
+            string_media_page,
+            _legacy_adapt_post_to_v1,
+            adapt_post_to_v1,
+        ),
+        "dict media, adapt_post_to_v1": (
+            dict_media_page,
+            _legacy_adapt_post_to_v1,
+            adapt_post_to_v1,
+        ),
+        "media_urls, convert_media_urls_to_objects": (
+            media_urls_page,
+            _legacy_convert_media_urls_to_objects,
+            convert_media_urls_to_objects,
+        ),
+    }
+    print(f"{POSTS_PER_PAGE} posts per page, {MEDIA_PER_POST} media each")
+    for name, (build, legacy, current) in shapes.items():
+        fresh = [build(rng) for _ in range(page_count)]
+        repeated = fresh[:1] * page_count
+        print(f"\n{name}")
+        for label, pages in (("new URLs", fresh), ("same page", repeated)):
+            before = measure(legacy, pages)
+            after = measure(current, pages)
+            print(
+                f"  {label:<10} before {before:7.3f} ms/page  "
+                f"after {after:7.3f} ms/page  ({before / after:4.1f}x)"
+            )
+
+    # Where the old and new helpers disagree (see test_media_converter.py)
+    page = string_media_page(random.Random(7))
+    differing = sum(
+        _legacy_adapt_post_to_v1(post)["media_objects"]
+        != adapt_post_to_v1(post)["media_objects"]
+        for post in page
+    )
+    print(f"\nadapt_post_to_v1 output changed for {differing}/{len(page)} posts")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PAGES
+    main(count)
@@ -0,0 +1,112 @@
+"""Raw post ingest throughput: multi-row INSERT vs COPY.
+
+Compares the multi-row INSERT ... VALUES path of
+RawPostRepository.batch_create_rss_raw_posts (one statement per
+BULK_INGEST_THRESHOLD posts, the largest batch it still inserts itself)
+with bulk_create_rss_raw_posts (COPY into a staging table, then INSERT ...
+SELECT), which batch_create_* use above that size, and
+bulk_create_telegram_raw_posts.
+
+    BENCH_DATABASE_URL=... python -m benchmarks.raw_post_ingest [rows ...]
+"""
+
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import insert
+
+from benchmarks._db import create_bench_engine
+from shared.database.tables import raw_feeds
+from shared.repositories.raw_post import BULK_INGEST_THRESHOLD, RawPostRepository
+
+DEFAULT_ROW_COUNTS = (1_000, 10_000, 100_000)
+
+
+def rss_posts(raw_feed_id: UUID, count: int, prefix: str) -> list[dict[str, Any]]:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "raw_feed_id": raw_feed_id,
+            "content": "Lorem ipsum dolor sit amet. " * 20,
+            "title": f"Post {i}",
+            "media_objects": [{"type": "photo", "url": f"https://x/{i}.jpg"}],
+            "rp_unique_code": f"{prefix}{i}",
+            "source_url": f"https://example.com/{prefix}{i}",
+            "created_at": now,
+        }
+        for i in range(count)
+    ]
+
+
+def telegram_posts(raw_feed_id: UUID, count: int, chat_id: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "raw_feed_id": raw_feed_id,
+            "content": "Lorem ipsum dolor sit amet. " * 20,
+            "title": "",
+            "media_objects": [],
+            "telegram_message_id": i,
+            "telegram_chat_id": chat_id,
+        }
+        for i in range(count)
+    ]
+
+
+def report(label: str, rows: int, seconds: float) -> None:
+    print(f"{label:<40} {rows:>8} rows {seconds:8.2f} s {rows / seconds:>10.0f} rows/s")
+
+
+async def main(row_counts: tuple[int, ...]) -> None:
+    engine = await create_bench_engine(pool_size=2, max_overflow=0)
+    repository = RawPostRepository()
+    async with engine.begin() as conn:
+        raw_feed_id = (
+            await conn.execute(
+                insert(raw_feeds).values(name="bench").returning(raw_feeds.c.id)
+            )
+        ).scalar_one()
+
+    for count in row_counts:
+        posts = rss_posts(raw_feed_id, count, f"values{count}_")
+        start = time.perf_counter()
+        async with engine.begin() as conn:
+            for offset in range(0, count, BULK_INGEST_THRESHOLD):
+                await repository.batch_create_rss_raw_posts(
+                    conn, posts[offset : offset + BULK_INGEST_THRESHOLD]
+                )
+        report(
+            "batch_create_rss_raw_posts (VALUES)", count, time.perf_counter() - start
+        )
+
+        posts = rss_posts(raw_feed_id, count, f"copy{count}_")
+        start = time.perf_counter()
+        async with engine.begin() as conn:
+            await repository.bulk_create_rss_raw_posts(conn, posts)
+        report("bulk_create_rss_raw_posts (COPY)", count, time.perf_counter() - start)
+
+        posts = telegram_posts(raw_feed_id, count, chat_id=count)
+        start = time.perf_counter()
+        async with engine.begin() as conn:
+            await repository.bulk_create_telegram_raw_posts(conn, posts)
+        report(
+            "bulk_create_telegram_raw_posts (COPY)", count, time.perf_counter() - start
+        )
+
+        # Re-ingesting the same posts only hits ON CONFLICT DO NOTHING
+        start = time.perf_counter()
+        async with engine.begin() as conn:
+            await repository.bulk_create_telegram_raw_posts(conn, posts)
+        report(
+            "  same posts again (all duplicates)", count, time.perf_counter() - start
+        )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    counts = tuple(int(arg) for arg in sys.argv[1:]) or DEFAULT_ROW_COUNTS
+    asyncio.run(main(counts))
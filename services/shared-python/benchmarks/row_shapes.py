@@ -0,0 +1,216 @@
+"""Latency and allocation of the hot repository reads per row shape.
+
+For each query that accepts a ``shape`` argument (see
+shared.repositories.base.shape_rows) this reports the best wall time over
+several runs and the peak Python memory allocated by one call, for dict
+(the default), tuple, Row and a slots record. get_feed_posts_paginated has
+no shape argument and is measured as is.
+
+    BENCH_DATABASE_URL=... python -m benchmarks.row_shapes
+"""
+
+import asyncio
+import time
+import tracemalloc
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import Row, insert, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from benchmarks._db import create_bench_engine
+from shared.database.tables import (
+    feeds,
+    posts,
+    prompts,
+    prompts_raw_feeds,
+    raw_feeds,
+    raw_posts,
+)
+from shared.repositories.base import record_type
+from shared.repositories.post import PostRepository
+from shared.repositories.raw_feed import RawFeedRepository
+from shared.repositories.raw_post import RawPostRepository
+
+RAW_FEEDS = 500
+RAW_POSTS_PER_FEED = 400
+POSTS_PER_FEED = 2_000
+RUNS = 20
+
+SHAPES: dict[str, Any] = {
+    "dict": dict,
+    "tuple": tuple,
+    "Row": Row,
+    "record": None,  # built per query from its columns
+}
+
+
+async def seed(conn: AsyncConnection) -> dict[str, Any]:
+    """Insert the benchmark data set and return ids used by the queries."""
+    now = datetime.now(timezone.utc)
+    telegram_feeds = RAW_FEEDS // 2
+    raw_feed_ids = (
+        (
+            await conn.execute(
+                insert(raw_feeds).returning(raw_feeds.c.id),
+                [
+                    {
+                        "name": f"feed {i}",
+                        "raw_type": "TELEGRAM" if i < telegram_feeds else "RSS",
+                        "telegram_username": f"channel{i}"
+                        if i < telegram_feeds
+                        else None,
+                        "feed_url": None if i < telegram_feeds else f"https://x/{i}",
+                    }
+                    for i in range(RAW_FEEDS)
+                ],
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    rows = [
+        {
+            "raw_feed_id": raw_feed_id,
+            "content": "Lorem ipsum dolor sit amet. " * 20,
+            "title": f"Post {i}",
+            "media_objects": [{"type": "photo", "url": f"https://x/{i}.jpg"}],
+            "rp_unique_code": f"{raw_feed_id}:{i}",
+            "created_at": now - timedelta(minutes=i),
+        }
+        for raw_feed_id in raw_feed_ids[:10]
+        for i in range(RAW_POSTS_PER_FEED)
+    ]
+    await conn.execute(insert(raw_posts), rows)
+
+    feed_id = (
+        await conn.execute(insert(feeds).values(name="bench").returning(feeds.c.id))
+    ).scalar_one()
+    prompt_id = (
+        await conn.execute(
+            insert(prompts).values(prompt={}, feed_id=feed_id).returning(prompts.c.id)
+        )
+    ).scalar_one()
+    await conn.execute(
+        insert(prompts_raw_feeds),
+        [
+            {"prompt_id": prompt_id, "raw_feed_id": raw_feed_id}
+            for raw_feed_id in raw_feed_ids[:10]
+        ],
+    )
+    await conn.execute(
+        insert(posts),
+        [
+            {
+                "feed_id": feed_id,
+                "title": f"Post {i}",
+                "created_at": now - timedelta(minutes=i),
+            }
+            for i in range(POSTS_PER_FEED)
+        ],
+    )
+    await conn.execute(text("ANALYZE"))
+    return {
+        "raw_feed_id": raw_feed_ids[0],
+        "usernames": [f"channel{i}" for i in range(10)],
+        "prompt_id": prompt_id,
+        "feed_id": feed_id,
+        "user_id": uuid.uuid4(),
+        "since": now - timedelta(days=30),
+    }
+
+
+def queries(ids: dict[str, Any]) -> dict[str, Callable[..., Awaitable[Any]]]:
+    """Benchmarked queries; each takes (conn, shape)."""
+    raw_post_repo = RawPostRepository()
+    raw_feed_repo = RawFeedRepository()
+    post_repo = PostRepository()
+    return {
+        "RawPost.get_by_raw_feed (all)": lambda conn, shape: (
+            raw_post_repo.get_by_raw_feed(conn, ids["raw_feed_id"], shape=shape)
+        ),
+        "RawPost.get_by_raw_feed (limit 50)": lambda conn, shape: (
+            raw_post_repo.get_by_raw_feed(
+                conn, ids["raw_feed_id"], limit=50, shape=shape
+            )
+        ),
+        "RawPost.get_by_telegram_usernames": lambda conn, shape: (
+            raw_post_repo.get_by_telegram_usernames(
+                conn, ids["usernames"], limit=200, shape=shape
+            )
+        ),
+        "RawPost.get_raw_posts_by_prompt": lambda conn, shape: (
+            raw_post_repo.get_raw_posts_by_prompt(
+                conn, ids["prompt_id"], ids["since"], shape=shape
+            )
+        ),
+        "RawFeed.get_telegram_channels_for_update": lambda conn, shape: (
+            raw_feed_repo.get_telegram_channels_for_update(conn, shape=shape)
+        ),
+        "RawFeed.get_rss_feeds_for_update": lambda conn, shape: (
+            raw_feed_repo.get_rss_feeds_for_update(conn, shape=shape)
+        ),
+        "Post.get_unseen_posts_for_feed": lambda conn, shape: (
+            post_repo.get_unseen_posts_for_feed(
+                conn, ids["feed_id"], ids["user_id"], shape=shape
+            )
+        ),
+    }
+
+
+async def measure(call: Callable[[], Awaitable[Any]]) -> tuple[float, int, int]:
+    """Best latency (ms), peak allocation (KiB) and row count of call."""
+    rows = await call()  # warm statement caches
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        await call()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    await call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = len(rows) if isinstance(rows, list) else len(rows["posts"])
+    return best * 1000, peak // 1024, count
+
+
+async def main() -> None:
+    engine = await create_bench_engine(pool_size=1, max_overflow=0)
+    async with engine.begin() as conn:
+        ids = await seed(conn)
+
+    print(f"{'query':<44} {'shape':<7} {'rows':>6} {'best ms':>9} {'peak KiB':>9}")
+    async with engine.connect() as conn:
+        for name, query in queries(ids).items():
+            sample = await query(conn, Row)
+            fields = list(sample[0]._fields) if sample else []
+            for shape_name, shape in SHAPES.items():
+                if shape is None:
+                    shape = record_type("BenchRecord", fields)
+                latency, peak, count = await measure(
+                    lambda query=query, shape=shape: query(conn, shape)
+                )
+                print(
+                    f"{name:<44} {shape_name:<7} {count:>6} {latency:>9.2f} {peak:>9}"
+                )
+
+        post_repo = PostRepository()
+        latency, peak, count = await measure(
+            lambda: post_repo.get_feed_posts_paginated(
+                conn, ids["feed_id"], ids["user_id"], limit=20
+            ),
+        )
+        print(
+            f"{'Post.get_feed_posts_paginated (limit 20)':<44} {'dict':<7} "
+            f"{count:>6} {latency:>9.2f} {peak:>9}"
+        )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,9 +1,21 @@
 """Cross-service request context for distributed tracing."""
 
+from shared.context.read_your_writes import (
+    is_primary_sticky,
+    mark_primary_write,
+    primary_sticky_until_ctx_var,
+)
 from shared.context.request_context import (
     get_request_id,
     request_id_ctx_var,
     set_request_id,
 )
 
-__all__ = ["get_request_id", "set_request_id", "request_id_ctx_var"]
+__all__ = [
+    "get_request_id",
+    "set_request_id",
+    "request_id_ctx_var",
+    "is_primary_sticky",
+    "mark_primary_write",
+    "primary_sticky_until_ctx_var",
+]
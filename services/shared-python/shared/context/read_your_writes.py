@@ -0,0 +1,29 @@
+"""Read-your-writes stickiness for read-replica routing."""
+
+import time
+from contextvars import ContextVar
+
+primary_sticky_until_ctx_var: ContextVar[float] = ContextVar(
+    "primary_sticky_until", default=0.0
+)
+
+
+def mark_primary_write(sticky_seconds: float) -> None:
+    """Pin read-only sessions in this context to the primary for a while.
+
+    Called after a write is committed on the primary so that later reads in
+    the same request/handler see it even if the replica lags behind.
+
+    Args:
+        sticky_seconds: How long reads should stay on the primary
+    """
+    primary_sticky_until_ctx_var.set(time.monotonic() + sticky_seconds)
+
+
+def is_primary_sticky() -> bool:
+    """Check whether reads in this context must go to the primary.
+
+    Returns:
+        True if a write was committed in this context within the sticky window
+    """
+    return primary_sticky_until_ctx_var.get() > time.monotonic()
@@ -1,6 +1,7 @@
 """Database utilities: connection pool and table definitions."""
 
 from shared.database.connection import (
+    ReadOnlySession,
     Session,
     SessionMaker,
     create_autocommit_connection,
@@ -26,6 +27,7 @@ from shared.database.tables import (
 
 __all__ = [
     # Connection utilities
+    "ReadOnlySession",
     "Session",
     "SessionMaker",
     "create_autocommit_connection",
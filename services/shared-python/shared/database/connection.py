@@ -1,24 +1,59 @@
 """Database connection utilities for all microservices."""
 
+import asyncio
+import time
+from collections.abc import Callable
 from typing import Any
+from uuid import uuid4
 
+from loguru import logger
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
+from shared.context.read_your_writes import is_primary_sticky, mark_primary_write
+from shared.database.pool_metrics import record_checkout_wait, register_pool
+
 try:
     from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
 except ImportError:
     SQLAlchemyInstrumentor = None  # type: ignore[assignment,misc]
 
+DEFAULT_MAX_REPLICA_LAG_SECONDS = 5.0
+DEFAULT_READ_YOUR_WRITES_SECONDS = 5.0
+DEFAULT_REPLICA_LAG_CHECK_INTERVAL = 5.0
+
+# Postgres assigns a transaction id on the first write, so this is true
+# only for transactions that wrote something
+_TRANSACTION_WROTE_SQL = text("SELECT txid_current_if_assigned() IS NOT NULL")
+
+# Replay lag in seconds; 0 when everything received is replayed (an idle
+# primary would otherwise look like growing lag), NULL when not a standby.
+_REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+""")
+
 
 class Session:
-    """Async database session with automatic commit/rollback."""
+    """Async database session with automatic commit/rollback.
+
+    on_commit, if given, is called after a commit of a transaction that
+    wrote (checked on the server before committing).
+    """
 
-    def __init__(self, db: AsyncEngine) -> None:
+    def __init__(
+        self, db: AsyncEngine, on_commit: Callable[[], None] | None = None
+    ) -> None:
         self._db = db
+        self._on_commit = on_commit
         self.conn: Any = None
 
     async def __aenter__(self):  # type: ignore
+        started = time.perf_counter()
         self.conn = await self._db.connect()
+        record_checkout_wait(self._db, time.perf_counter() - started)
         return self.conn
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):  # type: ignore
@@ -30,23 +65,142 @@ class Session:
                     await self.conn.invalidate()
                     raise
             else:
+                wrote = False
+                if self._on_commit is not None and self.conn.in_transaction():
+                    result = await self.conn.execute(_TRANSACTION_WROTE_SQL)
+                    wrote = bool(result.scalar())
                 await self.conn.commit()
+                if wrote:
+                    self._on_commit()
         finally:
             await self.conn.close()
 
 
-class SessionMaker:
-    """Factory for creating database sessions."""
+class ReadOnlySession(Session):
+    """Session that picks the replica or the primary when entered."""
 
-    def __init__(self, engine: AsyncEngine):
-        self._engine = engine
+    def __init__(self, session_maker: "SessionMaker") -> None:
+        super().__init__(session_maker.engine)
+        self._session_maker = session_maker
+
+    async def __aenter__(self):  # type: ignore
+        self._db = await self._session_maker.get_read_engine()
+        return await super().__aenter__()
 
-    def session(self) -> Session:
-        return Session(self._engine)
 
-    def __call__(self) -> Session:
+class SessionMaker:
+    """Factory for creating database sessions.
+
+    With a replica_engine, session(readonly=True) reads from the replica
+    unless:
+    - this request context committed a write on the primary within the last
+      read_your_writes_seconds (see shared.context.mark_primary_write;
+      read-only primary sessions don't count), or
+    - the replica's replay lag exceeds max_replica_lag_seconds or the lag
+      check fails (checked at most every lag_check_interval seconds).
+    In those cases reads fall back to the primary. Without a replica every
+    session uses the primary.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        replica_engine: AsyncEngine | None = None,
+        max_replica_lag_seconds: float = DEFAULT_MAX_REPLICA_LAG_SECONDS,
+        read_your_writes_seconds: float = DEFAULT_READ_YOUR_WRITES_SECONDS,
+        lag_check_interval: float = DEFAULT_REPLICA_LAG_CHECK_INTERVAL,
+    ):
+        self._engine = engine
+        self._replica_engine = replica_engine
+        self._max_replica_lag = max_replica_lag_seconds
+        self._read_your_writes_seconds = read_your_writes_seconds
+        self._lag_check_interval = lag_check_interval
+
+        self._replica_healthy = True
+        self._replica_lag: float | None = None
+        self._lag_checked_at = float("-inf")
+        self._lag_lock = asyncio.Lock()
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """Primary engine."""
+        return self._engine
+
+    @property
+    def replica_engine(self) -> AsyncEngine | None:
+        """Read-replica engine, if configured."""
+        return self._replica_engine
+
+    @property
+    def replica_lag_seconds(self) -> float | None:
+        """Replay lag from the last check (None if unknown)."""
+        return self._replica_lag
+
+    def session(self, readonly: bool = False) -> Session:
+        """Create a session.
+
+        Args:
+            readonly: Route to the read replica when possible. Only use for
+                sessions that don't write.
+
+        Returns:
+            Session (async context manager yielding an AsyncConnection)
+        """
+        if self._replica_engine is None:
+            return Session(self._engine)
+        if readonly:
+            return ReadOnlySession(self)
+        return Session(self._engine, on_commit=self._on_primary_commit)
+
+    def __call__(self, readonly: bool = False) -> Session:
         """Allow SessionMaker to be called directly to create sessions."""
-        return self.session()
+        return self.session(readonly=readonly)
+
+    async def get_read_engine(self) -> AsyncEngine:
+        """Pick the engine for a read-only session.
+
+        Returns:
+            Replica engine when usable, otherwise the primary engine
+        """
+        if self._replica_engine is None or is_primary_sticky():
+            return self._engine
+
+        if time.monotonic() >= self._lag_checked_at + self._lag_check_interval:
+            await self._check_replica_lag()
+
+        return self._replica_engine if self._replica_healthy else self._engine
+
+    def _on_primary_commit(self) -> None:
+        mark_primary_write(self._read_your_writes_seconds)
+
+    async def _check_replica_lag(self) -> None:
+        """Refresh replica health; concurrent callers keep the last result."""
+        if self._replica_engine is None or self._lag_lock.locked():
+            return
+
+        async with self._lag_lock:
+            lag: float | None = None
+            try:
+                async with self._replica_engine.connect() as conn:
+                    value = (await conn.execute(_REPLICA_LAG_SQL)).scalar()
+                lag = float(value) if value is not None else 0.0
+                healthy = lag <= self._max_replica_lag
+            except Exception as e:
+                logger.warning(f"Replica lag check failed, reading from primary: {e}")
+                healthy = False
+
+            if healthy != self._replica_healthy:
+                if healthy:
+                    logger.info(f"Replica back in use (lag={lag}s)")
+                elif lag is not None:
+                    logger.warning(
+                        f"Replica lag {lag}s over {self._max_replica_lag}s, "
+                        "reading from primary"
+                    )
+
+            self._replica_lag = lag
+            self._replica_healthy = healthy
+            self._lag_checked_at = time.monotonic()
 
 
 async def create_autocommit_connection(engine: AsyncEngine) -> Any:
@@ -83,6 +237,10 @@ def _instrument_engine(
             )
 
 
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+
+
 def create_db_engine(
     database_url: str,
     pool_size: int = 10,
@@ -92,9 +250,27 @@ def create_db_engine(
     echo: bool = False,
     otel_enabled: bool = False,
     trace_sql_enabled: bool = False,
+    prepared_statement_cache_size: int = 500,
+    query_cache_size: int = 1000,
+    pgbouncer: bool = False,
+    pool_pre_ping: bool = True,
+    pool_use_lifo: bool | None = None,
+    pool_name: str = "primary",
 ) -> AsyncEngine:
     """Create AsyncEngine with configurable pool settings.
 
+    Connections are pinged on checkout (pool_pre_ping) and recycled after
+    pool_recycle seconds. A LIFO pool (pool_use_lifo) lets surplus
+    connections sit idle and get recycled rather than being kept warm
+    round-robin. It is on by default only with pgbouncer; direct
+    connections keep SQLAlchemy's FIFO pool unless asked.
+
+    With pgbouncer=True (PgBouncer in transaction pooling mode) statement
+    caches are disabled and prepared statements get unique names, since
+    consecutive transactions may run on different server connections. The
+    pre-ping is skipped there: the client connection is to PgBouncer, which
+    checks its own server connections.
+
     Args:
         database_url: PostgreSQL connection string
         pool_size: Base connections in pool
@@ -104,6 +280,14 @@ def create_db_engine(
         echo: Log SQL queries
         otel_enabled: Enable OpenTelemetry instrumentation
         trace_sql_enabled: Enable SQL tracing
+        prepared_statement_cache_size: asyncpg prepared statements kept per
+            connection (0 disables server-side statement reuse)
+        query_cache_size: SQLAlchemy compiled statement cache entries
+        pgbouncer: Connect through PgBouncer in transaction pooling mode
+        pool_pre_ping: Ping connections on checkout (ignored with pgbouncer)
+        pool_use_lifo: Hand out the most recently returned connection first
+            (None: only with pgbouncer; otherwise FIFO as before)
+        pool_name: Label for pool metrics (see shared.database.pool_metrics)
 
     Returns:
         Configured AsyncEngine
@@ -111,6 +295,16 @@ def create_db_engine(
     if database_url.startswith("postgresql://"):
         database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
 
+    connect_args: dict[str, Any] = {
+        "prepared_statement_cache_size": prepared_statement_cache_size
+    }
+    if pgbouncer:
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": _unique_statement_name,
+        }
+
     engine = create_async_engine(
         database_url,
         echo=echo,
@@ -118,16 +312,30 @@ def create_db_engine(
         max_overflow=max_overflow,
         pool_timeout=pool_timeout,
         pool_recycle=pool_recycle,
-        pool_pre_ping=True,
+        pool_pre_ping=pool_pre_ping and not pgbouncer,
+        pool_use_lifo=pgbouncer if pool_use_lifo is None else pool_use_lifo,
+        query_cache_size=query_cache_size,
+        connect_args=connect_args,
     )
 
+    register_pool(engine, pool_name, pool_size + max_overflow)
     _instrument_engine(engine, otel_enabled, trace_sql_enabled)
     return engine
 
 
-def create_session_maker(engine: AsyncEngine) -> SessionMaker:
-    """Create a SessionMaker for the given engine."""
-    return SessionMaker(engine)
+def create_session_maker(
+    engine: AsyncEngine,
+    replica_engine: AsyncEngine | None = None,
+    max_replica_lag_seconds: float = DEFAULT_MAX_REPLICA_LAG_SECONDS,
+    read_your_writes_seconds: float = DEFAULT_READ_YOUR_WRITES_SECONDS,
+) -> SessionMaker:
+    """Create a SessionMaker for the given engine (and optional read replica)."""
+    return SessionMaker(
+        engine,
+        replica_engine=replica_engine,
+        max_replica_lag_seconds=max_replica_lag_seconds,
+        read_your_writes_seconds=read_your_writes_seconds,
+    )
 
 
 # Compatibility exports
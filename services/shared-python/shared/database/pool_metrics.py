@@ -0,0 +1,107 @@
+"""OpenTelemetry metrics for SQLAlchemy connection pools.
+
+Postgres max_connections=100 is shared by every service, so pool sizes
+should come from observed usage. Each engine created by create_db_engine is
+registered here under a pool name and exported as:
+
+- db_pool_connections{pool,state}: checked_out / idle / overflow connections
+- db_pool_saturation{pool}: checked_out / (pool_size + max_overflow)
+- db_pool_checkout_seconds{pool}: time spent waiting for a connection
+  (recorded by Session, i.e. SessionMaker users)
+
+Instruments are created lazily so the service's MeterProvider is installed
+first.
+"""
+
+from functools import lru_cache
+from weakref import WeakKeyDictionary
+
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import Pool
+
+# pool -> (name, capacity)
+_pools: "WeakKeyDictionary[Pool, tuple[str, int]]" = WeakKeyDictionary()
+
+
+def _get_meter() -> metrics.Meter:
+    return metrics.get_meter(__name__)
+
+
+@lru_cache(maxsize=1)
+def _checkout_histogram() -> metrics.Histogram:
+    return _get_meter().create_histogram(
+        name="db_pool_checkout_seconds",
+        description="Time spent waiting for a pooled database connection",
+        unit="s",
+    )
+
+
+def _observe_connections(_options: CallbackOptions) -> list[Observation]:
+    observations = []
+    for pool, (name, _capacity) in list(_pools.items()):
+        checked_out = pool.checkedout()  # type: ignore[attr-defined]
+        observations.append(
+            Observation(checked_out, {"pool": name, "state": "checked_out"})
+        )
+        observations.append(
+            Observation(pool.checkedin(), {"pool": name, "state": "idle"})  # type: ignore[attr-defined]
+        )
+        observations.append(
+            Observation(
+                max(pool.overflow(), 0),  # type: ignore[attr-defined]
+                {"pool": name, "state": "overflow"},
+            )
+        )
+    return observations
+
+
+def _observe_saturation(_options: CallbackOptions) -> list[Observation]:
+    return [
+        Observation(pool.checkedout() / capacity, {"pool": name})  # type: ignore[attr-defined]
+        for pool, (name, capacity) in list(_pools.items())
+        if capacity > 0
+    ]
+
+
+@lru_cache(maxsize=1)
+def _register_gauges() -> None:
+    meter = _get_meter()
+    meter.create_observable_gauge(
+        name="db_pool_connections",
+        callbacks=[_observe_connections],
+        description="Pooled database connections, labeled by pool and state",
+        unit="1",
+    )
+    meter.create_observable_gauge(
+        name="db_pool_saturation",
+        callbacks=[_observe_saturation],
+        description="Checked-out connections as a fraction of pool_size + max_overflow",
+        unit="1",
+    )
+
+
+def register_pool(engine: AsyncEngine, name: str, capacity: int) -> None:
+    """Export pool usage metrics for an engine.
+
+    Args:
+        engine: Engine whose pool to observe
+        name: Pool label (e.g. "primary", "replica")
+        capacity: pool_size + max_overflow
+    """
+    _pools[engine.pool] = (name, capacity)
+    _register_gauges()
+
+
+def record_checkout_wait(engine: AsyncEngine, seconds: float) -> None:
+    """Record how long a session waited for a connection.
+
+    Args:
+        engine: Engine the connection came from
+        seconds: Wait time in seconds
+    """
+    entry = _pools.get(engine.pool)
+    if entry is None:
+        return
+    _checkout_histogram().record(seconds, {"pool": entry[0]})
@@ -155,6 +155,7 @@ chats_messages = sa.Table(
     sa.Column("message", sa.Text, nullable=False),
     sa.Column("type", message_type_enum, nullable=False),
     sa.Column("sequence", sa.BigInteger, nullable=False),
+    sa.Index("ix_chats_messages_sequence", "chat_id", "sequence"),
 )
 
 feeds = sa.Table(
@@ -187,6 +188,12 @@ feeds = sa.Table(
         nullable=True,
         unique=True,
     ),
+    sa.Index(
+        "ix_feeds_tags_marketplace",
+        "tags",
+        postgresql_using="gin",
+        postgresql_where=sa.text("is_marketplace = true"),
+    ),
 )
 
 tags = sa.Table(
@@ -333,6 +340,12 @@ posts = sa.Table(
         nullable=False,
         server_default=sa.text("'[]'::jsonb"),
     ),
+    sa.Index(
+        "ix_posts_feed_id_created_at_id",
+        "feed_id",
+        sa.text("created_at DESC"),
+        sa.text("id DESC"),
+    ),
 )
 
 posts_seen = sa.Table(
@@ -441,6 +454,33 @@ prompts = sa.Table(
         server_default="[]",
         comment="AI-transformed filter configs: [{name: {en, ru}, prompt}]",
     ),
+    sa.Column(
+        "next_run_at",
+        sa.DateTime(timezone=True),
+        nullable=True,
+        comment="Next background run: last_execution + interval (2 min SINGLE_POST, digest_interval_hours DIGEST). NULL means never run.",
+    ),
+    sa.Column(
+        "digest_scheduled_at",
+        sa.DateTime(timezone=True),
+        nullable=True,
+        comment="Run time of the pending scheduled digest message (after shaping). Only for DIGEST type.",
+    ),
+    sa.Index(
+        "ix_prompts_next_run_at_single_post",
+        sa.text("next_run_at ASC NULLS FIRST"),
+        postgresql_where=sa.text("feed_type = 'SINGLE_POST'"),
+    ),
+    sa.Index(
+        "ix_prompts_next_run_at_digest",
+        sa.text("next_run_at ASC NULLS FIRST"),
+        postgresql_where=sa.text("feed_type = 'DIGEST'"),
+    ),
+    sa.Index(
+        "ix_prompts_digest_scheduled_at",
+        "digest_scheduled_at",
+        postgresql_where=sa.text("feed_type = 'DIGEST'"),
+    ),
 )
 
 raw_feeds = sa.Table(
@@ -566,6 +606,14 @@ raw_posts = sa.Table(
         server_default=sa.text("'[]'::jsonb"),
     ),
     sa.Index("idx_raw_posts_moderation_action", "moderation_action"),
+    sa.Index(
+        "ix_raw_posts_raw_feed_id_created_at_visible",
+        "raw_feed_id",
+        sa.text("created_at DESC"),
+        postgresql_where=sa.text(
+            "moderation_action IS NULL OR moderation_action != 'block'"
+        ),
+    ),
 )
 
 prompts_raw_feeds = sa.Table(
@@ -1,9 +1,11 @@
 """NATS event schemas for inter-service communication."""
 
+from shared.events.cache_invalidated import CacheInvalidatedEvent
 from shared.events.digest_scheduled import DigestScheduledEvent
 from shared.events.feed_created import FeedCreatedEvent
 from shared.events.feed_initial_sync import FeedInitialSyncEvent
 from shared.events.post_created import PostCreatedEvent
+from shared.events.pricing_updated import PricingUpdatedEvent
 from shared.events.raw_post_created import RawPostCreatedEvent
 from shared.events.source_validation import (
     TelegramValidationRequest,
@@ -25,10 +27,12 @@ from shared.events.telegram_operations import (
 )
 
 __all__ = [
+    "CacheInvalidatedEvent",
     "DigestScheduledEvent",
     "FeedCreatedEvent",
     "FeedInitialSyncEvent",
     "PostCreatedEvent",
+    "PricingUpdatedEvent",
     "RawPostCreatedEvent",
     "TelegramValidationRequest",
     "TelegramValidationResponse",
@@ -0,0 +1,34 @@
+"""Event schema for reference cache invalidation."""
+
+from datetime import UTC, datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class CacheInvalidatedEvent(BaseModel):
+    """Event published after an admin write to cached reference data.
+
+    Sent over core NATS (not JetStream) so every running process receives it
+    and drops its local copy.
+
+    Published by:
+        - go-api admin handlers after tag and suggestion writes
+        - MarketplaceRepository.set_marketplace_feeds (when given a client)
+
+    Subscription plans and prompt examples have no writer in the services
+    (they change through migrations); their caches expire by TTL.
+
+    Consumed by:
+        - agents (shared.nats.apply_cache_invalidation)
+    """
+
+    event_type: Literal["cache.invalidated"] = "cache.invalidated"
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+    cache: str | None = Field(
+        default=None, description="Cache name to invalidate; None means all caches"
+    )
+    key: str | None = Field(
+        default=None, description="Key to drop; None clears the whole cache"
+    )
@@ -0,0 +1,32 @@
+"""Event schema for LLM pricing changes."""
+
+from datetime import UTC, datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class PricingUpdatedEvent(BaseModel):
+    """Event published after LLM model prices changed in the database.
+
+    Sent over core NATS (not JetStream) so every running process receives it
+    and reloads its pricing snapshot.
+
+    Published by:
+        - go-registry LLMSyncService (after a sync run that added models or
+          changed prices, when NATS_URL is set)
+
+    Consumed by:
+        - shared.services.PricingReloader (agents service)
+    """
+
+    event_type: Literal["pricing.updated"] = "pricing.updated"
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+    model_ids: list[str] = Field(
+        default_factory=list,
+        description="OpenRouter model IDs whose prices changed; empty means unknown",
+    )
+    added_model_ids: list[str] = Field(
+        default_factory=list, description="OpenRouter model IDs added to llm_models"
+    )
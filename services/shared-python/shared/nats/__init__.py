@@ -1,5 +1,11 @@
 """NATS JetStream client utilities."""
 
+from shared.nats.cache_invalidation import (
+    CACHE_INVALIDATE_SUBJECT,
+    apply_cache_invalidation,
+    publish_cache_invalidation,
+    publish_cache_invalidation_on_commit,
+)
 from shared.nats.client import NATSClientManager, nats_client
 from shared.nats.logging import (
     NATSLogContext,
@@ -14,6 +20,11 @@ from shared.nats.logging import (
     log_rpc_timeout,
     nats_timing,
 )
+from shared.nats.pricing_updates import (
+    PRICING_UPDATED_SUBJECT,
+    publish_pricing_updated,
+    subscribe_pricing_updated,
+)
 from shared.nats.publisher import JetStreamPublisher, create_publisher
 from shared.nats.request_reply import (
     RequestReplyClient,
@@ -35,6 +46,13 @@ __all__ = [
     "RequestReplyHandler",
     "create_request_client",
     "create_request_handler",
+    "CACHE_INVALIDATE_SUBJECT",
+    "apply_cache_invalidation",
+    "publish_cache_invalidation",
+    "publish_cache_invalidation_on_commit",
+    "PRICING_UPDATED_SUBJECT",
+    "publish_pricing_updated",
+    "subscribe_pricing_updated",
     # Logging utilities
     "NATSLogContext",
     "nats_timing",
@@ -0,0 +1,98 @@
+"""Reference cache invalidation over core NATS."""
+
+import asyncio
+from weakref import WeakKeyDictionary, WeakSet
+
+from loguru import logger
+from nats.aio.client import Client as NATSClient
+from sqlalchemy import Connection, event
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from shared.events.cache_invalidated import CacheInvalidatedEvent
+from shared.utils.ttl_cache import invalidate_cache
+
+CACHE_INVALIDATE_SUBJECT = "cache.invalidate"
+
+# Caches written in a connection's open transaction, published on commit
+_pending: "WeakKeyDictionary[Connection, set[str]]" = WeakKeyDictionary()
+_clients: "WeakKeyDictionary[Connection, NATSClient]" = WeakKeyDictionary()
+_hooked: "WeakSet[Connection]" = WeakSet()
+_publish_tasks: set[asyncio.Task[None]] = set()
+
+
+async def publish_cache_invalidation(
+    nc: NATSClient, cache: str | None = None, key: str | None = None
+) -> None:
+    """Tell every process to drop cached reference data.
+
+    Args:
+        nc: Connected NATS client
+        cache: Cache name (e.g. "tags"); None invalidates all caches
+        key: Key to drop; None clears the whole cache
+    """
+    event = CacheInvalidatedEvent(cache=cache, key=key)
+    await nc.publish(CACHE_INVALIDATE_SUBJECT, event.model_dump_json().encode())
+    # Apply locally right away instead of waiting for our own message
+    invalidate_cache(cache, key)
+
+
+def publish_cache_invalidation_on_commit(
+    nc: NATSClient, conn: AsyncConnection, cache: str
+) -> None:
+    """Publish cache.invalidate for cache once the transaction commits.
+
+    Publishing earlier would let other processes reload the old rows before
+    the write is visible. Calls within one transaction are merged per cache;
+    if the transaction rolls back nothing is published.
+
+    Args:
+        nc: Connected NATS client
+        conn: Connection holding the write
+        cache: Name of the cache to invalidate
+    """
+    sync_conn = conn.sync_connection
+    if sync_conn is None:
+        return
+
+    _clients[sync_conn] = nc
+    _pending.setdefault(sync_conn, set()).add(cache)
+    if sync_conn not in _hooked:
+        _hooked.add(sync_conn)
+        event.listen(sync_conn, "commit", _on_commit)
+        event.listen(sync_conn, "rollback", _on_rollback)
+
+
+def _on_commit(conn: Connection) -> None:
+    caches = _pending.pop(conn, None)
+    nc = _clients.get(conn)
+    if not caches or nc is None:
+        return
+    for cache in sorted(caches):
+        task = asyncio.get_running_loop().create_task(_publish_safely(nc, cache))
+        _publish_tasks.add(task)
+        task.add_done_callback(_publish_tasks.discard)
+
+
+def _on_rollback(conn: Connection) -> None:
+    _pending.pop(conn, None)
+
+
+async def _publish_safely(nc: NATSClient, cache: str) -> None:
+    try:
+        await publish_cache_invalidation(nc, cache)
+    except Exception as e:
+        # Other processes still pick the change up when the TTL expires
+        invalidate_cache(cache)
+        logger.warning(f"Failed to publish {CACHE_INVALIDATE_SUBJECT}: {e}")
+
+
+def apply_cache_invalidation(event: CacheInvalidatedEvent) -> None:
+    """Drop what a received cache.invalidate event names.
+
+    Services subscribe to CACHE_INVALIDATE_SUBJECT without a queue group (so
+    every replica gets each event) and call this from the handler.
+
+    Args:
+        event: Received event
+    """
+    invalidate_cache(event.cache, event.key)
@@ -0,0 +1,63 @@
+"""LLM pricing change notifications over core NATS."""
+
+from collections.abc import Callable
+
+from loguru import logger
+from nats.aio.client import Client as NATSClient
+from nats.aio.msg import Msg
+from nats.aio.subscription import Subscription
+
+from shared.events.pricing_updated import PricingUpdatedEvent
+
+PRICING_UPDATED_SUBJECT = "pricing.updated"
+
+
+async def publish_pricing_updated(
+    nc: NATSClient,
+    model_ids: list[str] | None = None,
+    added_model_ids: list[str] | None = None,
+) -> None:
+    """Tell every process that LLM prices changed.
+
+    Args:
+        nc: Connected NATS client
+        model_ids: Models whose prices changed (None/empty if unknown)
+        added_model_ids: Models that were added
+    """
+    update = PricingUpdatedEvent(
+        model_ids=model_ids or [], added_model_ids=added_model_ids or []
+    )
+    await nc.publish(PRICING_UPDATED_SUBJECT, update.model_dump_json().encode())
+    logger.debug(
+        f"Published {PRICING_UPDATED_SUBJECT} ({len(update.model_ids)} changed, "
+        f"{len(update.added_model_ids)} added)"
+    )
+
+
+async def subscribe_pricing_updated(
+    nc: NATSClient, on_update: Callable[[PricingUpdatedEvent], None]
+) -> Subscription:
+    """Subscribe this process to pricing change events.
+
+    Uses a plain (non-queue) subscription so that every replica gets each
+    event.
+
+    Args:
+        nc: Connected NATS client
+        on_update: Called with each event (e.g. PricingReloader.request_reload)
+
+    Returns:
+        Subscription (unsubscribe on shutdown, or let drain() close it)
+    """
+
+    async def _handle(msg: Msg) -> None:
+        try:
+            update = PricingUpdatedEvent.model_validate_json(msg.data)
+        except Exception as e:
+            logger.warning(f"Invalid pricing update message: {e}")
+            return
+        on_update(update)
+
+    subscription = await nc.subscribe(PRICING_UPDATED_SUBJECT, cb=_handle)
+    logger.info(f"Subscribed to {PRICING_UPDATED_SUBJECT}")
+    return subscription
@@ -3,6 +3,7 @@
 All repositories use SQLAlchemy Core and work with AsyncConnection.
 """
 
+from shared.repositories.base import RowShape, record_type, shape_rows
 from shared.repositories.chat import ChatRepository
 from shared.repositories.device_token import DeviceTokenRepository
 from shared.repositories.feed import FeedRepository
@@ -18,6 +19,7 @@ from shared.repositories.prompt_raw_feed_offset import (
 )
 from shared.repositories.raw_feed import RawFeedRepository
 from shared.repositories.raw_post import RawPostRepository
+from shared.repositories.retention import RetentionRepository
 from shared.repositories.source import SourceRepository
 from shared.repositories.subscription import SubscriptionRepository
 from shared.repositories.suggestion import SuggestionRepository
@@ -40,6 +42,7 @@ __all__ = [
     "PromptRawFeedOffsetRepository",
     "RawFeedRepository",
     "RawPostRepository",
+    "RetentionRepository",
     "SourceRepository",
     "SubscriptionRepository",
     "SuggestionRepository",
@@ -47,4 +50,8 @@ __all__ = [
     "TelegramUserRepository",
     "UserRepository",
     "UserTagRepository",
+    # Result shaping helpers
+    "RowShape",
+    "record_type",
+    "shape_rows",
 ]
@@ -0,0 +1,57 @@
+"""Shared helpers for repository result shaping.
+
+Repositories return ``list[dict]`` by default. Hot scans accept a ``shape``
+argument so callers that only read a few fields can skip building a dict
+per row:
+
+- ``dict`` (default): ``dict(row._mapping)``, the historical format
+- ``tuple``: plain tuples in SELECT column order
+- ``Row``: SQLAlchemy rows as returned by the driver (attribute access, no copy)
+- any record class built with :func:`record_type` (or any callable taking
+  the row values positionally, e.g. a NamedTuple)
+
+Statements used by hot paths are built once at module import (module-level
+``text()`` / Core constants), so only parameters change per call and
+SQLAlchemy's compiled cache plus asyncpg's prepared statement cache
+(see ``create_db_engine``) are hit on every execution.
+"""
+
+from collections.abc import Callable, Iterable
+from dataclasses import make_dataclass
+from typing import Any
+
+from sqlalchemy import Row
+
+RowShape = type[dict] | type[tuple] | type[Row] | Callable[..., Any]
+
+
+def shape_rows(rows: Iterable[Row[Any]], shape: RowShape = dict) -> list[Any]:
+    """Convert result rows into the requested shape.
+
+    Args:
+        rows: Rows from ``result.fetchall()`` (or the result itself)
+        shape: dict, tuple, Row or a record class called with row values
+
+    Returns:
+        List of rows in the requested shape
+    """
+    if shape is dict:
+        return [dict(row._mapping) for row in rows]
+    if shape is Row:
+        return list(rows)
+    if shape is tuple:
+        return [tuple(row) for row in rows]
+    return [shape(*row) for row in rows]
+
+
+def record_type(name: str, fields: Iterable[str]) -> type:
+    """Create a frozen ``__slots__`` record class for :func:`shape_rows`.
+
+    Args:
+        name: Class name
+        fields: Field names in SELECT column order
+
+    Returns:
+        Dataclass with slots, constructed positionally from row values
+    """
+    return make_dataclass(name, list(fields), frozen=True, slots=True)
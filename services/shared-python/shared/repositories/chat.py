@@ -7,6 +7,51 @@ from sqlalchemy.ext.asyncio import AsyncConnection
 
 from shared.database.tables import chats, chats_messages, pre_prompts
 
+# Number of most recent messages returned with a chat (and per older page)
+CHAT_HISTORY_LIMIT = 15
+
+# Latest messages come from a LATERAL subquery that walks
+# ix_chats_messages_sequence (chat_id, sequence) backwards and stops after
+# :history_limit rows, so long chats don't ship their whole history.
+_CHAT_WITH_HISTORY_SQL = text("""
+    SELECT
+        chats.id as chat_id,
+        chats.user_id,
+        chats.pre_prompt_id,
+        pre_prompts.prompt,
+        pre_prompts.sources,
+        pre_prompts.source_types,
+        pre_prompts.type,
+        pre_prompts.suggestions,
+        pre_prompts.is_ready_to_create_feed,
+        pre_prompts.filters,
+        pre_prompts.filter_ads,
+        pre_prompts.filter_duplicates,
+        COALESCE(history.messages, '[]'::jsonb) AS messages
+    FROM chats
+    JOIN pre_prompts ON pre_prompts.id = chats.pre_prompt_id
+    CROSS JOIN LATERAL (
+        SELECT
+            jsonb_agg(
+                jsonb_build_object(
+                    'message', recent.message,
+                    'type', recent.type,
+                    'created_at', recent.created_at,
+                    'sequence', recent.sequence
+                )
+                ORDER BY recent.sequence DESC
+            ) AS messages
+        FROM (
+            SELECT message, type, created_at, sequence
+            FROM chats_messages
+            WHERE chats_messages.chat_id = chats.id
+            ORDER BY sequence DESC
+            LIMIT :history_limit
+        ) recent
+    ) history
+    WHERE chats.id = :chat_id
+""")
+
 
 class ChatRepository:
     async def create_chat(self, conn: AsyncConnection, user_id: UUID) -> dict[str, Any]:
@@ -130,78 +175,72 @@ class ChatRepository:
         return dict(row._mapping)
 
     async def get_chat_with_pre_prompt_and_history(
-        self, conn: AsyncConnection, chat_id: UUID
+        self,
+        conn: AsyncConnection,
+        chat_id: UUID,
+        history_limit: int = CHAT_HISTORY_LIMIT,
     ) -> dict[str, Any]:
         """Get chat data with pre_prompt info and recent message history.
 
         Args:
             conn: Database connection
             chat_id: ID of the chat
+            history_limit: Number of most recent messages to include
 
         Returns:
             Dictionary containing chat, pre_prompt data, and recent messages
+            (newest first). Older messages can be paged with
+            get_chat_messages_before using the last message's sequence.
 
         Raises:
             ValueError: If chat not found
         """
-        query = text("""
-            SELECT
-                chats.id as chat_id,
-                chats.user_id,
-                chats.pre_prompt_id,
-                pre_prompts.prompt,
-                pre_prompts.sources,
-                pre_prompts.source_types,
-                pre_prompts.type,
-                pre_prompts.suggestions,
-                pre_prompts.is_ready_to_create_feed,
-                pre_prompts.filters,
-                pre_prompts.filter_ads,
-                pre_prompts.filter_duplicates,
-                COALESCE(
-                    jsonb_agg(
-                        jsonb_build_object(
-                            'message', chats_messages.message,
-                            'type', chats_messages.type,
-                            'created_at', chats_messages.created_at,
-                            'sequence', chats_messages.sequence
-                        )
-                        ORDER BY chats_messages.sequence DESC
-                    ) FILTER (WHERE chats_messages.id IS NOT NULL),
-                    '[]'::jsonb
-                ) AS messages
-            FROM chats
-            JOIN pre_prompts ON pre_prompts.id = chats.pre_prompt_id
-            LEFT JOIN chats_messages ON chats_messages.chat_id = chats.id
-            WHERE chats.id = :chat_id
-            GROUP BY
-                chats.id,
-                chats.user_id,
-                chats.pre_prompt_id,
-                pre_prompts.prompt,
-                pre_prompts.sources,
-                pre_prompts.source_types,
-                pre_prompts.type,
-                pre_prompts.suggestions,
-                pre_prompts.is_ready_to_create_feed,
-                pre_prompts.filters,
-                pre_prompts.filter_ads,
-                pre_prompts.filter_duplicates
-        """)
-
-        result = await conn.execute(query, {"chat_id": chat_id})
+        result = await conn.execute(
+            _CHAT_WITH_HISTORY_SQL,
+            {"chat_id": chat_id, "history_limit": history_limit},
+        )
         row = result.fetchone()
 
         if not row:
             raise ValueError(f"Chat with id {chat_id} not found")
 
-        data = dict(row._mapping)
+        return dict(row._mapping)
+
+    async def get_chat_messages_before(
+        self,
+        conn: AsyncConnection,
+        chat_id: UUID,
+        before_sequence: int,
+        limit: int = CHAT_HISTORY_LIMIT,
+    ) -> list[dict[str, Any]]:
+        """Get a page of older chat messages by keyset on sequence.
 
-        messages = data.get("messages", [])
-        if messages and len(messages) > 15:
-            data["messages"] = messages[:15]
+        Args:
+            conn: Database connection
+            chat_id: ID of the chat
+            before_sequence: Return messages with sequence lower than this
+                (the oldest sequence the client already has)
+            limit: Page size
 
-        return data
+        Returns:
+            List of messages (message, type, created_at, sequence), newest first
+        """
+        query = (
+            select(
+                chats_messages.c.message,
+                chats_messages.c.type,
+                chats_messages.c.created_at,
+                chats_messages.c.sequence,
+            )
+            .where(
+                chats_messages.c.chat_id == chat_id,
+                chats_messages.c.sequence < before_sequence,
+            )
+            .order_by(chats_messages.c.sequence.desc())
+            .limit(limit)
+        )
+        result = await conn.execute(query)
+        return [dict(row._mapping) for row in result.fetchall()]
 
     async def insert_chat_message(
         self,
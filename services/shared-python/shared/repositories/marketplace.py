@@ -3,10 +3,55 @@
 from typing import Any
 from uuid import UUID
 
+from nats.aio.client import Client as NATSClient
 from sqlalchemy import text, update
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from shared.database.tables import feeds
+from shared.nats.cache_invalidation import publish_cache_invalidation_on_commit
+from shared.utils.ttl_cache import get_cache
+
+# Per-tag-set cache of marketplace_catalog rows, shared by all users with the
+# same tags. Cleared when this process refreshes the catalog; other processes
+# drop it on the "marketplace_catalog" invalidation published by
+# set_marketplace_feeds, or after the TTL.
+MARKETPLACE_CATALOG_CACHE = "marketplace_catalog"
+CATALOG_CACHE_TTL_SECONDS = 60.0
+
+_catalog_cache = get_cache(
+    MARKETPLACE_CATALOG_CACHE, ttl_seconds=CATALOG_CACHE_TTL_SECONDS
+)
+
+_USER_MARKETPLACE_CONTEXT_SQL = text("""
+    SELECT
+        (
+            SELECT COALESCE(array_agg(t.name), '{}')
+            FROM users_tags ut
+            JOIN tags t ON t.id = ut.tag_id
+            WHERE ut.user_id = :user_id
+        ) AS tags,
+        (
+            SELECT COALESCE(array_agg(uf.feed_id), '{}')
+            FROM users_feeds uf
+            WHERE uf.user_id = :user_id
+        ) AS feed_ids
+""")
+
+# marketplace_catalog only holds owner metadata; name, tags and
+# is_marketplace are read from feeds, which go-api updates without
+# refreshing the view. The tag overlap uses ix_feeds_tags_marketplace.
+_CATALOG_BY_TAGS_SQL = text("""
+    SELECT c.feed_id, f.name, f.tags, c.user_id, c.picture, c.full_name
+    FROM marketplace_catalog c
+    JOIN feeds f ON f.id = c.feed_id
+    WHERE f.is_marketplace = true
+      AND f.tags && CAST(:tags AS text[])
+    ORDER BY c.feed_id
+""")
+
+_REFRESH_CATALOG_SQL = text(
+    "REFRESH MATERIALIZED VIEW CONCURRENTLY marketplace_catalog"
+)
 
 
 class MarketplaceRepository:
@@ -19,72 +64,72 @@ class MarketplaceRepository:
 
         Returns only feeds that have at least one tag matching the user's tags.
 
+        Owner metadata comes from the precomputed marketplace_catalog view,
+        joined to the live feeds rows for name, tags and is_marketplace.
+        Results are cached per tag set; the user's own subscriptions are
+        filtered out afterwards.
+
         Args:
             conn: Database connection
             user_id: User ID to filter by tags and exclude from marketplace
 
         Returns:
             List of marketplace feed data matching user's tags
+        """
+        result = await conn.execute(_USER_MARKETPLACE_CONTEXT_SQL, {"user_id": user_id})
+        context = result.one()
+
+        if not context.tags:
+            return []
+
+        subscribed = set(context.feed_ids)
+        catalog = await self._get_catalog_by_tags(conn, context.tags)
 
-        Note:
-            Refactored to use parameterized query (bindparam) instead of f-string
-            to prevent SQL injection vulnerabilities (Semgrep CWE-89).
-            Updated to filter feeds by user's tags using PostgreSQL array overlap operator (&&).
+        return [dict(row) for row in catalog if row["feed_id"] not in subscribed]
+
+    async def refresh_marketplace_catalog(self, conn: AsyncConnection) -> None:
+        """Rebuild the marketplace_catalog view and drop cached tag lookups.
+
+        Needed when the set of marketplace feeds or their owners changes;
+        renames and retags are read from feeds directly. Besides
+        set_marketplace_feeds, MarketplaceCatalogRefresher calls it
+        periodically for changes made elsewhere (go-api subscriptions).
+        Uses REFRESH ... CONCURRENTLY so readers are not blocked.
+
+        Args:
+            conn: Database connection
         """
-        # List of excluded user IDs (hardcoded as in n8n workflow)
-        excluded_user_ids = [
-            "19e01875-c620-4292-aa4b-1c7994574e6a",
-            "f2482b55-5184-4a52-89c5-a95e64e96a1d",
-            str(user_id),
-        ]
-
-        # Use parameterized query with bindparam for SQL injection protection
-        # PostgreSQL ANY() operator safely handles array parameters
-        # Added user tags filtering using array overlap operator (&&)
-        query = text("""
-            WITH user_tags_array AS (
-                SELECT COALESCE(array_agg(t.name), '{}') as tags
-                FROM users_tags ut
-                JOIN tags t ON t.id = ut.tag_id
-                WHERE ut.user_id = :user_id
-            ),
-            excluded_feeds AS (
-                SELECT DISTINCT feed_id
-                FROM users_feeds
-                WHERE user_id = ANY(:excluded_ids)
-            )
-            SELECT DISTINCT ON (feeds.id)
-                   feeds.id as feed_id,
-                   feeds.name,
-                   feeds.tags,
-                   users.id as user_id,
-                   users.raw_user_meta_data ->> 'avatar_url' AS picture,
-                   users.raw_user_meta_data ->> 'full_name' AS full_name
-            FROM feeds
-                     JOIN users_feeds ON feeds.id = users_feeds.feed_id
-                     JOIN auth.users ON users_feeds.user_id = users.id
-                     CROSS JOIN user_tags_array
-            WHERE feeds.id NOT IN (SELECT feed_id FROM excluded_feeds)
-              AND feeds.tags && user_tags_array.tags
-              AND feeds.is_marketplace = true
-            ORDER BY feeds.id, feeds.created_at DESC
-        """)
-
-        result = await conn.execute(
-            query, {"excluded_ids": excluded_user_ids, "user_id": user_id}
-        )
-        rows = result.fetchall()
+        await conn.execute(_REFRESH_CATALOG_SQL)
+        _catalog_cache.invalidate()
+
+    async def _get_catalog_by_tags(
+        self, conn: AsyncConnection, tags: list[str]
+    ) -> list[dict[str, Any]]:
+        """Get catalog rows overlapping tags, cached per tag set."""
+        key = tuple(sorted(set(tags)))
 
-        return [dict(row._mapping) for row in rows]
+        async def load() -> list[dict[str, Any]]:
+            result = await conn.execute(_CATALOG_BY_TAGS_SQL, {"tags": list(key)})
+            return [dict(row._mapping) for row in result.fetchall()]
+
+        return await _catalog_cache.get_or_load(key, load)
 
     async def set_marketplace_feeds(
-        self, conn: AsyncConnection, feed_ids: list[UUID]
+        self,
+        conn: AsyncConnection,
+        feed_ids: list[UUID],
+        nc: NATSClient | None = None,
     ) -> int:
         """Set is_marketplace = true for specified feeds.
 
+        Refreshes marketplace_catalog when any feed changed. With nc, other
+        processes are told to drop their cached catalog once the transaction
+        commits.
+
         Args:
             conn: Database connection
             feed_ids: List of feed IDs to mark as marketplace feeds
+            nc: Connected NATS client for the cache invalidation
 
         Returns:
             Number of feeds updated
@@ -94,4 +139,13 @@ class MarketplaceRepository:
         )
 
         result = await conn.execute(query)
-        return int(result.rowcount or 0)
+        updated = int(result.rowcount or 0)
+
+        if updated:
+            await self.refresh_marketplace_catalog(conn)
+            if nc is not None:
+                publish_cache_invalidation_on_commit(
+                    nc, conn, MARKETPLACE_CATALOG_CACHE
+                )
+
+        return updated
@@ -10,6 +10,51 @@ from sqlalchemy import func, insert, select, text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from shared.database.tables import posts, posts_seen, sources
+from shared.repositories.base import RowShape, shape_rows
+from shared.utils.media_converter import classify_media_url
+
+_FEED_POSTS_PAGE_SQL = """
+    SELECT
+        posts.id,
+        posts.created_at,
+        posts.feed_id,
+        posts.views,
+        posts.media_objects,
+        posts.title,
+        posts.moderation_action,
+        posts.moderation_labels,
+        posts.moderation_matched_entities,
+        COALESCE(posts_seen.seen, false) as seen,
+        (
+            SELECT COALESCE(
+                json_agg(
+                    jsonb_build_object(
+                        'id', sources.id,
+                        'created_at', sources.created_at,
+                        'post_id', sources.post_id,
+                        'source_url', sources.source_url
+                    )
+                ),
+                '[]'::json
+            )
+            FROM sources
+            WHERE sources.post_id = posts.id
+        ) as sources
+    FROM posts
+    LEFT JOIN posts_seen ON posts.id = posts_seen.post_id AND posts_seen.user_id = :user_id
+    WHERE posts.feed_id = :feed_id
+    {cursor_filter}
+    ORDER BY posts.created_at DESC, posts.id DESC
+    LIMIT :limit
+"""
+
+# Built once at import: both pagination variants are reused on every call
+_FEED_POSTS_FIRST_PAGE_SQL = text(_FEED_POSTS_PAGE_SQL.format(cursor_filter=""))
+_FEED_POSTS_PAGE_AFTER_CURSOR_SQL = text(
+    _FEED_POSTS_PAGE_SQL.format(
+        cursor_filter="AND (posts.created_at, posts.id) < (:cursor_created_at, :cursor_id)"
+    )
+)
 
 
 def encode_cursor(created_at: datetime, id: UUID) -> str:
@@ -81,38 +126,6 @@ def get_image_url_from_media_objects(
     return first_media.get("url")
 
 
-def _infer_mime_type_from_url(url: str) -> str:
-    """Infer MIME type from URL extension."""
-    url_lower = url.lower()
-    if any(ext in url_lower for ext in [".jpg", ".jpeg"]):
-        return "image/jpeg"
-    if ".png" in url_lower:
-        return "image/png"
-    if ".webp" in url_lower:
-        return "image/webp"
-    if ".gif" in url_lower:
-        return "image/gif"
-    if ".mp4" in url_lower:
-        return "video/mp4"
-    if ".webm" in url_lower:
-        return "video/webm"
-    if ".pdf" in url_lower:
-        return "application/pdf"
-    return "application/octet-stream"
-
-
-def _infer_media_type_from_url(url: str) -> str:
-    """Infer media type (photo/video) from URL extension."""
-    url_lower = url.lower()
-    if any(ext in url_lower for ext in [".mp4", ".webm", ".mov", ".avi"]):
-        return "video"
-    if ".gif" in url_lower:
-        return "animation"
-    if ".pdf" in url_lower:
-        return "document"
-    return "photo"
-
-
 def _normalize_media_objects(media_objects: list | None) -> list[dict]:
     """Normalize media_objects to ensure all items are proper dicts.
 
@@ -128,19 +141,26 @@ def _normalize_media_objects(media_objects: list | None) -> list[dict]:
     if not media_objects:
         return []
 
+    # Common case: already normalized, nothing to rebuild. A plain loop, as
+    # all() with a generator costs more than the copy it saves on short lists
+    for item in media_objects:
+        if not isinstance(item, dict):
+            break
+    else:
+        return media_objects
+
     normalized = []
     for item in media_objects:
         if isinstance(item, dict):
             normalized.append(item)
         elif isinstance(item, str):
-            media_type = _infer_media_type_from_url(item)
-            mime_type = _infer_mime_type_from_url(item)
+            kind = classify_media_url(item)
             media_obj: dict = {
-                "type": media_type,
+                "type": kind.type,
                 "url": item,
-                "mime_type": mime_type,
+                "mime_type": kind.mime_type,
             }
-            if media_type == "video":
+            if kind.type == "video":
                 media_obj["preview_url"] = item
             normalized.append(media_obj)
     return normalized
@@ -326,16 +346,18 @@ class PostRepository:
         conn: AsyncConnection,
         feed_id: UUID,
         user_id: UUID,
-    ) -> list[dict[str, Any]]:
+        shape: RowShape = dict,
+    ) -> list[Any]:
         """Get posts for feed that user hasn't seen yet.
 
         Args:
             conn: Database connection
             feed_id: ID of the feed
             user_id: ID of the user
+            shape: Row format, see shared.repositories.base.shape_rows
 
         Returns:
-            List of unseen post dictionaries with id, title, views, etc.
+            List of unseen post rows (dicts by default) with id, title, views, etc.
         """
         query = (
             select(posts)
@@ -355,8 +377,7 @@ class PostRepository:
         )
 
         result = await conn.execute(query)
-        rows = result.fetchall()
-        return [dict(row._mapping) for row in rows]
+        return shape_rows(result.fetchall(), shape)
 
     async def get_feed_posts_paginated(
         self,
@@ -385,52 +406,21 @@ class PostRepository:
         count_result = await conn.execute(count_query)
         total_count = int(count_result.scalar() or 0)
 
-        # Base query
-        query_str = """
-            SELECT
-                posts.id,
-                posts.created_at,
-                posts.feed_id,
-                posts.views,
-                posts.media_objects,
-                posts.title,
-                posts.moderation_action,
-                posts.moderation_labels,
-                posts.moderation_matched_entities,
-                COALESCE(posts_seen.seen, false) as seen,
-                (
-                    SELECT COALESCE(
-                        json_agg(
-                            jsonb_build_object(
-                                'id', sources.id,
-                                'created_at', sources.created_at,
-                                'post_id', sources.post_id,
-                                'source_url', sources.source_url
-                            )
-                        ),
-                        '[]'::json
-                    )
-                    FROM sources
-                    WHERE sources.post_id = posts.id
-                ) as sources
-            FROM posts
-            LEFT JOIN posts_seen ON posts.id = posts_seen.post_id AND posts_seen.user_id = :user_id
-            WHERE posts.feed_id = :feed_id
-        """
-
-        params = {"user_id": user_id, "feed_id": feed_id, "limit": limit + 1}
+        params: dict[str, Any] = {
+            "user_id": user_id,
+            "feed_id": feed_id,
+            "limit": limit + 1,
+        }
 
         if cursor:
             cursor_created_at, cursor_id = decode_cursor(cursor)
-            query_str += (
-                " AND (posts.created_at, posts.id) < (:cursor_created_at, :cursor_id)"
-            )
             params["cursor_created_at"] = cursor_created_at
             params["cursor_id"] = cursor_id
+            query = _FEED_POSTS_PAGE_AFTER_CURSOR_SQL
+        else:
+            query = _FEED_POSTS_FIRST_PAGE_SQL
 
-        query_str += " ORDER BY posts.created_at DESC, posts.id DESC LIMIT :limit"
-
-        result = await conn.execute(text(query_str), params)
+        result = await conn.execute(query, params)
         rows = result.fetchall()
 
         posts_data = [dict(row._mapping) for row in rows]
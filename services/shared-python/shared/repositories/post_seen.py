@@ -2,10 +2,18 @@
 
 from uuid import UUID
 
-from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
-from shared.database.tables import posts_seen
+# FK filtering happens server-side: only ids that exist in posts are upserted
+_MARK_SEEN_SQL = text("""
+    INSERT INTO posts_seen (user_id, post_id, seen)
+    SELECT marks.user_id, posts.id, true
+    FROM unnest(CAST(:user_ids AS uuid[]), CAST(:post_ids AS uuid[]))
+        AS marks(user_id, post_id)
+    JOIN posts ON posts.id = marks.post_id
+    ON CONFLICT (user_id, post_id) DO UPDATE SET seen = true
+""")
 
 
 class PostSeenRepository:
@@ -28,32 +36,33 @@ class PostSeenRepository:
         Returns:
             Number of posts marked as seen (both new and updated records)
         """
-        from sqlalchemy import select
+        unique_post_ids = list(dict.fromkeys(post_ids))
+        return await self.mark_seen_pairs(
+            conn, [(user_id, post_id) for post_id in unique_post_ids]
+        )
+
+    async def mark_seen_pairs(
+        self, conn: AsyncConnection, pairs: list[tuple[UUID, UUID]]
+    ) -> int:
+        """Mark (user_id, post_id) pairs as seen in a single statement.
 
-        from shared.database.tables import posts
+        Pairs must be unique (ON CONFLICT cannot touch the same row twice).
+        Pairs referencing missing posts are dropped by the JOIN on posts.
 
-        # First, filter only existing posts to avoid FK constraint violation
-        existing_posts_query = select(posts.c.id).where(posts.c.id.in_(post_ids))
-        result = await conn.execute(existing_posts_query)
-        existing_post_ids = [row.id for row in result.fetchall()]
+        Args:
+            conn: Database connection
+            pairs: Unique (user_id, post_id) pairs
 
-        if not existing_post_ids:
-            # No existing posts to mark
+        Returns:
+            Number of posts_seen rows inserted or updated
+        """
+        if not pairs:
             return 0
 
-        # Prepare values for bulk insert (only existing posts)
-        values = [
-            {"user_id": user_id, "post_id": post_id, "seen": True}
-            for post_id in existing_post_ids
-        ]
-
-        # PostgreSQL UPSERT: INSERT ON CONFLICT DO UPDATE
-        query = pg_insert(posts_seen).values(values)
-        query = query.on_conflict_do_update(
-            index_elements=["user_id", "post_id"],
-            set_={"seen": True},
+        user_ids, post_ids = zip(*pairs, strict=True)
+        result = await conn.execute(
+            _MARK_SEEN_SQL,
+            {"user_ids": list(user_ids), "post_ids": list(post_ids)},
         )
-
-        result = await conn.execute(query)
         # rowcount returns the number of affected rows (both inserted and updated)
         return int(result.rowcount or 0)
@@ -1,14 +1,82 @@
 """Prompt repository for database operations."""
 
+from collections.abc import Mapping
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select, update
+from sqlalchemy import func, literal_column, select, text, update
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from shared.database.tables import pre_prompts, prompts, prompts_raw_feeds
 from shared.enums import PrePromptType
 
+# Diff a prompt's source links against the wanted set in one round trip:
+# drop links not in :keep, add the missing ones. Links that stay keep their
+# rows (and the prompts_raw_feeds_offsets rows keyed by the same pair are
+# never touched).
+_REPLACE_PROMPT_SOURCES_SQL = text("""
+    WITH removed AS (
+        DELETE FROM prompts_raw_feeds
+        WHERE prompt_id = :prompt_id
+          AND raw_feed_id <> ALL(CAST(:keep AS uuid[]))
+    )
+    INSERT INTO prompts_raw_feeds (prompt_id, raw_feed_id)
+    SELECT CAST(:prompt_id AS uuid), raw_feed_id
+    FROM unnest(CAST(:keep AS uuid[])) AS raw_feed_id
+    ON CONFLICT (prompt_id, raw_feed_id) DO NOTHING
+""")
+
+# Upcoming scheduled DIGEST runs per slot; the range filter uses the partial
+# index ix_prompts_digest_scheduled_at
+_DIGEST_RUN_HISTOGRAM_SQL = text("""
+    SELECT
+        date_bin(
+            make_interval(mins => :slot_minutes),
+            digest_scheduled_at,
+            TIMESTAMPTZ '2000-01-01 00:00:00+00'
+        ) AS slot,
+        count(*) AS runs
+    FROM prompts
+    WHERE feed_type = 'DIGEST'
+      AND digest_scheduled_at >= :start
+      AND digest_scheduled_at < :end
+    GROUP BY slot
+""")
+
+# DIGEST prompts with their interval and the owner's plan (FREE without an
+# active subscription)
+_DIGEST_SCHEDULE_SETTINGS_SQL = text("""
+    SELECT
+        p.id AS prompt_id,
+        COALESCE(p.digest_interval_hours, 12) AS interval_hours,
+        COALESCE(
+            (
+                SELECT sp.plan_type::text
+                FROM users_feeds uf
+                JOIN user_subscriptions us
+                  ON us.user_id = uf.user_id AND us.status = 'ACTIVE'
+                JOIN subscription_plans sp ON sp.id = us.subscription_plan_id
+                WHERE uf.feed_id = p.feed_id
+                LIMIT 1
+            ),
+            'FREE'
+        ) AS plan_type,
+        p.digest_scheduled_at
+    FROM prompts p
+    WHERE p.id = ANY(CAST(:prompt_ids AS uuid[]))
+      AND p.feed_type = 'DIGEST'
+""")
+
+_SET_DIGEST_SCHEDULED_AT_SQL = text("""
+    UPDATE prompts p
+    SET digest_scheduled_at = s.scheduled_at
+    FROM unnest(
+        CAST(:prompt_ids AS uuid[]), CAST(:scheduled_at AS timestamptz[])
+    ) AS s(prompt_id, scheduled_at)
+    WHERE p.id = s.prompt_id
+""")
+
 
 class PromptRepository:
     """Repository for prompt-related database operations."""
@@ -164,38 +232,43 @@ class PromptRepository:
     ) -> dict[str, Any] | None:
         """Get next prompt to process for background processing.
 
-        Filters prompts by minimum interval since last execution:
+        Single-prompt wrapper around claim_prompts_for_background_processing.
+
+        Args:
+            conn: Database connection
+            preferred_type: Preferred prompt type (SINGLE_POST, DIGEST)
+
+        Returns:
+            Dictionary containing prompt data or None if no prompts available
+        """
+        claimed = await self.claim_prompts_for_background_processing(
+            conn, preferred_type, limit=1
+        )
+        return claimed[0] if claimed else None
+
+    async def claim_prompts_for_background_processing(
+        self, conn: AsyncConnection, preferred_type: PrePromptType, limit: int = 10
+    ) -> list[dict[str, Any]]:
+        """Claim up to `limit` due prompts for background processing.
+
+        A prompt is due when next_run_at (maintained by a DB trigger as
+        last_execution + interval) has passed:
         - SINGLE_POST: 2 minutes
         - DIGEST: digest_interval_hours (default 12h)
 
-        Selects oldest last_execution (or NULL) within the type.
+        Never-run prompts (next_run_at IS NULL) come first, then the most
+        overdue ones. Rows are locked with FOR UPDATE SKIP LOCKED, so
+        concurrent workers claim disjoint batches; the lock is held until the
+        caller's transaction ends.
 
         Args:
             conn: Database connection
             preferred_type: Preferred prompt type (SINGLE_POST, DIGEST)
+            limit: Maximum number of prompts to claim
 
         Returns:
-            Dictionary containing prompt data or None if no prompts available
+            List of dictionaries containing prompt data
         """
-        now = func.now()
-
-        # Build interval condition based on type
-        if preferred_type == PrePromptType.DIGEST:
-            # For DIGEST: use digest_interval_hours (default 12h if NULL)
-            # Condition: last_execution IS NULL OR (NOW() - last_execution) > INTERVAL '1 hour' * COALESCE(digest_interval_hours, 12)
-            interval_condition = (prompts.c.last_execution.is_(None)) | (
-                now - prompts.c.last_execution
-                > func.make_interval(
-                    0, 0, 0, 0, func.coalesce(prompts.c.digest_interval_hours, 12)
-                )
-            )
-        else:
-            # For SINGLE_POST: 2 minutes interval
-            # Condition: last_execution IS NULL OR (NOW() - last_execution) > INTERVAL '2 minutes'
-            interval_condition = (prompts.c.last_execution.is_(None)) | (
-                now - prompts.c.last_execution > func.make_interval(0, 0, 0, 0, 0, 2)
-            )
-
         query = (
             select(
                 prompts.c.id.label("prompt_id"),
@@ -211,16 +284,23 @@ class PromptRepository:
             .select_from(
                 prompts.join(pre_prompts, prompts.c.pre_prompt_id == pre_prompts.c.id)
             )
+            # feed_type matches the partial index ix_prompts_next_run_at_<type>;
+            # it is inlined rather than bound so generic plans match it too
+            .where(
+                prompts.c.feed_type
+                == literal_column(f"'{PrePromptType(preferred_type).value}'")
+            )
             .where(pre_prompts.c.type == preferred_type)
-            .where(interval_condition)
-            .order_by(prompts.c.last_execution.asc().nullsfirst())
-            .limit(1)
-            .with_for_update(skip_locked=True)
+            .where(
+                prompts.c.next_run_at.is_(None) | (prompts.c.next_run_at <= func.now())
+            )
+            .order_by(prompts.c.next_run_at.asc().nullsfirst())
+            .limit(limit)
+            .with_for_update(of=prompts, skip_locked=True)
         )
 
         result = await conn.execute(query)
-        row = result.fetchone()
-        return dict(row._mapping) if row else None
+        return [dict(row._mapping) for row in result.fetchall()]
 
     async def get_prompt_by_feed_id(
         self, conn: AsyncConnection, feed_id: UUID
@@ -289,31 +369,88 @@ class PromptRepository:
         )
         await conn.execute(query)
 
+    async def get_digest_run_histogram(
+        self,
+        conn: AsyncConnection,
+        start: datetime,
+        end: datetime,
+        slot_minutes: int,
+    ) -> dict[datetime, int]:
+        """Count scheduled DIGEST runs per time slot.
+
+        Counts digest_scheduled_at, the shaped run times DigestScheduler
+        records; used to seed DigestScheduleShaper (slots are aligned the
+        same way).
+
+        Args:
+            conn: Database connection
+            start: Range start (inclusive)
+            end: Range end (exclusive)
+            slot_minutes: Slot width in minutes
+
+        Returns:
+            Dict mapping slot start to number of runs scheduled in it
+        """
+        result = await conn.execute(
+            _DIGEST_RUN_HISTOGRAM_SQL,
+            {"slot_minutes": slot_minutes, "start": start, "end": end},
+        )
+        return {row.slot: row.runs for row in result.fetchall()}
+
+    async def get_digest_schedule_settings(
+        self, conn: AsyncConnection, prompt_ids: list[UUID]
+    ) -> list[dict[str, Any]]:
+        """Get what DigestScheduler needs to schedule DIGEST prompts.
+
+        Prompts that no longer exist or are no longer DIGEST are left out.
+
+        Args:
+            conn: Database connection
+            prompt_ids: IDs of the prompts
+
+        Returns:
+            List of dicts with prompt_id, interval_hours (default 12),
+            plan_type (feed owner's active plan, FREE without one) and
+            digest_scheduled_at (the pending or last scheduled run, if any)
+        """
+        result = await conn.execute(
+            _DIGEST_SCHEDULE_SETTINGS_SQL, {"prompt_ids": prompt_ids}
+        )
+        return [dict(row._mapping) for row in result.fetchall()]
+
+    async def set_digest_scheduled_at(
+        self, conn: AsyncConnection, scheduled_at: Mapping[UUID, datetime]
+    ) -> None:
+        """Record the run times digests were scheduled for.
+
+        Args:
+            conn: Database connection
+            scheduled_at: Prompt ID -> scheduled (shaped) run time
+        """
+        if not scheduled_at:
+            return
+        await conn.execute(
+            _SET_DIGEST_SCHEDULED_AT_SQL,
+            {
+                "prompt_ids": list(scheduled_at),
+                "scheduled_at": list(scheduled_at.values()),
+            },
+        )
+
     async def replace_prompt_sources(
         self, conn: AsyncConnection, prompt_id: UUID, raw_feed_ids: list[UUID]
     ) -> None:
         """Replace all sources linked to prompt.
 
-        Deletes existing links and creates new ones.
+        Removes links not in raw_feed_ids and adds the missing ones in a
+        single statement; links that stay are left as they are.
 
         Args:
             conn: Database connection
             prompt_id: ID of the prompt
             raw_feed_ids: List of raw_feed IDs to link
         """
-        from sqlalchemy import delete, insert
-
-        # Delete existing links
-        delete_query = delete(prompts_raw_feeds).where(
-            prompts_raw_feeds.c.prompt_id == prompt_id
+        await conn.execute(
+            _REPLACE_PROMPT_SOURCES_SQL,
+            {"prompt_id": prompt_id, "keep": list(dict.fromkeys(raw_feed_ids))},
         )
-        await conn.execute(delete_query)
-
-        # Insert new links
-        if raw_feed_ids:
-            values = [
-                {"prompt_id": prompt_id, "raw_feed_id": raw_feed_id}
-                for raw_feed_id in raw_feed_ids
-            ]
-            insert_query = insert(prompts_raw_feeds).values(values)
-            await conn.execute(insert_query)
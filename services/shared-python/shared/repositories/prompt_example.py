@@ -6,6 +6,30 @@ from uuid import UUID
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
+from shared.utils.ttl_cache import get_cache
+
+PROMPT_EXAMPLES_CACHE = "prompt_examples"
+
+_prompt_examples_cache = get_cache(PROMPT_EXAMPLES_CACHE)
+
+# Every example with its (tag_id, tag_name) pairs, newest first. Small and
+# rarely changing, so it is cached whole and filtered per user in Python.
+_PROMPT_EXAMPLES_CATALOG_SQL = text("""
+    SELECT
+        pe.id,
+        pe.prompt,
+        pe.created_at,
+        array_agg(t.id) AS tag_ids,
+        array_agg(t.name) AS tag_names
+    FROM prompt_examples pe
+    JOIN prompt_examples_tags pet ON pet.prompt_example_id = pe.id
+    JOIN tags t ON t.id = pet.tag_id
+    GROUP BY pe.id, pe.prompt, pe.created_at
+    ORDER BY pe.created_at DESC
+""")
+
+_USER_TAG_IDS_SQL = text("SELECT tag_id FROM users_tags WHERE user_id = :user_id")
+
 
 class PromptExampleRepository:
     """Repository for managing prompt examples in the database."""
@@ -15,28 +39,46 @@ class PromptExampleRepository:
     ) -> list[dict[str, Any]]:
         """Get all prompt examples matching user's tags.
 
+        The example catalog comes from the process-wide "prompt_examples"
+        reference cache; only the user's tag ids are read per call.
+
         Args:
             conn: Database connection
             user_id: User UUID
 
         Returns:
-            List of prompt examples with their tags
+            List of prompt examples with their tags (the tags the user has)
         """
-        query = text("""
-            SELECT DISTINCT
-                pe.id,
-                pe.prompt,
-                pe.created_at,
-                COALESCE(array_agg(DISTINCT t.name) FILTER (WHERE t.name IS NOT NULL), '{}') as tags
-            FROM prompt_examples pe
-            JOIN prompt_examples_tags pet ON pet.prompt_example_id = pe.id
-            JOIN tags t ON t.id = pet.tag_id
-            WHERE pet.tag_id IN (
-                SELECT tag_id FROM users_tags WHERE user_id = :user_id
-            )
-            GROUP BY pe.id, pe.prompt, pe.created_at
-            ORDER BY pe.created_at DESC
-        """)
-
-        result = await conn.execute(query, {"user_id": user_id})
+        result = await conn.execute(_USER_TAG_IDS_SQL, {"user_id": user_id})
+        user_tag_ids = set(result.scalars().all())
+        if not user_tag_ids:
+            return []
+
+        catalog = await _prompt_examples_cache.get_or_load(
+            "all", lambda: self._load_catalog(conn)
+        )
+
+        examples = []
+        for example in catalog:
+            matching = {
+                name
+                for tag_id, name in zip(
+                    example["tag_ids"], example["tag_names"], strict=True
+                )
+                if tag_id in user_tag_ids
+            }
+            if matching:
+                examples.append(
+                    {
+                        "id": example["id"],
+                        "prompt": example["prompt"],
+                        "created_at": example["created_at"],
+                        "tags": sorted(matching),
+                    }
+                )
+        return examples
+
+    async def _load_catalog(self, conn: AsyncConnection) -> list[dict[str, Any]]:
+        """Load all prompt examples with their tag ids and names."""
+        result = await conn.execute(_PROMPT_EXAMPLES_CATALOG_SQL)
         return [dict(row._mapping) for row in result.fetchall()]
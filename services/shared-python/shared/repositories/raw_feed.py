@@ -1,13 +1,103 @@
-from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID
 
 from loguru import logger
-from sqlalchemy import func, insert, select, update
+from sqlalchemy import (
+    Integer,
+    String,
+    cast,
+    column,
+    func,
+    insert,
+    select,
+    text,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from shared.database.tables import prompts_raw_feeds, raw_feeds
 from shared.enums import PollingTier, RawType
+from shared.repositories.base import RowShape, shape_rows
+
+# Default batch size for *_due_for_poll queries
+DUE_FOR_POLL_LIMIT = 50
+
+# Columns the pollers read from due feeds
+_POLL_COLUMNS = (
+    "id",
+    "name",
+    "raw_type",
+    "feed_url",
+    "site_url",
+    "image_url",
+    "last_execution",
+    "last_polled_at",
+    "last_message_id",
+    "poll_error_count",
+    "polling_tier",
+    "websub_hub_url",
+    "websub_topic_url",
+    "websub_lease_expires",
+)
+
+
+# Upsert many sources at once. Telegram rows created before feed_url was
+# normalized are matched by telegram_username (as the single-row getters do)
+# and only get their missing chat_id filled in; everything else is upserted
+# on the unique feed_url. DO UPDATE (not DO NOTHING) so existing rows are
+# RETURNed too.
+_BULK_GET_OR_CREATE_SQL = text("""
+    WITH input AS (
+        SELECT *
+        FROM unnest(
+            CAST(:names AS text[]),
+            CAST(:raw_types AS raw_type[]),
+            CAST(:feed_urls AS text[]),
+            CAST(:site_urls AS text[]),
+            CAST(:telegram_usernames AS text[]),
+            CAST(:telegram_chat_ids AS bigint[])
+        ) AS t(name, raw_type, feed_url, site_url, telegram_username, telegram_chat_id)
+    ),
+    legacy_telegram AS (
+        SELECT DISTINCT ON (i.feed_url) i.feed_url, rf.id, i.telegram_chat_id
+        FROM input i
+        JOIN raw_feeds rf ON rf.telegram_username = i.telegram_username
+        WHERE i.telegram_username IS NOT NULL
+          AND rf.feed_url IS DISTINCT FROM i.feed_url
+          AND NOT EXISTS (SELECT 1 FROM raw_feeds f WHERE f.feed_url = i.feed_url)
+        ORDER BY i.feed_url, rf.created_at
+    ),
+    legacy_chat_ids AS (
+        UPDATE raw_feeds
+        SET telegram_chat_id = l.telegram_chat_id
+        FROM legacy_telegram l
+        WHERE raw_feeds.id = l.id
+          AND raw_feeds.telegram_chat_id IS NULL
+          AND l.telegram_chat_id IS NOT NULL
+    ),
+    upserted AS (
+        INSERT INTO raw_feeds (
+            name, raw_type, feed_url, site_url,
+            telegram_username, telegram_chat_id, polling_tier
+        )
+        SELECT
+            i.name, i.raw_type, i.feed_url, i.site_url,
+            i.telegram_username, i.telegram_chat_id, 'WARM'
+        FROM input i
+        WHERE NOT EXISTS (
+            SELECT 1 FROM legacy_telegram l WHERE l.feed_url = i.feed_url
+        )
+        ON CONFLICT (feed_url) DO UPDATE
+        SET telegram_chat_id = COALESCE(
+            raw_feeds.telegram_chat_id, EXCLUDED.telegram_chat_id
+        )
+        RETURNING feed_url, id
+    )
+    SELECT feed_url, id FROM upserted
+    UNION ALL
+    SELECT feed_url, id FROM legacy_telegram
+""")
 
 
 def normalize_telegram_username(username: str | None) -> str | None:
@@ -292,70 +382,149 @@ class RawFeedRepository:
         logger.info(f"Created new Reddit raw_feed: {name}")
         return dict(row._mapping)
 
+    async def bulk_get_or_create(
+        self, conn: AsyncConnection, sources: list[dict[str, Any]]
+    ) -> dict[str, UUID]:
+        """Get or create raw_feeds for many sources in one statement.
+
+        Inputs are normalized like the single-source getters: Telegram
+        usernames via normalize_telegram_username (feed_url/site_url become
+        https://t.me/<username>), URLs are stripped. Existing Telegram rows
+        without chat_id get it filled in.
+
+        Args:
+            conn: Database connection
+            sources: List of dicts with keys:
+                - source: str (Telegram username/t.me link, or feed URL)
+                - raw_type: RawType
+                - name: Optional[str] (defaults to @username / the URL)
+                - site_url: Optional[str] (non-Telegram; defaults to the URL)
+                - telegram_chat_id: Optional[int]
+
+        Returns:
+            Mapping of each input source string to its raw_feed ID
+            (invalid Telegram usernames are left out)
+        """
+        rows: dict[str, dict[str, Any]] = {}
+        feed_url_by_source: dict[str, str] = {}
+
+        for item in sources:
+            source = item["source"]
+            raw_type = RawType(item["raw_type"])
+
+            if raw_type == RawType.TELEGRAM:
+                username = normalize_telegram_username(source)
+                if not username:
+                    logger.warning(f"Skipping invalid Telegram username: {source!r}")
+                    continue
+                feed_url = f"https://t.me/{username}"
+                row = {
+                    "name": item.get("name") or f"@{username}",
+                    "raw_type": raw_type.value,
+                    "feed_url": feed_url,
+                    "site_url": feed_url,
+                    "telegram_username": username,
+                    "telegram_chat_id": item.get("telegram_chat_id"),
+                }
+            else:
+                feed_url = source.strip()
+                row = {
+                    "name": item.get("name") or feed_url,
+                    "raw_type": raw_type.value,
+                    "feed_url": feed_url,
+                    "site_url": item.get("site_url") or feed_url,
+                    "telegram_username": None,
+                    "telegram_chat_id": None,
+                }
+
+            feed_url_by_source[source] = feed_url
+            # ON CONFLICT DO UPDATE can't touch the same row twice per statement
+            existing = rows.setdefault(feed_url, row)
+            if existing["telegram_chat_id"] is None:
+                existing["telegram_chat_id"] = row["telegram_chat_id"]
+
+        if not rows:
+            return {}
+
+        batch = list(rows.values())
+        result = await conn.execute(
+            _BULK_GET_OR_CREATE_SQL,
+            {
+                "names": [r["name"] for r in batch],
+                "raw_types": [r["raw_type"] for r in batch],
+                "feed_urls": [r["feed_url"] for r in batch],
+                "site_urls": [r["site_url"] for r in batch],
+                "telegram_usernames": [r["telegram_username"] for r in batch],
+                "telegram_chat_ids": [r["telegram_chat_id"] for r in batch],
+            },
+        )
+        id_by_feed_url = {row.feed_url: row.id for row in result.fetchall()}
+
+        logger.info(
+            f"Resolved {len(id_by_feed_url)} raw_feeds for {len(sources)} sources"
+        )
+        return {
+            source: id_by_feed_url[feed_url]
+            for source, feed_url in feed_url_by_source.items()
+            if feed_url in id_by_feed_url
+        }
+
     async def get_telegram_channels_for_update(
-        self, conn: AsyncConnection
-    ) -> list[dict[str, Any]]:
+        self, conn: AsyncConnection, shape: RowShape = dict
+    ) -> list[Any]:
         """Get all Telegram channels that need to be updated.
 
         Args:
             conn: Database connection
+            shape: Row format, see shared.repositories.base.shape_rows
 
         Returns:
-            List of dictionaries containing raw_feed data
+            List of raw_feed rows (dicts by default)
         """
         query = select(raw_feeds).where(raw_feeds.c.raw_type == RawType.TELEGRAM)
         result = await conn.execute(query)
-        return [dict(row._mapping) for row in result.fetchall()]
+        return shape_rows(result.fetchall(), shape)
 
     async def get_rss_feeds_for_update(
-        self, conn: AsyncConnection
-    ) -> list[dict[str, Any]]:
+        self, conn: AsyncConnection, shape: RowShape = dict
+    ) -> list[Any]:
         """Get all RSS/Web feeds that need to be updated.
 
         Args:
             conn: Database connection
+            shape: Row format, see shared.repositories.base.shape_rows
 
         Returns:
-            List of dictionaries containing raw_feed data
+            List of raw_feed rows (dicts by default)
         """
         query = select(raw_feeds).where(
             raw_feeds.c.raw_type.in_([RawType.RSS, RawType.YOUTUBE, RawType.REDDIT])
         )
         result = await conn.execute(query)
-        return [dict(row._mapping) for row in result.fetchall()]
+        return shape_rows(result.fetchall(), shape)
 
     async def get_rss_feeds_due_for_poll(
         self,
         conn: AsyncConnection,
         tier_intervals: dict[str, int],
+        limit: int = DUE_FOR_POLL_LIMIT,
+        skip_locked: bool = True,
     ) -> list[dict[str, Any]]:
         """Get RSS/YouTube/Reddit feeds that are due for polling based on their tier.
 
         Args:
             conn: Database connection
             tier_intervals: Mapping of PollingTier value to interval in seconds
+            limit: Maximum number of feeds to return (most overdue first)
+            skip_locked: Claim returned rows with FOR UPDATE SKIP LOCKED
         """
-        now = datetime.now(timezone.utc)
-        rss_types = [RawType.RSS, RawType.YOUTUBE, RawType.REDDIT]
-        all_feeds: list[dict[str, Any]] = []
-
-        for tier_value, interval_seconds in tier_intervals.items():
-            cutoff = now - timedelta(seconds=interval_seconds)
-            query = (
-                select(raw_feeds)
-                .where(
-                    raw_feeds.c.raw_type.in_(rss_types),
-                    raw_feeds.c.polling_tier == tier_value,
-                )
-                .where(
-                    (raw_feeds.c.last_polled_at.is_(None))
-                    | (raw_feeds.c.last_polled_at < cutoff)
-                )
-            )
-            result = await conn.execute(query)
-            all_feeds.extend(dict(row._mapping) for row in result.fetchall())
-
-        return all_feeds
+        return await self._get_feeds_due_for_poll(
+            conn,
+            [RawType.RSS, RawType.YOUTUBE, RawType.REDDIT],
+            tier_intervals,
+            limit,
+            skip_locked,
+        )
 
     async def update_rss_poll_result(
         self,
@@ -380,28 +549,66 @@ class RawFeedRepository:
         self,
         conn: AsyncConnection,
         tier_intervals: dict[str, int],
+        limit: int = DUE_FOR_POLL_LIMIT,
+        skip_locked: bool = True,
     ) -> list[dict[str, Any]]:
         """Get WEBSITE feeds that are due for polling based on their tier."""
-        now = datetime.now(timezone.utc)
-        all_feeds: list[dict[str, Any]] = []
-
-        for tier_value, interval_seconds in tier_intervals.items():
-            cutoff = now - timedelta(seconds=interval_seconds)
-            query = (
-                select(raw_feeds)
-                .where(
-                    raw_feeds.c.raw_type == RawType.WEBSITE,
-                    raw_feeds.c.polling_tier == tier_value,
-                )
-                .where(
-                    (raw_feeds.c.last_polled_at.is_(None))
-                    | (raw_feeds.c.last_polled_at < cutoff)
+        return await self._get_feeds_due_for_poll(
+            conn, [RawType.WEBSITE], tier_intervals, limit, skip_locked
+        )
+
+    async def _get_feeds_due_for_poll(
+        self,
+        conn: AsyncConnection,
+        raw_types: list[RawType],
+        tier_intervals: dict[str, int],
+        limit: int,
+        skip_locked: bool,
+    ) -> list[dict[str, Any]]:
+        """Get feeds due for polling across all tiers in a single query.
+
+        Joins raw_feeds against a VALUES list of (tier, interval_seconds) pairs
+        and orders by how long each feed is overdue (never polled first).
+
+        With skip_locked=True the returned rows are locked with
+        FOR UPDATE SKIP LOCKED until the caller's transaction ends, so poller
+        replicas sharing the table split the due set instead of double-polling.
+        Update last_polled_at (update_rss_poll_result) in the same transaction
+        to keep the claim after commit.
+        """
+        if not tier_intervals:
+            return []
+
+        tiers = values(
+            column("tier", String),
+            column("interval_seconds", Integer),
+            name="tiers",
+        ).data([(str(tier), seconds) for tier, seconds in tier_intervals.items()])
+
+        interval = func.make_interval(0, 0, 0, 0, 0, 0, tiers.c.interval_seconds)
+        due_at = raw_feeds.c.last_polled_at + interval
+
+        query = (
+            select(*(raw_feeds.c[name] for name in _POLL_COLUMNS))
+            .select_from(
+                raw_feeds.join(
+                    tiers,
+                    cast(raw_feeds.c.polling_tier, String) == tiers.c.tier,
                 )
             )
-            result = await conn.execute(query)
-            all_feeds.extend(dict(row._mapping) for row in result.fetchall())
+            .where(
+                raw_feeds.c.raw_type.in_(raw_types),
+                raw_feeds.c.last_polled_at.is_(None) | (due_at < func.now()),
+            )
+            .order_by(due_at.asc().nulls_first())
+            .limit(limit)
+        )
+
+        if skip_locked:
+            query = query.with_for_update(skip_locked=True, of=raw_feeds)
 
-        return all_feeds
+        result = await conn.execute(query)
+        return [dict(row._mapping) for row in result.fetchall()]
 
     async def update_last_execution(
         self, conn: AsyncConnection, raw_feed_id: UUID
@@ -1,13 +1,115 @@
+import json
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
 from loguru import logger
-from sqlalchemy import insert, select, text
+from sqlalchemy import insert, literal_column, select, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from shared.database.tables import prompts_raw_feeds, raw_feeds, raw_posts
+from shared.repositories.base import RowShape, shape_rows
+
+_OFFSET_TABLE_EXISTS_SQL = text(
+    "SELECT EXISTS (SELECT FROM information_schema.tables "
+    "WHERE table_schema = :schema AND table_name = :table_name)"
+)
+
+# 'block' is inlined rather than bound so the planner can match the partial
+# index ix_raw_posts_raw_feed_id_created_at_visible, also with generic plans
+_NOT_BLOCKED = raw_posts.c.moderation_action.is_(None) | (
+    raw_posts.c.moderation_action != literal_column("'block'")
+)
+
+# Rows per COPY/INSERT round in bulk_create_* methods
+BULK_INGEST_CHUNK_SIZE = 5000
+# batch_create_* hand larger batches to bulk_create_*: a multi-row VALUES
+# binds every value, and asyncpg allows at most 32767 parameters per
+# statement (about 2500 raw_posts rows)
+BULK_INGEST_THRESHOLD = 1000
+
+_MODERATION_FIELDS = (
+    "moderation_action",
+    "moderation_labels",
+    "moderation_block_reasons",
+    "moderation_checked_at",
+    "moderation_matched_entities",
+)
+
+_STAGING_TABLE = "raw_posts_ingest_staging"
+
+_STAGING_COLUMNS = [
+    "raw_feed_id",
+    "content",
+    "title",
+    "media_objects",
+    "rp_unique_code",
+    "media_group_id",
+    "telegram_message_id",
+    "source_url",
+    "created_at",
+    *_MODERATION_FIELDS,
+]
+
+_JSONB_STAGING_COLUMNS = frozenset(
+    {
+        "media_objects",
+        "moderation_labels",
+        "moderation_block_reasons",
+        "moderation_matched_entities",
+    }
+)
+
+# No constraints on the staging table: NULLs are replaced with the
+# raw_posts defaults in the INSERT ... SELECT below.
+_CREATE_STAGING_SQL = text(
+    f"""
+    CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} (
+        raw_feed_id uuid,
+        content text,
+        title text,
+        media_objects jsonb,
+        rp_unique_code text,
+        media_group_id text,
+        telegram_message_id bigint,
+        source_url text,
+        created_at timestamptz,
+        moderation_action varchar(20),
+        moderation_labels jsonb,
+        moderation_block_reasons jsonb,
+        moderation_checked_at timestamptz,
+        moderation_matched_entities jsonb
+    ) ON COMMIT DROP
+    """
+)
+
+_TRUNCATE_STAGING_SQL = text(f"TRUNCATE {_STAGING_TABLE}")
+
+_INSERT_FROM_STAGING_SQL = text(
+    f"""
+    INSERT INTO raw_posts (
+        raw_feed_id, content, title, media_objects, rp_unique_code,
+        media_group_id, telegram_message_id, source_url, created_at,
+        moderation_action, moderation_labels, moderation_block_reasons,
+        moderation_checked_at, moderation_matched_entities
+    )
+    SELECT DISTINCT ON (rp_unique_code)
+        raw_feed_id, content, title,
+        COALESCE(media_objects, '[]'::jsonb),
+        rp_unique_code, media_group_id, telegram_message_id, source_url,
+        COALESCE(created_at, now()),
+        moderation_action,
+        COALESCE(moderation_labels, '[]'::jsonb),
+        COALESCE(moderation_block_reasons, '[]'::jsonb),
+        moderation_checked_at,
+        COALESCE(moderation_matched_entities, '[]'::jsonb)
+    FROM {_STAGING_TABLE}
+    ORDER BY rp_unique_code
+    ON CONFLICT (rp_unique_code) DO NOTHING
+    RETURNING id
+    """
+)
 
 
 class RawPostRepository:
@@ -374,6 +476,8 @@ class RawPostRepository:
         """Create multiple RSS/Web raw posts in a single batch operation.
 
         Optimized for creating multiple posts in a single query instead of N queries.
+        More than BULK_INGEST_THRESHOLD posts go through bulk_create_rss_raw_posts
+        (COPY) instead.
 
         Args:
             conn: Database connection
@@ -400,40 +504,11 @@ class RawPostRepository:
         """
         if not posts_data:
             return []
+        if len(posts_data) > BULK_INGEST_THRESHOLD:
+            return await self.bulk_create_rss_raw_posts(conn, posts_data)
 
         # Normalize data for insert
-        values_list = []
-        for post in posts_data:
-            values = {
-                "raw_feed_id": post["raw_feed_id"],
-                "content": post["content"],
-                "title": post["title"],
-                "media_objects": post["media_objects"],
-                "rp_unique_code": post["rp_unique_code"],
-                "media_group_id": post.get("media_group_id"),
-                "telegram_message_id": None,  # Not applicable for RSS
-                "source_url": post.get("source_url"),
-            }
-
-            # Add created_at if provided
-            if "created_at" in post and post["created_at"] is not None:
-                values["created_at"] = post["created_at"]
-
-            # Add moderation fields if provided
-            if post.get("moderation_action") is not None:
-                values["moderation_action"] = post["moderation_action"]
-            if post.get("moderation_labels") is not None:
-                values["moderation_labels"] = post["moderation_labels"]
-            if post.get("moderation_block_reasons") is not None:
-                values["moderation_block_reasons"] = post["moderation_block_reasons"]
-            if post.get("moderation_checked_at") is not None:
-                values["moderation_checked_at"] = post["moderation_checked_at"]
-            if post.get("moderation_matched_entities") is not None:
-                values["moderation_matched_entities"] = post[
-                    "moderation_matched_entities"
-                ]
-
-            values_list.append(values)
+        values_list = [self._build_rss_values(post) for post in posts_data]
 
         # Batch insert with ON CONFLICT to handle race conditions
         query = (
@@ -462,6 +537,8 @@ class RawPostRepository:
         """Create multiple Telegram raw posts in a single batch operation.
 
         Optimized for creating multiple posts in a single query instead of N queries.
+        More than BULK_INGEST_THRESHOLD posts go through
+        bulk_create_telegram_raw_posts (COPY) instead.
 
         Args:
             conn: Database connection
@@ -488,55 +565,21 @@ class RawPostRepository:
         """
         if not posts_data:
             return []
+        if len(posts_data) > BULK_INGEST_THRESHOLD:
+            return await self.bulk_create_telegram_raw_posts(conn, posts_data)
 
         values_list = []
         skipped_count = 0
         for post in posts_data:
-            telegram_chat_id = post["telegram_chat_id"]
-            telegram_message_id = post["telegram_message_id"]
-            media_group_id = post.get("media_group_id")
-
-            if telegram_chat_id is None:
+            if post["telegram_chat_id"] is None:
                 logger.warning(
                     f"Skipping post with None telegram_chat_id: "
-                    f"message_id={telegram_message_id}, raw_feed_id={post['raw_feed_id']}"
+                    f"message_id={post['telegram_message_id']}, raw_feed_id={post['raw_feed_id']}"
                 )
                 skipped_count += 1
                 continue
 
-            if media_group_id:
-                rp_unique_code = f"tg_{telegram_chat_id}_{media_group_id}"
-            else:
-                rp_unique_code = f"tg_{telegram_chat_id}_{telegram_message_id}"
-
-            values = {
-                "raw_feed_id": post["raw_feed_id"],
-                "content": post["content"],
-                "title": post["title"],
-                "media_objects": post["media_objects"],
-                "rp_unique_code": rp_unique_code,
-                "media_group_id": media_group_id,
-                "telegram_message_id": telegram_message_id,
-            }
-
-            if "created_at" in post and post["created_at"] is not None:
-                values["created_at"] = post["created_at"]
-
-            # Add moderation fields if provided
-            if post.get("moderation_action") is not None:
-                values["moderation_action"] = post["moderation_action"]
-            if post.get("moderation_labels") is not None:
-                values["moderation_labels"] = post["moderation_labels"]
-            if post.get("moderation_block_reasons") is not None:
-                values["moderation_block_reasons"] = post["moderation_block_reasons"]
-            if post.get("moderation_checked_at") is not None:
-                values["moderation_checked_at"] = post["moderation_checked_at"]
-            if post.get("moderation_matched_entities") is not None:
-                values["moderation_matched_entities"] = post[
-                    "moderation_matched_entities"
-                ]
-
-            values_list.append(values)
+            values_list.append(self._build_telegram_values(post))
 
         if not values_list:
             logger.debug(
@@ -565,6 +608,198 @@ class RawPostRepository:
 
         return created_ids
 
+    async def bulk_create_rss_raw_posts(
+        self,
+        conn: AsyncConnection,
+        posts_data: list[dict[str, Any]],
+        chunk_size: int = BULK_INGEST_CHUNK_SIZE,
+    ) -> list[UUID]:
+        """Create many RSS/Web raw posts via COPY into a staging table.
+
+        Bulk counterpart of batch_create_rss_raw_posts, which calls it for
+        batches above BULK_INGEST_THRESHOLD: rows are streamed with COPY (no
+        bind-parameter limit) and moved into raw_posts with INSERT ... SELECT
+        ... ON CONFLICT DO NOTHING. See benchmarks/raw_post_ingest.py for
+        throughput.
+
+        Args:
+            conn: Database connection (must be backed by asyncpg)
+            posts_data: List of post dicts, same format as batch_create_rss_raw_posts
+            chunk_size: Number of rows copied and inserted per statement
+
+        Returns:
+            List of created raw_post UUIDs
+        """
+        if not posts_data:
+            return []
+
+        records = [
+            self._to_staging_record(self._build_rss_values(post)) for post in posts_data
+        ]
+        created_ids = await self._copy_insert_raw_posts(conn, records, chunk_size)
+
+        logger.debug(
+            f"Bulk insert RSS: {len(created_ids)}/{len(posts_data)} created "
+            f"({len(posts_data) - len(created_ids)} duplicates skipped)"
+        )
+        return created_ids
+
+    async def bulk_create_telegram_raw_posts(
+        self,
+        conn: AsyncConnection,
+        posts_data: list[dict[str, Any]],
+        chunk_size: int = BULK_INGEST_CHUNK_SIZE,
+    ) -> list[UUID]:
+        """Create many Telegram raw posts via COPY into a staging table.
+
+        Bulk counterpart of batch_create_telegram_raw_posts, see
+        bulk_create_rss_raw_posts for details.
+
+        Args:
+            conn: Database connection (must be backed by asyncpg)
+            posts_data: List of post dicts, same format as batch_create_telegram_raw_posts
+            chunk_size: Number of rows copied and inserted per statement
+
+        Returns:
+            List of created raw_post UUIDs
+        """
+        if not posts_data:
+            return []
+
+        records = []
+        skipped_count = 0
+        for post in posts_data:
+            if post["telegram_chat_id"] is None:
+                logger.warning(
+                    f"Skipping post with None telegram_chat_id: "
+                    f"message_id={post['telegram_message_id']}, raw_feed_id={post['raw_feed_id']}"
+                )
+                skipped_count += 1
+                continue
+
+            records.append(self._to_staging_record(self._build_telegram_values(post)))
+
+        if not records:
+            logger.debug(
+                f"Bulk insert Telegram: all {len(posts_data)} posts skipped "
+                f"({skipped_count} with None telegram_chat_id)"
+            )
+            return []
+
+        created_ids = await self._copy_insert_raw_posts(conn, records, chunk_size)
+
+        duplicates_skipped = len(records) - len(created_ids)
+        logger.debug(
+            f"Bulk insert Telegram: {len(created_ids)}/{len(posts_data)} created "
+            f"({duplicates_skipped} duplicates, {skipped_count} None chat_id skipped)"
+        )
+        return created_ids
+
+    async def _copy_insert_raw_posts(
+        self,
+        conn: AsyncConnection,
+        records: list[tuple[Any, ...]],
+        chunk_size: int,
+    ) -> list[UUID]:
+        """COPY records into a temp staging table and move them into raw_posts.
+
+        The staging table lives for the current transaction only (ON COMMIT DROP)
+        and is truncated before every chunk, so repeated calls in one transaction
+        are safe.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        await conn.execute(_CREATE_STAGING_SQL)
+
+        raw_conn = await conn.get_raw_connection()
+        asyncpg_conn = raw_conn.driver_connection
+
+        created_ids: list[UUID] = []
+        for start in range(0, len(records), chunk_size):
+            chunk = records[start : start + chunk_size]
+
+            await conn.execute(_TRUNCATE_STAGING_SQL)
+            await asyncpg_conn.copy_records_to_table(
+                _STAGING_TABLE,
+                records=chunk,
+                columns=_STAGING_COLUMNS,
+            )
+            result = await conn.execute(_INSERT_FROM_STAGING_SQL)
+            created_ids.extend(row[0] for row in result.fetchall())
+
+        return created_ids
+
+    @staticmethod
+    def _build_rss_values(post: dict[str, Any]) -> dict[str, Any]:
+        """Build raw_posts insert values for an RSS/Web post dict."""
+        values = {
+            "raw_feed_id": post["raw_feed_id"],
+            "content": post["content"],
+            "title": post["title"],
+            "media_objects": post["media_objects"],
+            "rp_unique_code": post["rp_unique_code"],
+            "media_group_id": post.get("media_group_id"),
+            "telegram_message_id": None,  # Not applicable for RSS
+            "source_url": post.get("source_url"),
+        }
+
+        # Add created_at if provided
+        if "created_at" in post and post["created_at"] is not None:
+            values["created_at"] = post["created_at"]
+
+        RawPostRepository._add_moderation_values(values, post)
+        return values
+
+    @staticmethod
+    def _build_telegram_values(post: dict[str, Any]) -> dict[str, Any]:
+        """Build raw_posts insert values for a Telegram post dict."""
+        telegram_chat_id = post["telegram_chat_id"]
+        telegram_message_id = post["telegram_message_id"]
+        media_group_id = post.get("media_group_id")
+
+        if media_group_id:
+            rp_unique_code = f"tg_{telegram_chat_id}_{media_group_id}"
+        else:
+            rp_unique_code = f"tg_{telegram_chat_id}_{telegram_message_id}"
+
+        values = {
+            "raw_feed_id": post["raw_feed_id"],
+            "content": post["content"],
+            "title": post["title"],
+            "media_objects": post["media_objects"],
+            "rp_unique_code": rp_unique_code,
+            "media_group_id": media_group_id,
+            "telegram_message_id": telegram_message_id,
+        }
+
+        if "created_at" in post and post["created_at"] is not None:
+            values["created_at"] = post["created_at"]
+
+        RawPostRepository._add_moderation_values(values, post)
+        return values
+
+    @staticmethod
+    def _add_moderation_values(values: dict[str, Any], post: dict[str, Any]) -> None:
+        """Copy moderation fields that are set on the post into values."""
+        for field in _MODERATION_FIELDS:
+            if post.get(field) is not None:
+                values[field] = post[field]
+
+    @staticmethod
+    def _to_staging_record(values: dict[str, Any]) -> tuple[Any, ...]:
+        """Convert insert values into a COPY record ordered by _STAGING_COLUMNS.
+
+        JSONB columns are serialized here because COPY bypasses SQLAlchemy's
+        type processing; missing columns become NULL and get defaults on insert.
+        """
+        return tuple(
+            json.dumps(values[column])
+            if column in _JSONB_STAGING_COLUMNS and values.get(column) is not None
+            else values.get(column)
+            for column in _STAGING_COLUMNS
+        )
+
     async def _offset_table_exists(self, conn: AsyncConnection) -> bool:
         """Check if prompts_raw_feeds_offsets table exists.
 
@@ -573,10 +808,7 @@ class RawPostRepository:
         """
         try:
             result = await conn.execute(
-                text(
-                    "SELECT EXISTS (SELECT FROM information_schema.tables "
-                    "WHERE table_schema = :schema AND table_name = :table_name)"
-                ),
+                _OFFSET_TABLE_EXISTS_SQL,
                 {"schema": "public", "table_name": "prompts_raw_feeds_offsets"},
             )
             return bool(result.scalar())
@@ -594,7 +826,8 @@ class RawPostRepository:
         prompt_id: UUID,
         last_execution: datetime | None,
         limit: int | None,
-    ) -> list[dict[str, Any]]:
+        shape: RowShape = dict,
+    ) -> list[Any]:
         """Get raw posts using offset-based filtering."""
         from sqlalchemy import or_
         from sqlalchemy.sql.expression import ColumnElement
@@ -633,10 +866,7 @@ class RawPostRepository:
                 )
             )
             .where(prompts_raw_feeds.c.prompt_id == prompt_id)
-            .where(
-                (raw_posts.c.moderation_action.is_(None))
-                | (raw_posts.c.moderation_action != "block")
-            )
+            .where(_NOT_BLOCKED)
         )
 
         filter_conditions: list[ColumnElement[bool]] = [
@@ -662,7 +892,7 @@ class RawPostRepository:
             query = query.limit(limit)
 
         result = await conn.execute(query)
-        return [dict(row._mapping) for row in result.fetchall()]
+        return shape_rows(result.fetchall(), shape)
 
     async def _get_raw_posts_by_timestamp(
         self,
@@ -670,7 +900,8 @@ class RawPostRepository:
         prompt_id: UUID,
         last_execution: datetime | None,
         limit: int | None,
-    ) -> list[dict[str, Any]]:
+        shape: RowShape = dict,
+    ) -> list[Any]:
         """Get raw posts using timestamp-based filtering."""
         query = (
             select(
@@ -683,10 +914,7 @@ class RawPostRepository:
                 ).join(raw_posts, raw_posts.c.raw_feed_id == raw_feeds.c.id)
             )
             .where(prompts_raw_feeds.c.prompt_id == prompt_id)
-            .where(
-                (raw_posts.c.moderation_action.is_(None))
-                | (raw_posts.c.moderation_action != "block")
-            )
+            .where(_NOT_BLOCKED)
         )
 
         if last_execution:
@@ -698,7 +926,7 @@ class RawPostRepository:
             query = query.limit(limit)
 
         result = await conn.execute(query)
-        return [dict(row._mapping) for row in result.fetchall()]
+        return shape_rows(result.fetchall(), shape)
 
     async def get_raw_posts_by_prompt(
         self,
@@ -707,7 +935,8 @@ class RawPostRepository:
         last_execution: datetime | None,
         limit: int | None = None,
         use_offsets: bool = True,
-    ) -> list[dict[str, Any]]:
+        shape: RowShape = dict,
+    ) -> list[Any]:
         """Get raw_posts for a prompt using offset-based or timestamp-based filtering.
 
         This method joins prompts_raw_feeds -> raw_feeds -> raw_posts
@@ -724,14 +953,15 @@ class RawPostRepository:
             last_execution: Fallback timestamp filter (for backward compatibility)
             limit: Maximum number of posts to return. If None, returns all.
             use_offsets: Whether to use offset-based filtering (default True)
+            shape: Row format, see shared.repositories.base.shape_rows
 
         Returns:
-            List of dictionaries containing raw_post data with telegram_username, raw_feed_id
+            List of raw_post rows (dicts by default) with telegram_username, raw_feed_id
         """
         if use_offsets and await self._offset_table_exists(conn):
             try:
                 return await self._get_raw_posts_with_offsets(
-                    conn, prompt_id, last_execution, limit
+                    conn, prompt_id, last_execution, limit, shape
                 )
             except Exception as e:
                 logger.warning(
@@ -740,7 +970,7 @@ class RawPostRepository:
                 )
 
         return await self._get_raw_posts_by_timestamp(
-            conn, prompt_id, last_execution, limit
+            conn, prompt_id, last_execution, limit, shape
         )
 
     async def get_by_id(
@@ -773,7 +1003,8 @@ class RawPostRepository:
         raw_feed_id: UUID,
         limit: int | None = None,
         offset: int = 0,
-    ) -> list[dict[str, Any]]:
+        shape: RowShape = dict,
+    ) -> list[Any]:
         """Get all raw_posts for a raw_feed.
 
         Args:
@@ -781,17 +1012,15 @@ class RawPostRepository:
             raw_feed_id: ID of the raw_feed
             limit: Maximum number of posts to return
             offset: Number of posts to skip (for pagination)
+            shape: Row format, see shared.repositories.base.shape_rows
 
         Returns:
-            List of dictionaries containing raw_post data
+            List of raw_post rows (dicts by default)
         """
         query = (
             select(raw_posts)
             .where(raw_posts.c.raw_feed_id == raw_feed_id)
-            .where(
-                (raw_posts.c.moderation_action.is_(None))
-                | (raw_posts.c.moderation_action != "block")
-            )
+            .where(_NOT_BLOCKED)
             .order_by(raw_posts.c.created_at.desc())
         )
 
@@ -802,23 +1031,25 @@ class RawPostRepository:
             query = query.limit(limit)
 
         result = await conn.execute(query)
-        return [dict(row._mapping) for row in result.fetchall()]
+        return shape_rows(result.fetchall(), shape)
 
     async def get_by_telegram_usernames(
         self,
         conn: AsyncConnection,
         telegram_usernames: list[str],
         limit: int = 10,
-    ) -> list[dict[str, Any]]:
+        shape: RowShape = dict,
+    ) -> list[Any]:
         """Get raw_posts by multiple telegram usernames.
 
         Args:
             conn: Database connection
             telegram_usernames: List of channel @usernames (with or without @)
             limit: Maximum number of posts to return (default 10)
+            shape: Row format, see shared.repositories.base.shape_rows
 
         Returns:
-            List of dictionaries containing raw_post data, ordered by created_at desc
+            List of raw_post rows (dicts by default), ordered by created_at desc
         """
         normalized = [
             u.lstrip("@").lower() for u in telegram_usernames if u and u.strip()
@@ -836,4 +1067,4 @@ class RawPostRepository:
         )
 
         result = await conn.execute(query)
-        return [dict(row._mapping) for row in result.fetchall()]
+        return shape_rows(result.fetchall(), shape)
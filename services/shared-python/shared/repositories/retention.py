@@ -0,0 +1,92 @@
+"""Repository for time-based retention of raw_posts and posts."""
+
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+RETENTION_BATCH_SIZE = 5000
+
+# Oldest rows first via ix_raw_posts_created_at. Rows still used as a
+# processing offset are kept: ON DELETE SET NULL would reset that source's
+# offset and reprocess its whole backlog.
+_PURGE_RAW_POSTS_SQL = text("""
+    DELETE FROM raw_posts
+    WHERE id IN (
+        SELECT rp.id
+        FROM raw_posts rp
+        WHERE rp.created_at < :cutoff
+          AND NOT EXISTS (
+              SELECT 1
+              FROM prompts_raw_feeds_offsets o
+              WHERE o.last_processed_raw_post_id = rp.id
+          )
+        ORDER BY rp.created_at
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+""")
+
+# Oldest rows first via ix_posts_created_at; posts_seen, sources and
+# documents rows go with them (ON DELETE CASCADE).
+_PURGE_POSTS_SQL = text("""
+    DELETE FROM posts
+    WHERE id IN (
+        SELECT p.id
+        FROM posts p
+        WHERE p.created_at < :cutoff
+        ORDER BY p.created_at
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+""")
+
+
+class RetentionRepository:
+    """Deletes rows older than a cutoff in bounded batches.
+
+    Each call deletes at most batch_size rows so callers can commit between
+    batches and keep transactions (and the WAL/vacuum burst) small.
+    """
+
+    async def purge_raw_posts_before(
+        self,
+        conn: AsyncConnection,
+        cutoff: datetime,
+        batch_size: int = RETENTION_BATCH_SIZE,
+    ) -> int:
+        """Delete one batch of raw_posts created before cutoff.
+
+        Args:
+            conn: Database connection
+            cutoff: Delete rows with created_at < cutoff
+            batch_size: Maximum rows to delete
+
+        Returns:
+            Number of rows deleted
+        """
+        result = await conn.execute(
+            _PURGE_RAW_POSTS_SQL, {"cutoff": cutoff, "batch_size": batch_size}
+        )
+        return int(result.rowcount or 0)
+
+    async def purge_posts_before(
+        self,
+        conn: AsyncConnection,
+        cutoff: datetime,
+        batch_size: int = RETENTION_BATCH_SIZE,
+    ) -> int:
+        """Delete one batch of posts created before cutoff.
+
+        Args:
+            conn: Database connection
+            cutoff: Delete rows with created_at < cutoff
+            batch_size: Maximum rows to delete
+
+        Returns:
+            Number of rows deleted
+        """
+        result = await conn.execute(
+            _PURGE_POSTS_SQL, {"cutoff": cutoff, "batch_size": batch_size}
+        )
+        return int(result.rowcount or 0)
@@ -17,6 +17,11 @@ from shared.enums import (
     SubscriptionStatus,
     TransactionType,
 )
+from shared.utils.ttl_cache import get_cache
+
+PLANS_CACHE = "subscription_plans"
+
+_plans_cache = get_cache(PLANS_CACHE)
 
 
 class SubscriptionRepository:
@@ -27,6 +32,8 @@ class SubscriptionRepository:
     ) -> dict[str, Any] | None:
         """Get subscription plan by plan type.
 
+        Served from the process-wide "subscription_plans" reference cache.
+
         Args:
             conn: Database connection
             plan_type: Plan type (FREE or PRO)
@@ -34,12 +41,17 @@ class SubscriptionRepository:
         Returns:
             Plan data dict or None if not found
         """
-        query = select(subscription_plans).where(
-            subscription_plans.c.plan_type == plan_type
-        )
-        result = await conn.execute(query)
-        row = result.fetchone()
-        return dict(row._mapping) if row else None
+
+        async def load() -> dict[str, Any] | None:
+            query = select(subscription_plans).where(
+                subscription_plans.c.plan_type == plan_type
+            )
+            result = await conn.execute(query)
+            row = result.fetchone()
+            return dict(row._mapping) if row else None
+
+        plan = await _plans_cache.get_or_load(str(plan_type), load)
+        return dict(plan) if plan else None
 
     async def get_active_subscription(
         self, conn: AsyncConnection, user_id: UUID
@@ -7,6 +7,11 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from shared.database.tables import suggestions
+from shared.utils.ttl_cache import get_cache
+
+SUGGESTIONS_CACHE = "suggestions"
+
+_suggestions_cache = get_cache(SUGGESTIONS_CACHE)
 
 
 async def resolve_suggestion_uuids(
@@ -48,6 +53,8 @@ class SuggestionRepository:
     ) -> list[dict[str, Any]]:
         """Get suggestions by type with all localized names.
 
+        Served from the process-wide "suggestions" reference cache.
+
         Args:
             conn: Database connection
             suggestion_type: Type of suggestion (filter, view, source)
@@ -55,8 +62,13 @@ class SuggestionRepository:
         Returns:
             List of suggestion dictionaries with id and name (JSONB dict with en/ru keys)
         """
-        query = select(
-            suggestions.c.id, suggestions.c.name, suggestions.c.source_type
-        ).where(suggestions.c.type == suggestion_type)
-        result = await conn.execute(query)
-        return [dict(row._mapping) for row in result.fetchall()]
+
+        async def load() -> list[dict[str, Any]]:
+            query = select(
+                suggestions.c.id, suggestions.c.name, suggestions.c.source_type
+            ).where(suggestions.c.type == suggestion_type)
+            result = await conn.execute(query)
+            return [dict(row._mapping) for row in result.fetchall()]
+
+        cached = await _suggestions_cache.get_or_load(suggestion_type, load)
+        return [dict(row) for row in cached]
@@ -6,6 +6,11 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from shared.database.tables import tags
+from shared.utils.ttl_cache import get_cache
+
+TAGS_CACHE = "tags"
+
+_tags_cache = get_cache(TAGS_CACHE)
 
 
 class TagRepository:
@@ -14,12 +19,19 @@ class TagRepository:
     async def get_all_tags(self, conn: AsyncConnection) -> list[dict[str, Any]]:
         """Get all available tags ordered by name.
 
+        Served from the process-wide "tags" reference cache.
+
         Args:
             conn: Database connection
 
         Returns:
             List of tag dictionaries with id, name, created_at
         """
-        query = select(tags).order_by(tags.c.name)
-        result = await conn.execute(query)
-        return [dict(row._mapping) for row in result.fetchall()]
+
+        async def load() -> list[dict[str, Any]]:
+            query = select(tags).order_by(tags.c.name)
+            result = await conn.execute(query)
+            return [dict(row._mapping) for row in result.fetchall()]
+
+        cached = await _tags_cache.get_or_load("all", load)
+        return [dict(row) for row in cached]
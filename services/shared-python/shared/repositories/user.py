@@ -1,8 +1,9 @@
 import logging
+from datetime import timedelta
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import delete, exists, func, select, update
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from shared.database.tables import (
@@ -10,6 +11,7 @@ from shared.database.tables import (
     chats,
     feedbacks,
     feeds,
+    posts,
     posts_seen,
     user_subscriptions,
     users_feeds,
@@ -18,25 +20,42 @@ from shared.database.tables import (
 
 logger = logging.getLogger(__name__)
 
+# Feeds younger than this are never treated as orphaned (see
+# UserRepository.purge_orphaned_feeds_chunk)
+ORPHANED_FEED_MIN_AGE = timedelta(hours=1)
+
 
 class UserRepository:
     """Repository for user-related database operations"""
 
-    async def delete_user(self, conn: AsyncConnection, user_id: UUID) -> dict[str, Any]:
+    async def delete_user(
+        self,
+        conn: AsyncConnection,
+        user_id: UUID,
+        defer_feed_purge: bool = False,
+    ) -> dict[str, Any]:
         """
         Delete user and all associated data.
 
         Deletion order:
-        1. Find user's feed_ids via users_feeds
-        2. Delete users_feeds (user's subscriptions)
-        3. Identify orphaned feeds (no remaining subscribers)
-        4. Delete orphaned feeds (CASCADE: prompts → posts → sources, documents)
-        5. Cancel active subscriptions (status → CANCELLED)
-        6. Delete user data (chats, tags, posts_seen, feedbacks)
+        1. Delete users_feeds (user's subscriptions), returning their feed_ids
+        2. Delete feeds that no longer have subscribers in one statement
+           (CASCADE: prompts → posts → sources, documents)
+        3. Cancel active subscriptions (status → CANCELLED)
+        4. Delete user data (chats, tags, posts_seen, feedbacks)
+
+        With defer_feed_purge=True step 2 is skipped to keep this transaction
+        short. The feeds are already unreachable for the user;
+        purge_orphaned_feeds_chunk (run by RetentionJob with
+        purge_orphaned_feeds) finds and removes them in the background, once
+        they are older than ORPHANED_FEED_MIN_AGE. Their ids are returned in
+        "orphaned_feed_ids"; marketplace feeds, which the purge keeps, are
+        not listed.
 
         Args:
             conn: Database connection
             user_id: UUID of user to delete
+            defer_feed_purge: Leave orphaned feeds for a background purge
 
         Returns:
             Dictionary with deletion statistics
@@ -45,36 +64,26 @@ class UserRepository:
             ValueError: If user doesn't exist or has no data
         """
         try:
-            # 1. Find user's feed_ids via users_feeds
-            feed_ids = await self._get_user_feed_ids(conn, user_id)
-            logger.info(f"Found {len(feed_ids)} feeds for user {user_id}")
-
-            # 2. Delete users_feeds (user's subscriptions)
-            deleted_users_feeds = await self._delete_user_feeds(conn, user_id)
-            logger.info(f"Deleted {deleted_users_feeds} users_feeds for user {user_id}")
-
-            # 3. Identify orphaned feeds (no remaining subscribers)
-            orphaned_feeds = []
-            for feed_id in feed_ids:
-                subscriber_count = await self._get_feed_subscriber_count(conn, feed_id)
-                if subscriber_count == 0:
-                    orphaned_feeds.append(feed_id)
-
-            logger.info(
-                f"Found {len(orphaned_feeds)} orphaned feeds for user {user_id}"
-            )
-
-            # 4. Delete orphaned feeds (CASCADE: prompts → posts → sources, documents)
-            for feed_id in orphaned_feeds:
-                await self._delete_feed(conn, feed_id)
-
-            logger.info(f"Deleted {len(orphaned_feeds)} orphaned feeds")
-
-            # 5. Cancel active subscriptions (status → CANCELLED)
+            # 1. Delete users_feeds (user's subscriptions)
+            feed_ids = await self._delete_user_feeds(conn, user_id)
+            logger.info(f"Deleted {len(feed_ids)} users_feeds for user {user_id}")
+
+            # 2. Delete orphaned feeds (no remaining subscribers)
+            if defer_feed_purge:
+                orphaned_feeds = await self._get_purgeable_feed_ids(conn, feed_ids)
+                logger.info(
+                    f"Deferred purge of {len(orphaned_feeds)} orphaned feeds "
+                    f"for user {user_id}"
+                )
+            else:
+                orphaned_feeds = await self._delete_orphaned_feeds(conn, feed_ids)
+                logger.info(f"Deleted {len(orphaned_feeds)} orphaned feeds")
+
+            # 3. Cancel active subscriptions (status → CANCELLED)
             cancelled_count = await self._cancel_active_subscriptions(conn, user_id)
             logger.info(f"Cancelled {cancelled_count} active subscriptions")
 
-            # 6. Delete user data
+            # 4. Delete user data
             deleted_chats = await self._delete_user_chats(conn, user_id)
             deleted_tags = await self._delete_user_tags(conn, user_id)
             deleted_posts_seen = await self._delete_user_posts_seen(conn, user_id)
@@ -85,16 +94,19 @@ class UserRepository:
                 f"posts_seen={deleted_posts_seen}, feedbacks={deleted_feedbacks}"
             )
 
-            # 7. Return deletion statistics
-            return {
+            # 5. Return deletion statistics
+            stats: dict[str, Any] = {
                 "user_id": str(user_id),
-                "deleted_feeds": len(orphaned_feeds),
+                "deleted_feeds": 0 if defer_feed_purge else len(orphaned_feeds),
                 "cancelled_subscriptions": cancelled_count,
                 "deleted_chats": deleted_chats,
                 "deleted_tags": deleted_tags,
                 "deleted_posts_seen": deleted_posts_seen,
                 "deleted_feedbacks": deleted_feedbacks,
             }
+            if defer_feed_purge:
+                stats["orphaned_feed_ids"] = orphaned_feeds
+            return stats
 
         except ValueError:
             # Re-raise for controller (404/400)
@@ -104,6 +116,60 @@ class UserRepository:
             logger.error(f"Failed to delete user {user_id}: {e}", exc_info=True)
             raise
 
+    async def purge_orphaned_feeds_chunk(
+        self,
+        conn: AsyncConnection,
+        batch_size: int = 1000,
+        min_age: timedelta = ORPHANED_FEED_MIN_AGE,
+    ) -> int:
+        """
+        Purge one chunk of feeds that no user is subscribed to.
+
+        Orphans are found with NOT EXISTS users_feeds rather than from a list
+        handed over by delete_user(defer_feed_purge=True), so feeds orphaned
+        by a process that died before purging (or by go-api deletes) are
+        picked up too. Marketplace feeds and feeds younger than min_age are
+        skipped: go-api inserts the feed and its users_feeds row in separate
+        statements.
+
+        Deletes up to batch_size posts (CASCADE: sources, posts_seen, documents)
+        of orphaned feeds; once they have no posts left, deletes up to
+        batch_size of the feed rows themselves.
+
+        Run each call in its own transaction and repeat until it returns 0.
+
+        Args:
+            conn: Database connection
+            batch_size: Maximum number of posts (or feeds) deleted per call
+            min_age: Minimum feed age before it counts as orphaned
+
+        Returns:
+            Number of posts and feeds deleted (0 when the purge is complete)
+        """
+        orphaned = select(feeds.c.id).where(self._unsubscribed_feeds_filter(min_age))
+        post_chunk = (
+            select(posts.c.id)
+            .where(posts.c.feed_id.in_(orphaned))
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await conn.execute(delete(posts).where(posts.c.id.in_(post_chunk)))
+        deleted_posts = int(result.rowcount or 0)
+        if deleted_posts:
+            return deleted_posts
+
+        feed_chunk = (
+            orphaned.limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await conn.execute(delete(feeds).where(feeds.c.id.in_(feed_chunk)))
+        deleted_feeds = int(result.rowcount or 0)
+        if deleted_feeds:
+            logger.info(f"Purged {deleted_feeds} orphaned feeds")
+        return deleted_feeds
+
     async def is_user_admin(self, conn: AsyncConnection, user_id: UUID) -> bool:
         """
         Check if user has admin privileges.
@@ -125,40 +191,62 @@ class UserRepository:
 
     # Private helper methods
 
-    async def _get_user_feed_ids(
+    async def _delete_user_feeds(
         self, conn: AsyncConnection, user_id: UUID
     ) -> list[UUID]:
-        """Get all feed_ids that user is subscribed to"""
-        query = select(users_feeds.c.feed_id).where(users_feeds.c.user_id == user_id)
-        result = await conn.execute(query)
-        rows = result.fetchall()
-        return [row[0] for row in rows]
-
-    async def _delete_user_feeds(self, conn: AsyncConnection, user_id: UUID) -> int:
-        """Delete user's feed subscriptions"""
-        query = delete(users_feeds).where(users_feeds.c.user_id == user_id)
+        """Delete user's feed subscriptions, returning the unsubscribed feed_ids"""
+        query = (
+            delete(users_feeds)
+            .where(users_feeds.c.user_id == user_id)
+            .returning(users_feeds.c.feed_id)
+        )
         result = await conn.execute(query)
-        return int(result.rowcount or 0)
+        return [row[0] for row in result.fetchall() if row[0] is not None]
+
+    def _unsubscribed_feeds_filter(self, min_age: timedelta | None) -> Any:
+        """Non-marketplace feeds older than min_age (if set) without subscribers"""
+        condition = ~exists().where(
+            users_feeds.c.feed_id == feeds.c.id
+        ) & feeds.c.is_marketplace.isnot(True)
+        if min_age is not None:
+            condition &= feeds.c.created_at < func.now() - min_age
+        return condition
+
+    def _orphaned_feeds_filter(self, feed_ids: list[UUID]) -> Any:
+        """Feeds from feed_ids that have no remaining subscribers"""
+        return feeds.c.id.in_(feed_ids) & ~exists().where(
+            users_feeds.c.feed_id == feeds.c.id
+        )
 
-    async def _get_feed_subscriber_count(
-        self, conn: AsyncConnection, feed_id: UUID
-    ) -> int:
-        """Get count of subscribers for a feed"""
-        query = (
-            select(func.count())
-            .select_from(users_feeds)
-            .where(users_feeds.c.feed_id == feed_id)
+    async def _get_purgeable_feed_ids(
+        self, conn: AsyncConnection, feed_ids: list[UUID]
+    ) -> list[UUID]:
+        """Get feeds from feed_ids that purge_orphaned_feeds_chunk will delete"""
+        if not feed_ids:
+            return []
+        # No age check: young feeds are purged once they reach min_age
+        query = select(feeds.c.id).where(
+            feeds.c.id.in_(feed_ids) & self._unsubscribed_feeds_filter(min_age=None)
         )
         result = await conn.execute(query)
-        count = result.scalar()
-        return int(count) if count is not None else 0
+        return [row[0] for row in result.fetchall()]
 
-    async def _delete_feed(self, conn: AsyncConnection, feed_id: UUID) -> None:
+    async def _delete_orphaned_feeds(
+        self, conn: AsyncConnection, feed_ids: list[UUID]
+    ) -> list[UUID]:
         """
-        Delete feed (CASCADE deletion of prompts → posts → sources, documents).
+        Delete feeds from feed_ids that have no remaining subscribers
+        (CASCADE deletion of prompts → posts → sources, documents).
         """
-        query = delete(feeds).where(feeds.c.id == feed_id)
-        await conn.execute(query)
+        if not feed_ids:
+            return []
+        query = (
+            delete(feeds)
+            .where(self._orphaned_feeds_filter(feed_ids))
+            .returning(feeds.c.id)
+        )
+        result = await conn.execute(query)
+        return [row[0] for row in result.fetchall()]
 
     async def _cancel_active_subscriptions(
         self, conn: AsyncConnection, user_id: UUID
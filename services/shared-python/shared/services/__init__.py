@@ -1,5 +1,16 @@
 """Shared services for makefeed microservices."""
 
-from shared.services.digest_scheduler import DigestScheduler
+from shared.services.digest_scheduler import DigestScheduler, DigestScheduleResult
+from shared.services.digest_shaping import DigestScheduleShaper
+from shared.services.marketplace_catalog_refresher import MarketplaceCatalogRefresher
+from shared.services.pricing_reloader import PricingReloader
+from shared.services.retention_job import RetentionJob
 
-__all__ = ["DigestScheduler"]
+__all__ = [
+    "DigestScheduler",
+    "DigestScheduleResult",
+    "DigestScheduleShaper",
+    "MarketplaceCatalogRefresher",
+    "PricingReloader",
+    "RetentionJob",
+]
@@ -1,33 +1,191 @@
 """Service for scheduling digest executions via NATS JetStream."""
 
 import asyncio
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 from faststream.nats import NatsBroker, Schedule
 from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncConnection
 
+from shared.database.connection import SessionMaker
 from shared.events.digest_scheduled import DigestScheduledEvent
 from shared.faststream.digest_stream import (
     DIGEST_EXECUTE_SUBJECT,
     DIGEST_PENDING_SUBJECT,
     DIGEST_STREAM_NAME,
 )
+from shared.repositories.prompt import PromptRepository
+from shared.services.digest_shaping import DigestScheduleShaper
 
 MAX_RETRY_ATTEMPTS = 3
 INITIAL_RETRY_DELAY_SECONDS = 1.0
+DEFAULT_MAX_IN_FLIGHT = 64
+DEFAULT_HISTOGRAM_HORIZON_HOURS = 48
+
+
+def digest_msg_id(prompt_id: UUID, replaces: datetime | None) -> str:
+    """Nats-Msg-Id of the digest run that follows the run at replaces.
+
+    Keyed on the run being replaced rather than on the new run time, so
+    every attempt to schedule the same next run (retries, redelivered
+    digest.execute messages, concurrent schedulers) gets the same id.
+
+    Args:
+        prompt_id: Prompt the digest belongs to
+        replaces: Run time of the digest being followed up (None for a
+            prompt's first scheduled run)
+    """
+    run = (
+        "first"
+        if replaces is None
+        else f"{replaces.astimezone(timezone.utc):%Y%m%dT%H%M%S}"
+    )
+    return f"digest:{prompt_id}:{run}"
+
+
+@dataclass(frozen=True)
+class DigestScheduleResult:
+    """Outcome of scheduling one digest.
+
+    Attributes:
+        prompt_id: Prompt the digest belongs to
+        scheduled_at: Time the digest was scheduled for
+        duplicate: JetStream dropped the message as a duplicate (already
+            scheduled within the stream's duplicate window)
+        error: Last error if every attempt failed, else None
+    """
+
+    prompt_id: UUID
+    scheduled_at: datetime
+    duplicate: bool = False
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the digest is scheduled (newly or as a duplicate)."""
+        return self.error is None
 
 
 class DigestScheduler:
-    """Schedules digest executions using NATS JetStream scheduled messages."""
+    """Schedules digest executions using NATS JetStream scheduled messages.
 
-    def __init__(self, broker: NatsBroker) -> None:
+    With a DigestScheduleShaper, run times are spread within the plan's
+    tolerance window instead of landing exactly at now + interval_hours.
+    The chosen times are recorded in prompts.digest_scheduled_at (see
+    save_schedule), which load_schedule_histogram reads back, so every
+    scheduler process shapes against the runs all of them placed.
+    """
+
+    def __init__(
+        self, broker: NatsBroker, shaper: DigestScheduleShaper | None = None
+    ) -> None:
         self.broker = broker
+        self.shaper = shaper
+        self._histogram_loaded_at: float | None = None
+
+    async def load_schedule_histogram(
+        self,
+        conn: AsyncConnection,
+        horizon_hours: int = DEFAULT_HISTOGRAM_HORIZON_HOURS,
+        max_age: float = 0.0,
+    ) -> None:
+        """Seed the shaper with DIGEST runs scheduled within horizon_hours.
+
+        Call at startup and periodically; no-op without a shaper.
+
+        Args:
+            conn: Database connection
+            horizon_hours: How far ahead to count scheduled runs
+            max_age: Skip the reload if the histogram was loaded less than
+                this many seconds ago
+        """
+        if self.shaper is None:
+            return
+        loaded_at = self._histogram_loaded_at
+        if loaded_at is not None and time.monotonic() - loaded_at < max_age:
+            return
+        now = datetime.now(timezone.utc)
+        counts = await PromptRepository().get_digest_run_histogram(
+            conn,
+            start=now,
+            end=now + timedelta(hours=horizon_hours),
+            slot_minutes=self.shaper.slot_minutes,
+        )
+        self.shaper.load_histogram(counts)
+        self._histogram_loaded_at = time.monotonic()
+
+    async def save_schedule(
+        self, conn: AsyncConnection, results: Iterable[DigestScheduleResult]
+    ) -> None:
+        """Record the run times of scheduled digests.
+
+        For duplicates this records the run time computed by this call; it
+        can differ from the message JetStream already holds if the histogram
+        changed in between.
+
+        Args:
+            conn: Database connection
+            results: Results of schedule_many / _schedule
+        """
+        await PromptRepository().set_digest_scheduled_at(
+            conn, {r.prompt_id: r.scheduled_at for r in results if r.ok}
+        )
+
+    async def schedule_prompts(
+        self,
+        session_maker: SessionMaker,
+        prompt_ids: list[UUID],
+        histogram_max_age: float = 0.0,
+        replaces: Mapping[UUID, datetime] | None = None,
+    ) -> list[DigestScheduleResult]:
+        """Schedule the next run of DIGEST prompts from their stored settings.
+
+        Reads each prompt's interval, owner plan and digest_scheduled_at,
+        refreshes the shaper's histogram if it is older than
+        histogram_max_age, publishes through schedule_many and records the
+        scheduled times. Prompts that are gone or no longer DIGEST are
+        skipped.
+
+        Args:
+            session_maker: Session factory
+            prompt_ids: Prompts to schedule
+            histogram_max_age: See load_schedule_histogram's max_age
+            replaces: Run that fired, per prompt (e.g. the scheduled_at of a
+                digest.execute message). Defaults to the stored
+                digest_scheduled_at, which a redelivered message may find
+                already overwritten by its first delivery.
+
+        Returns:
+            One DigestScheduleResult per scheduled prompt
+        """
+        async with session_maker() as conn:
+            await self.load_schedule_histogram(conn, max_age=histogram_max_age)
+            settings = await PromptRepository().get_digest_schedule_settings(
+                conn, prompt_ids
+            )
+        if not settings:
+            return []
+
+        results = await self.schedule_many(
+            [(row["prompt_id"], row["interval_hours"]) for row in settings],
+            plan_types={row["prompt_id"]: row["plan_type"] for row in settings},
+            replaces={row["prompt_id"]: row["digest_scheduled_at"] for row in settings}
+            | dict(replaces or {}),
+        )
+        async with session_maker() as conn:
+            await self.save_schedule(conn, results)
+        return results
 
     async def schedule_next_digest(
         self,
         prompt_id: UUID,
         interval_hours: int,
+        plan_type: str | None = None,
+        replaces: datetime | None = None,
     ) -> None:
         """Schedule next digest execution with retry logic.
 
@@ -40,11 +198,97 @@ class DigestScheduler:
         Args:
             prompt_id: ID of the prompt to execute
             interval_hours: Hours until next execution
+            plan_type: Feed owner's subscription plan (selects the shaping
+                tolerance; ignored without a shaper)
+            replaces: Run time of the digest this one follows (keys the
+                Nats-Msg-Id, see digest_msg_id)
 
         Raises:
             Exception: If all retry attempts fail
         """
-        scheduled_at = datetime.now(timezone.utc) + timedelta(hours=interval_hours)
+        result = await self._schedule(
+            prompt_id, interval_hours, datetime.now(timezone.utc), plan_type, replaces
+        )
+        if result.error is not None:
+            raise result.error
+
+    async def schedule_many(
+        self,
+        items: Iterable[tuple[UUID, int]],
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        plan_types: Mapping[UUID, str] | None = None,
+        replaces: Mapping[UUID, datetime | None] | None = None,
+    ) -> list[DigestScheduleResult]:
+        """Schedule many digests at once, e.g. after an outage or deploy.
+
+        Publishes are pipelined: up to max_in_flight publishes wait for their
+        JetStream acks at the same time, each with the same retry policy as
+        schedule_next_digest. Every message carries a Nats-Msg-Id built from
+        the prompt and the run it replaces (digest_msg_id), not from the new
+        run time: retries, redeliveries and other schedulers following up
+        the same run within the stream's duplicate window all publish the
+        same id, however much time passed or the shaping changed between
+        them, and JetStream keeps only the first.
+
+        Args:
+            items: (prompt_id, interval_hours) pairs
+            max_in_flight: Maximum concurrent unacknowledged publishes
+            plan_types: Subscription plan per prompt (for shaping)
+            replaces: Run time each prompt's new run follows (prompts not
+                in it are keyed as their first run)
+
+        Returns:
+            One DigestScheduleResult per item, in input order (failures are
+            reported in the result, not raised)
+        """
+        now = datetime.now(timezone.utc)
+        slots = asyncio.Semaphore(max_in_flight)
+
+        async def schedule_one(
+            prompt_id: UUID, interval_hours: int
+        ) -> DigestScheduleResult:
+            async with slots:
+                return await self._schedule(
+                    prompt_id,
+                    interval_hours,
+                    now,
+                    plan_types.get(prompt_id) if plan_types else None,
+                    replaces.get(prompt_id) if replaces else None,
+                )
+
+        results = list(
+            await asyncio.gather(
+                *(
+                    schedule_one(prompt_id, interval_hours)
+                    for prompt_id, interval_hours in items
+                )
+            )
+        )
+
+        failed = sum(1 for result in results if not result.ok)
+        duplicates = sum(1 for result in results if result.duplicate)
+        log = logger.error if failed else logger.info
+        log(
+            f"Scheduled {len(results) - failed}/{len(results)} digests "
+            f"({duplicates} duplicates, {failed} failed)"
+        )
+        return results
+
+    async def _schedule(
+        self,
+        prompt_id: UUID,
+        interval_hours: int,
+        now: datetime,
+        plan_type: str | None = None,
+        replaces: datetime | None = None,
+    ) -> DigestScheduleResult:
+        """Publish one scheduled digest, retrying with exponential backoff."""
+        base = (now + timedelta(hours=interval_hours)).replace(second=0, microsecond=0)
+        scheduled_at = base
+        if self.shaper is not None:
+            scheduled_at = self.shaper.next_run_at(
+                prompt_id, base, interval_hours, plan_type
+            ).replace(second=0, microsecond=0)
 
         event = DigestScheduledEvent(
             prompt_id=prompt_id,
@@ -56,21 +300,33 @@ class DigestScheduler:
             time=scheduled_at,
             target=DIGEST_EXECUTE_SUBJECT,
         )
+        msg_id = digest_msg_id(prompt_id, replaces)
 
         last_error: Exception | None = None
         for attempt in range(MAX_RETRY_ATTEMPTS):
             try:
-                await self.broker.publish(
+                ack = await self.broker.publish(
                     message=event.model_dump(mode="json"),
                     subject=DIGEST_PENDING_SUBJECT,
+                    headers={"Nats-Msg-Id": msg_id},
                     stream=DIGEST_STREAM_NAME,
                     schedule=schedule,
                 )
+                duplicate = bool(getattr(ack, "duplicate", False))
+                if duplicate and self.shaper is not None:
+                    # The run JetStream already holds was booked when it was
+                    # published (or is in the reloaded histogram)
+                    self.shaper.release(scheduled_at)
                 logger.info(
                     f"Scheduled digest for prompt={prompt_id} at {scheduled_at} "
-                    f"(interval={interval_hours}h)"
+                    f"(interval={interval_hours}h"
+                    f"{', duplicate' if duplicate else ''})"
+                )
+                return DigestScheduleResult(
+                    prompt_id=prompt_id,
+                    scheduled_at=scheduled_at,
+                    duplicate=duplicate,
                 )
-                return
             except Exception as e:
                 last_error = e
                 if attempt < MAX_RETRY_ATTEMPTS - 1:
@@ -86,4 +342,8 @@ class DigestScheduler:
             f"Failed to schedule digest for prompt={prompt_id} after "
             f"{MAX_RETRY_ATTEMPTS} attempts: {last_error}"
         )
-        raise last_error  # type: ignore[misc]
+        if self.shaper is not None:
+            self.shaper.release(scheduled_at)
+        return DigestScheduleResult(
+            prompt_id=prompt_id, scheduled_at=scheduled_at, error=last_error
+        )
@@ -0,0 +1,168 @@
+"""Schedule shaping for digest runs.
+
+Rescheduling every digest at exactly now + interval_hours keeps prompts
+created together (e.g. after a marketing push) firing together forever,
+which shows up as waves of feed_summary LLM calls. The shaper moves each
+run within a per-plan tolerance window:
+
+- every prompt gets a deterministic jitter derived from its id, so the
+  same prompt keeps a stable phase instead of drifting randomly;
+- within the window, the least-booked time slot wins (ties go to the slot
+  closest to the jittered time), using a histogram of upcoming runs.
+"""
+
+import hashlib
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from shared.enums import SubscriptionPlanType
+
+DEFAULT_SLOT_MINUTES = 15
+DEFAULT_TOLERANCE_MINUTES = 30
+DEFAULT_PLAN_TOLERANCE_MINUTES: dict[str, int] = {
+    SubscriptionPlanType.FREE: 90,
+    SubscriptionPlanType.PRO: 20,
+}
+
+_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+def _prompt_hash(prompt_id: UUID) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(prompt_id.bytes, digest_size=8).digest(), "big"
+    )
+
+
+class DigestScheduleShaper:
+    """Picks digest run times that spread load over time slots.
+
+    The histogram counts runs per slot_minutes slot. It is updated with
+    every run this shaper places and can be (re)loaded from the database
+    with load_histogram (see PromptRepository.get_digest_run_histogram),
+    so several scheduler processes converge on the same picture.
+
+    next_run_at books its run right away, so concurrent picks spread out
+    before any of them is published; a run that ends up not scheduled
+    must be handed back with release.
+    """
+
+    def __init__(
+        self,
+        slot_minutes: int = DEFAULT_SLOT_MINUTES,
+        plan_tolerance_minutes: Mapping[str, int] | None = None,
+        default_tolerance_minutes: int = DEFAULT_TOLERANCE_MINUTES,
+    ) -> None:
+        self._slot = timedelta(minutes=slot_minutes)
+        self._plan_tolerance = dict(
+            DEFAULT_PLAN_TOLERANCE_MINUTES
+            if plan_tolerance_minutes is None
+            else plan_tolerance_minutes
+        )
+        self._default_tolerance = default_tolerance_minutes
+        self._histogram: dict[datetime, int] = {}
+
+    @property
+    def slot_minutes(self) -> int:
+        """Histogram slot width in minutes."""
+        return int(self._slot.total_seconds() // 60)
+
+    def slot_start(self, moment: datetime) -> datetime:
+        """Start of the slot containing moment."""
+        return moment - (moment - _EPOCH) % self._slot
+
+    def load_histogram(self, counts: Mapping[datetime, int]) -> None:
+        """Replace the histogram with runs per slot start.
+
+        Args:
+            counts: Slot start -> number of scheduled runs
+        """
+        self._histogram = {self.slot_start(slot): n for slot, n in counts.items()}
+
+    def tolerance(self, interval_hours: int, plan_type: str | None = None) -> timedelta:
+        """Shaping window half-width for a plan, capped at half the interval.
+
+        Args:
+            interval_hours: Digest interval
+            plan_type: Subscription plan (FREE, PRO); None uses the default
+
+        Returns:
+            Maximum distance from now + interval_hours
+        """
+        minutes = self._plan_tolerance.get(plan_type or "", self._default_tolerance)
+        return min(timedelta(minutes=minutes), timedelta(hours=interval_hours) / 2)
+
+    def next_run_at(
+        self,
+        prompt_id: UUID,
+        base: datetime,
+        interval_hours: int,
+        plan_type: str | None = None,
+    ) -> datetime:
+        """Choose the run time for a digest and book it in the histogram.
+
+        Call release with the returned time if the run is not scheduled
+        after all (publish failed, duplicate message).
+
+        Args:
+            prompt_id: Prompt being scheduled
+            base: Unshaped run time (now + interval_hours)
+            interval_hours: Digest interval
+            plan_type: Subscription plan of the feed owner
+
+        Returns:
+            Run time within base +/- tolerance
+        """
+        tolerance = self.tolerance(interval_hours, plan_type)
+        if tolerance <= timedelta(0):
+            return base
+
+        self._prune(datetime.now(timezone.utc))
+
+        window = int(tolerance.total_seconds())
+        digest = _prompt_hash(prompt_id)
+        preferred = base + timedelta(seconds=digest % (2 * window + 1) - window)
+        earliest, latest = base - tolerance, base + tolerance
+
+        best_slot = slot = self.slot_start(earliest)
+        best_key = self._slot_key(slot, preferred)
+        while (slot := slot + self._slot) <= latest:
+            key = self._slot_key(slot, preferred)
+            if key < best_key:
+                best_slot, best_key = slot, key
+
+        slot_end = best_slot + self._slot - timedelta(seconds=1)
+        if best_slot <= preferred <= slot_end:
+            run_at = preferred
+        else:
+            offset = digest % int(self._slot.total_seconds())
+            run_at = best_slot + timedelta(seconds=offset)
+        run_at = min(max(run_at, earliest), latest)
+
+        booked = self.slot_start(run_at)
+        self._histogram[booked] = self._histogram.get(booked, 0) + 1
+        return run_at
+
+    def release(self, run_at: datetime) -> None:
+        """Undo the booking next_run_at made for run_at.
+
+        Args:
+            run_at: Run time returned by next_run_at (any time in the same
+                slot will do)
+        """
+        slot = self.slot_start(run_at)
+        runs = self._histogram.get(slot, 0)
+        if runs > 1:
+            self._histogram[slot] = runs - 1
+        else:
+            self._histogram.pop(slot, None)
+
+    def _slot_key(self, slot: datetime, preferred: datetime) -> tuple[int, timedelta]:
+        """Sort key: fewest booked runs first, then closest to preferred."""
+        return self._histogram.get(slot, 0), abs(slot + self._slot / 2 - preferred)
+
+    def _prune(self, before: datetime) -> None:
+        """Forget slots that ended before the given time."""
+        cutoff = self.slot_start(before)
+        for slot in [s for s in self._histogram if s < cutoff]:
+            del self._histogram[slot]
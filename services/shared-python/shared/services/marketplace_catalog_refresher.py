@@ -0,0 +1,67 @@
+"""Periodic refresh of the marketplace_catalog materialized view."""
+
+import asyncio
+
+from loguru import logger
+
+from shared.database.connection import SessionMaker
+from shared.repositories.marketplace import MarketplaceRepository
+
+DEFAULT_CATALOG_REFRESH_INTERVAL_SECONDS = 600.0
+
+
+class MarketplaceCatalogRefresher:
+    """Refreshes marketplace_catalog every interval seconds.
+
+    The view snapshots each marketplace feed's owner and the internal-account
+    exclusion from users_feeds. go-api subscribes, unsubscribes and marks
+    feeds as marketplace feeds without refreshing it, so changes show up
+    here within one interval. Other processes see them once their cached
+    tag lookups expire (CATALOG_CACHE_TTL_SECONDS).
+    """
+
+    def __init__(
+        self,
+        session_maker: SessionMaker,
+        interval: float = DEFAULT_CATALOG_REFRESH_INTERVAL_SECONDS,
+        repository: MarketplaceRepository | None = None,
+    ) -> None:
+        self._session_maker = session_maker
+        self._interval = interval
+        self._repository = repository or MarketplaceRepository()
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start refreshing every interval seconds."""
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(
+            self._run(), name="marketplace-catalog-refresher"
+        )
+        logger.info(f"MarketplaceCatalogRefresher started (interval={self._interval}s)")
+
+    async def stop(self) -> None:
+        """Stop the periodic task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("MarketplaceCatalogRefresher stopped")
+
+    async def refresh(self) -> None:
+        """Refresh the view now."""
+        async with self._session_maker() as conn:
+            await self._repository.refresh_marketplace_catalog(conn)
+
+    async def _run(self) -> None:
+        """Refresh every interval seconds."""
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Marketplace catalog refresh failed: {e}")
@@ -0,0 +1,96 @@
+"""Background reload of the LLM pricing snapshot."""
+
+import asyncio
+
+from loguru import logger
+
+from shared.database.connection import SessionMaker
+from shared.events.pricing_updated import PricingUpdatedEvent
+from shared.utils.llm_pricing import PricingSnapshot, load_pricing_from_db
+
+DEFAULT_PRICING_RELOAD_INTERVAL_SECONDS = 300.0
+
+
+class PricingReloader:
+    """Keeps shared.utils.llm_pricing in sync with the llm_models table.
+
+    Reloads every interval seconds, and right away when request_reload() is
+    called (wire it to the "pricing.updated" NATS event, which go-registry
+    publishes after its OpenRouter sync). The periodic reload also covers
+    price edits made outside that sync. Requests that
+    arrive while a reload is running are coalesced into one more reload.
+    A failed reload keeps the previous snapshot in use.
+    """
+
+    def __init__(
+        self,
+        session_maker: SessionMaker,
+        interval: float = DEFAULT_PRICING_RELOAD_INTERVAL_SECONDS,
+    ) -> None:
+        self._session_maker = session_maker
+        self._interval = interval
+        self._reload_requested = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Load pricing now and start the background reload task."""
+        if self._task is not None:
+            return
+        try:
+            snapshot = await self.reload()
+            logger.info(f"LLM pricing cache loaded ({len(snapshot.prices)} models)")
+        except Exception as e:
+            logger.error(f"Initial LLM pricing load failed, using defaults: {e}")
+        self._task = asyncio.create_task(self._run(), name="pricing-reloader")
+        logger.info(f"PricingReloader started (interval={self._interval}s)")
+
+    async def stop(self) -> None:
+        """Stop the background reload task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("PricingReloader stopped")
+
+    def request_reload(self, update: PricingUpdatedEvent | None = None) -> None:
+        """Schedule a reload as soon as possible.
+
+        Args:
+            update: Triggering event, if any (only used for logging)
+        """
+        if update is not None:
+            logger.debug(f"Pricing update received for {len(update.model_ids)} models")
+        self._reload_requested.set()
+
+    async def reload(self) -> PricingSnapshot:
+        """Load pricing from the database and swap in the new snapshot.
+
+        Returns:
+            The snapshot now in use
+        """
+        async with self._session_maker(readonly=True) as conn:
+            snapshot = await load_pricing_from_db(conn)
+        logger.debug(
+            f"LLM pricing loaded: version {snapshot.version}, "
+            f"{len(snapshot.prices)} models"
+        )
+        return snapshot
+
+    async def _run(self) -> None:
+        """Reload every interval seconds or when a reload is requested."""
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._reload_requested.wait(), timeout=self._interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._reload_requested.clear()
+            try:
+                await self.reload()
+            except Exception as e:
+                logger.error(f"LLM pricing reload failed: {e}")
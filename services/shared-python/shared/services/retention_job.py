@@ -0,0 +1,136 @@
+"""Periodic time-based retention for raw_posts and posts, and orphaned feed purge."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from shared.database.connection import SessionMaker
+from shared.repositories.retention import RETENTION_BATCH_SIZE, RetentionRepository
+from shared.repositories.user import UserRepository
+
+DEFAULT_RETENTION_INTERVAL_SECONDS = 3600.0
+
+PurgeBatch = Callable[[AsyncConnection, datetime, int], Awaitable[int]]
+
+
+class RetentionJob:
+    """Deletes raw_posts and posts older than their retention windows.
+
+    A table is only purged when its retention (in days) is set. With
+    purge_orphaned_feeds, feeds no user is subscribed to (e.g. left by
+    UserRepository.delete_user(defer_feed_purge=True)) are deleted too,
+    posts first. Each batch
+    runs in its own transaction, so a large backlog is removed in small
+    steps that autovacuum can keep up with, and concurrent writers are
+    never blocked for long (locked rows are skipped).
+    """
+
+    def __init__(
+        self,
+        session_maker: SessionMaker,
+        raw_posts_retention_days: int | None = None,
+        posts_retention_days: int | None = None,
+        batch_size: int = RETENTION_BATCH_SIZE,
+        interval: float = DEFAULT_RETENTION_INTERVAL_SECONDS,
+        purge_orphaned_feeds: bool = False,
+        repository: RetentionRepository | None = None,
+        user_repository: UserRepository | None = None,
+    ) -> None:
+        self._session_maker = session_maker
+        self._raw_posts_retention_days = raw_posts_retention_days
+        self._posts_retention_days = posts_retention_days
+        self._batch_size = batch_size
+        self._interval = interval
+        self._purge_orphaned_feeds = purge_orphaned_feeds
+        self._repository = repository or RetentionRepository()
+        self._user_repository = user_repository or UserRepository()
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start running the job every interval seconds."""
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="retention-job")
+        logger.info(
+            f"RetentionJob started (raw_posts={self._raw_posts_retention_days}d, "
+            f"posts={self._posts_retention_days}d, "
+            f"orphaned_feeds={self._purge_orphaned_feeds}, interval={self._interval}s)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the periodic task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("RetentionJob stopped")
+
+    async def run_once(self) -> dict[str, int]:
+        """Purge everything currently past retention.
+
+        Returns:
+            Rows deleted per table; "orphaned_feeds" counts the posts and feed
+            rows of orphaned feeds
+        """
+        now = datetime.now(timezone.utc)
+        stats = {"raw_posts": 0, "posts": 0, "orphaned_feeds": 0}
+
+        if self._posts_retention_days is not None:
+            stats["posts"] = await self._purge(
+                self._repository.purge_posts_before,
+                now - timedelta(days=self._posts_retention_days),
+            )
+        if self._raw_posts_retention_days is not None:
+            stats["raw_posts"] = await self._purge(
+                self._repository.purge_raw_posts_before,
+                now - timedelta(days=self._raw_posts_retention_days),
+            )
+
+        if self._purge_orphaned_feeds:
+            stats["orphaned_feeds"] = await self._purge_orphaned_feed_rows()
+
+        if any(stats.values()):
+            logger.info(
+                f"Retention purged {stats['raw_posts']} raw_posts, "
+                f"{stats['posts']} posts, "
+                f"{stats['orphaned_feeds']} orphaned feed rows"
+            )
+        return stats
+
+    async def _purge(self, purge_batch: PurgeBatch, cutoff: datetime) -> int:
+        """Run purge_batch until a batch comes back short."""
+        total = 0
+        while True:
+            async with self._session_maker() as conn:
+                deleted = await purge_batch(conn, cutoff, self._batch_size)
+            total += deleted
+            if deleted < self._batch_size:
+                return total
+
+    async def _purge_orphaned_feed_rows(self) -> int:
+        """Run purge_orphaned_feeds_chunk until it has nothing left to delete."""
+        total = 0
+        while True:
+            async with self._session_maker() as conn:
+                deleted = await self._user_repository.purge_orphaned_feeds_chunk(
+                    conn, batch_size=self._batch_size
+                )
+            total += deleted
+            if deleted == 0:
+                return total
+
+    async def _run(self) -> None:
+        """Run the job every interval seconds."""
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"RetentionJob run failed: {e}")
+            await asyncio.sleep(self._interval)
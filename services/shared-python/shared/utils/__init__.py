@@ -4,10 +4,18 @@ from shared.utils.html_converter import HTMLToMarkdownConverter
 from shared.utils.llm_cost_tracker import track_llm_cost_async
 from shared.utils.llm_pricing import (
     DEFAULT_PRICING,
+    PricingSnapshot,
     calculate_cost,
     get_model_pricing,
+    get_pricing_snapshot,
+)
+from shared.utils.media_converter import (
+    MediaKind,
+    classify_media_url,
+    convert_media_urls_to_objects,
 )
 from shared.utils.prompt_parser import extract_instruction_and_filters
+from shared.utils.ttl_cache import TTLCache, get_cache, invalidate_cache
 
 __all__ = [
     "HTMLToMarkdownConverter",
@@ -15,5 +23,13 @@ __all__ = [
     "DEFAULT_PRICING",
     "calculate_cost",
     "get_model_pricing",
+    "PricingSnapshot",
+    "get_pricing_snapshot",
     "track_llm_cost_async",
+    "MediaKind",
+    "classify_media_url",
+    "convert_media_urls_to_objects",
+    "TTLCache",
+    "get_cache",
+    "invalidate_cache",
 ]
@@ -5,14 +5,37 @@ from typing import cast
 
 from markdownify import markdownify as md
 
+# markdownify's whitespace normalization of text outside <pre>
+_NEWLINE_WHITESPACE_RE = re.compile(r"[\t \r\n]*[\r\n][\t \r\n]*")
+_WHITESPACE_RE = re.compile(r"[\t ]+")
+_EXTRA_NEWLINES_RE = re.compile(r"\n{3,}")
+
 
 class HTMLToMarkdownConverter:
     """Convert HTML content to clean Markdown format."""
 
+    @staticmethod
+    def is_plain_text(content: str) -> bool:
+        """Check whether content has nothing for an HTML parser to interpret.
+
+        Without "<" or "&" there are no tags or entities, and markdownify
+        only normalizes the text's whitespace.
+
+        Args:
+            content: Content string
+
+        Returns:
+            True if content can skip markdownify
+        """
+        return "<" not in content and "&" not in content
+
     @staticmethod
     def convert(html: str) -> str:
         """Convert HTML to clean Markdown.
 
+        Plain text (see is_plain_text) skips markdownify; its whitespace is
+        normalized the same way, so the output is identical.
+
         Args:
             html: HTML content string
 
@@ -22,6 +45,11 @@ class HTMLToMarkdownConverter:
         if not html or not html.strip():
             return ""
 
+        if HTMLToMarkdownConverter.is_plain_text(html):
+            text = _NEWLINE_WHITESPACE_RE.sub("\n", html)
+            text = _WHITESPACE_RE.sub(" ", text)
+            return HTMLToMarkdownConverter._clean_whitespace(text)
+
         # Convert HTML to Markdown using markdownify
         markdown = cast(
             str,
@@ -55,7 +83,7 @@ class HTMLToMarkdownConverter:
         text = "\n".join(line.rstrip() for line in text.split("\n"))
 
         # Replace 3+ newlines with 2 newlines
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _EXTRA_NEWLINES_RE.sub("\n\n", text)
 
         # Remove leading/trailing whitespace
         text = text.strip()
@@ -2,16 +2,23 @@
 
 Loads pricing from database (synced from OpenRouter API).
 Falls back to conservative default pricing if model not found.
+
+Pricing lives in an immutable, versioned snapshot. Reloads build a complete
+new snapshot and swap it in with a single assignment, so requests in flight
+always see one consistent version and lookups never copy or allocate. Use
+shared.services.PricingReloader to keep the snapshot fresh while running.
 """
 
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from shared.database.tables import llm_models
 
-# In-memory cache for pricing loaded from database
-_pricing_cache: dict[str, dict[str, float]] = {}
-
 # Default pricing if model not found in database (conservative estimate)
 # Used when: 1) cache not loaded, 2) model not in database
 DEFAULT_PRICING = {
@@ -19,17 +26,43 @@ DEFAULT_PRICING = {
     "completion": 3.00,  # $3.00 per 1M tokens
 }
 
+_DEFAULT_PRICING_VIEW: Mapping[str, float] = MappingProxyType(dict(DEFAULT_PRICING))
+
+
+@dataclass(frozen=True, slots=True)
+class PricingSnapshot:
+    """One immutable version of the pricing table.
+
+    Attributes:
+        version: Increases by one with every load (0 = never loaded)
+        loaded_at: time.time() of the load
+        prices: model_id -> {"prompt", "completion"} per 1M tokens
+    """
+
+    version: int = 0
+    loaded_at: float = 0.0
+    prices: Mapping[str, Mapping[str, float]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+
+# Current snapshot; replaced as a whole, never mutated
+_snapshot = PricingSnapshot()
 
-async def load_pricing_from_db(conn: AsyncConnection) -> None:
-    """Load all model pricing from database into cache.
+
+async def load_pricing_from_db(conn: AsyncConnection) -> PricingSnapshot:
+    """Load all model pricing from database and swap in a new snapshot.
 
     Prices in database are stored per token, but we convert to per 1M tokens
     for cost calculation.
 
     Args:
         conn: Database connection
+
+    Returns:
+        The snapshot now in use
     """
-    global _pricing_cache
+    global _snapshot
     query = select(
         llm_models.c.model_id,
         llm_models.c.price_prompt,
@@ -37,13 +70,30 @@ async def load_pricing_from_db(conn: AsyncConnection) -> None:
     ).where(llm_models.c.is_active == True)  # noqa: E712
 
     result = await conn.execute(query)
-    _pricing_cache = {
-        row.model_id: {
-            "prompt": float(row.price_prompt) * 1_000_000,
-            "completion": float(row.price_completion) * 1_000_000,
+    prices = MappingProxyType(
+        {
+            row.model_id: MappingProxyType(
+                {
+                    "prompt": float(row.price_prompt) * 1_000_000,
+                    "completion": float(row.price_completion) * 1_000_000,
+                }
+            )
+            for row in result.fetchall()
         }
-        for row in result.fetchall()
-    }
+    )
+    _snapshot = PricingSnapshot(
+        version=_snapshot.version + 1, loaded_at=time.time(), prices=prices
+    )
+    return _snapshot
+
+
+def get_pricing_snapshot() -> PricingSnapshot:
+    """Get the pricing snapshot currently in use.
+
+    Returns:
+        Current PricingSnapshot (version 0 if pricing was never loaded)
+    """
+    return _snapshot
 
 
 def get_pricing_cache_size() -> int:
@@ -52,26 +102,25 @@ def get_pricing_cache_size() -> int:
     Returns:
         Number of cached models
     """
-    return len(_pricing_cache)
+    return len(_snapshot.prices)
 
 
-def get_model_pricing(model: str) -> dict[str, float]:
+def get_model_pricing(model: str) -> Mapping[str, float]:
     """Get pricing information for a model.
 
     Priority:
-    1. Database cache (if loaded via load_pricing_from_db)
+    1. Database snapshot (if loaded via load_pricing_from_db)
     2. DEFAULT_PRICING (conservative fallback)
 
+    The returned mapping is read-only and shared; no copy is made.
+
     Args:
         model: Model name (e.g., "mistralai/mistral-nemo")
 
     Returns:
-        Dict with "prompt" and "completion" pricing per 1M tokens
+        Mapping with "prompt" and "completion" pricing per 1M tokens
     """
-    if model in _pricing_cache:
-        return _pricing_cache[model].copy()
-
-    return DEFAULT_PRICING.copy()
+    return _snapshot.prices.get(model, _DEFAULT_PRICING_VIEW)
 
 
 def calculate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
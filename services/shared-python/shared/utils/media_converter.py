@@ -1,6 +1,75 @@
 """Utility functions for converting media URLs to MediaObject format."""
 
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+
+class MediaKind(NamedTuple):
+    """Media classification of a URL."""
+
+    type: str  # MediaObject type: photo, video, animation or document
+    mime_type: str
+
+
+_PHOTO_JPEG = MediaKind("photo", "image/jpeg")
+_VIDEO_MP4 = MediaKind("video", "video/mp4")
+
+# File extension (lowercase, no dot) -> media kind
+_EXTENSION_KINDS: dict[str, MediaKind] = {
+    "jpg": _PHOTO_JPEG,
+    "jpeg": _PHOTO_JPEG,
+    "png": MediaKind("photo", "image/png"),
+    "webp": MediaKind("photo", "image/webp"),
+    "svg": MediaKind("photo", "image/svg+xml"),
+    "bmp": MediaKind("photo", "image/bmp"),
+    "ico": MediaKind("photo", "image/x-icon"),
+    "gif": MediaKind("animation", "image/gif"),
+    "mp4": _VIDEO_MP4,
+    "webm": MediaKind("video", "video/webm"),
+    "ogg": MediaKind("video", "video/ogg"),
+    "mov": MediaKind("video", "video/quicktime"),
+    "avi": MediaKind("video", "video/x-msvideo"),
+    "mkv": MediaKind("video", "video/x-matroska"),
+    "pdf": MediaKind("document", "application/pdf"),
+}
+
+# Video hosting sites whose page URLs are embedded as videos
+_VIDEO_HOSTS = ("youtube.com", "youtu.be", "vimeo.com", "dailymotion.com")
+
+
+@lru_cache(maxsize=4096)
+def classify_media_url(url: str) -> MediaKind:
+    """Infer media type and MIME type from a URL.
+
+    Looks at the extension of the URL path (query and fragment ignored),
+    then at the host for known video sites. URLs without a known extension
+    (e.g. /media/<id> links) are treated as JPEG photos.
+
+    Args:
+        url: Media URL
+
+    Returns:
+        MediaKind(type, mime_type)
+    """
+    # Plain partitioning instead of urlsplit: this runs for every uncached URL
+    # on a feed page, and only the host and the last path segment matter
+    address = url.partition("#")[0].partition("?")[0]
+    scheme, separator, rest = address.partition("://")
+    if separator:
+        netloc, _, path = rest.partition("/")
+    else:
+        netloc, path = "", scheme
+    _, dot, extension = path.rpartition("/")[2].rpartition(".")
+    if dot:
+        kind = _EXTENSION_KINDS.get(extension.lower())
+        if kind is not None:
+            return kind
+
+    host = netloc.rpartition("@")[2].partition(":")[0].lower()
+    if any(host == site or host.endswith("." + site) for site in _VIDEO_HOSTS):
+        return _VIDEO_MP4
+
+    return _PHOTO_JPEG
 
 
 def convert_media_urls_to_objects(media_urls: list[str] | None) -> list[dict[str, Any]]:
@@ -16,68 +85,49 @@ def convert_media_urls_to_objects(media_urls: list[str] | None) -> list[dict[str
     if not media_urls:
         return []
 
-    media_objects = []
+    media_objects: list[dict[str, Any]] = []
 
     for url in media_urls:
-        url_lower = url.lower()
-
-        video_exts = [".mp4", ".webm", ".ogg", ".mov", ".avi", ".mkv"]
-        is_video = any(url_lower.endswith(ext) for ext in video_exts)
-
-        is_embedded = any(
-            domain in url_lower
-            for domain in [
-                "youtube.com",
-                "youtu.be",
-                "vimeo.com",
-                "dailymotion.com",
-            ]
-        )
-
-        if is_video or is_embedded:
-            mime_type = "video/mp4"
-            if url_lower.endswith(".webm"):
-                mime_type = "video/webm"
-            elif url_lower.endswith(".ogg"):
-                mime_type = "video/ogg"
-            elif url_lower.endswith(".mov"):
-                mime_type = "video/quicktime"
-            elif url_lower.endswith(".avi"):
-                mime_type = "video/x-msvideo"
-            elif url_lower.endswith(".mkv"):
-                mime_type = "video/x-matroska"
+        kind = classify_media_url(url)
 
+        if kind.type == "video":
             media_objects.append(
                 {
                     "type": "video",
                     "url": url,
-                    "mime_type": mime_type,
+                    "mime_type": kind.mime_type,
                     "preview_url": url,
                     "width": None,
                     "height": None,
                     "duration": None,
                 }
             )
+        elif kind.type == "animation":
+            media_objects.append(
+                {
+                    "type": "animation",
+                    "url": url,
+                    "mime_type": kind.mime_type,
+                    "preview_url": url,
+                    "width": None,
+                    "height": None,
+                }
+            )
+        elif kind.type == "document":
+            media_objects.append(
+                {
+                    "type": "document",
+                    "url": url,
+                    "mime_type": kind.mime_type,
+                    "file_name": None,
+                }
+            )
         else:
-            mime_type = "image/jpeg"
-            if url_lower.endswith(".png"):
-                mime_type = "image/png"
-            elif url_lower.endswith(".gif"):
-                mime_type = "image/gif"
-            elif url_lower.endswith(".webp"):
-                mime_type = "image/webp"
-            elif url_lower.endswith(".svg"):
-                mime_type = "image/svg+xml"
-            elif url_lower.endswith(".bmp"):
-                mime_type = "image/bmp"
-            elif url_lower.endswith(".ico"):
-                mime_type = "image/x-icon"
-
             media_objects.append(
                 {
                     "type": "photo",
                     "url": url,
-                    "mime_type": mime_type,
+                    "mime_type": kind.mime_type,
                     "width": None,
                     "height": None,
                 }
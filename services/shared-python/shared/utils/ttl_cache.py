@@ -0,0 +1,193 @@
+"""In-process read-through TTL cache for slowly changing reference data.
+
+Tags, suggestions, prompt examples and subscription plans change about once a
+week but are read on almost every request. Caching them per process keeps
+those reads off the (small) connection pools.
+
+Caches are registered by name so they can be invalidated from anywhere, e.g.
+by the NATS ``cache.invalidate`` subscriber (see
+``shared.nats.cache_invalidation``) when an admin write happens.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from loguru import logger
+from opentelemetry import metrics
+
+T = TypeVar("T")
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_MAX_ENTRIES = 1024
+
+_caches: dict[str, "TTLCache"] = {}
+
+# Result handed to waiters when the loading caller was cancelled
+_LOAD_CANCELLED = object()
+
+
+@lru_cache(maxsize=1)
+def _requests_counter() -> metrics.Counter:
+    # Created lazily so the service's MeterProvider is installed first
+    return metrics.get_meter(__name__).create_counter(
+        name="reference_cache_requests_total",
+        description="Reference cache lookups, labeled by cache and result (hit/miss)",
+        unit="1",
+    )
+
+
+class TTLCache:
+    """Async read-through cache with per-entry TTL and stampede protection.
+
+    On a miss, the first caller runs the loader; concurrent callers for the
+    same key await that same load instead of issuing their own query. Loader
+    errors are not cached and are raised to every waiter. If the loading
+    caller is cancelled, only it sees the CancelledError: the next waiter
+    runs its own loader instead.
+
+    Cached values are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self.name = name
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache since start."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value for key, loading it on a miss.
+
+        Args:
+            key: Cache key
+            loader: Coroutine factory producing the value on a miss
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self._record(hit=True)
+            return entry[1]
+
+        self._record(hit=False)
+
+        while (inflight := self._inflight.get(key)) is not None:
+            value = await asyncio.shield(inflight)
+            if value is not _LOAD_CANCELLED:
+                return value
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            # The loader runs in this caller's task (and may use its
+            # connection), so it can't outlive it; waiters load again
+            future.set_result(_LOAD_CANCELLED)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited future does not log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            # Don't store a value loaded before an invalidation landed
+            if generation == self._generation:
+                self._store(key, value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drop one key, or every entry when key is None.
+
+        Args:
+            key: Key to drop; None clears the whole cache
+        """
+        if key is None:
+            self._entries.clear()
+            self._generation += 1
+        else:
+            self._entries.pop(key, None)
+            if key in self._inflight:
+                self._generation += 1
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        _requests_counter().add(
+            1, {"cache": self.name, "result": "hit" if hit else "miss"}
+        )
+
+
+def get_cache(
+    name: str,
+    ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+) -> TTLCache:
+    """Get the process-wide cache registered under name, creating it if needed.
+
+    Args:
+        name: Cache name (also the metrics label and invalidation target)
+        ttl_seconds: Entry TTL, used only when the cache is created
+        max_entries: LRU bound, used only when the cache is created
+
+    Returns:
+        TTLCache instance
+    """
+    cache = _caches.get(name)
+    if cache is None:
+        cache = TTLCache(name, ttl_seconds=ttl_seconds, max_entries=max_entries)
+        _caches[name] = cache
+    return cache
+
+
+def invalidate_cache(name: str | None = None, key: Hashable | None = None) -> None:
+    """Invalidate a registered cache (or all caches when name is None).
+
+    Args:
+        name: Cache name; None invalidates every registered cache
+        key: Key to drop; None clears the whole cache
+    """
+    if name is None:
+        for cache in _caches.values():
+            cache.invalidate()
+        logger.debug("Invalidated all reference caches")
+        return
+
+    cache = _caches.get(name)
+    if cache is not None:
+        cache.invalidate(key)
+        logger.debug(f"Invalidated reference cache '{name}' (key={key})")
@@ -0,0 +1,83 @@
+"""Fixtures for tests that need a real Postgres.
+
+Set TEST_DATABASE_URL to a scratch database; its public schema is dropped
+and recreated from shared.database.tables. Without it these tests skip.
+"""
+
+import os
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from shared.database.connection import create_db_engine
+from shared.database.tables import metadata
+
+
+def database_url() -> str:
+    url = os.environ.get("TEST_DATABASE_URL", "")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    return url
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def db_engine() -> AsyncIterator[AsyncEngine]:
+    """Engine on an empty schema built from shared.database.tables."""
+    engine = create_db_engine(database_url(), pool_size=1, max_overflow=0)
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP SCHEMA IF EXISTS public CASCADE"))
+        await conn.execute(text("CREATE SCHEMA public"))
+        # auth.users is owned by Supabase; only the columns we join on
+        await conn.execute(text("CREATE SCHEMA IF NOT EXISTS auth"))
+        await conn.execute(
+            text(
+                "CREATE TABLE IF NOT EXISTS auth.users "
+                "(id uuid PRIMARY KEY, email text, raw_user_meta_data jsonb)"
+            )
+        )
+        # documents needs the pgvector extension
+        tables = [t for t in metadata.sorted_tables if t.name != "documents"]
+        await conn.run_sync(lambda sync: metadata.create_all(sync, tables=tables))
+    yield engine
+    await engine.dispose()
+
+
+# Definition from migration 5e2a9c7d4b18 (metadata has no materialized views)
+_MARKETPLACE_CATALOG_DDL = (
+    """
+    CREATE MATERIALIZED VIEW marketplace_catalog AS
+    SELECT DISTINCT ON (feeds.id)
+           feeds.id AS feed_id,
+           users.id AS user_id,
+           users.raw_user_meta_data ->> 'avatar_url' AS picture,
+           users.raw_user_meta_data ->> 'full_name' AS full_name
+    FROM feeds
+             JOIN users_feeds ON feeds.id = users_feeds.feed_id
+             JOIN auth.users ON users_feeds.user_id = users.id
+    WHERE feeds.is_marketplace = true
+      AND NOT EXISTS (
+          SELECT 1
+          FROM users_feeds excluded
+          WHERE excluded.feed_id = feeds.id
+            AND excluded.user_id IN (
+                '19e01875-c620-4292-aa4b-1c7994574e6a',
+                'f2482b55-5184-4a52-89c5-a95e64e96a1d'
+            )
+      )
+    ORDER BY feeds.id, feeds.created_at DESC
+    """,
+    "CREATE UNIQUE INDEX ux_marketplace_catalog_feed_id "
+    "ON marketplace_catalog (feed_id)",
+)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def marketplace_catalog(db_engine: AsyncEngine) -> AsyncEngine:
+    """db_engine with the marketplace_catalog materialized view created."""
+    async with db_engine.begin() as conn:
+        for statement in _MARKETPLACE_CATALOG_DDL:
+            await conn.execute(text(statement))
+    return db_engine
@@ -0,0 +1,334 @@
+"""DigestScheduler publishing against a stub broker.
+
+The schedule_prompts tests also need TEST_DATABASE_URL (see conftest.py).
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, cast
+from uuid import UUID, uuid4
+
+import pytest
+from faststream.nats import NatsBroker
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from shared.database.connection import create_session_maker
+from shared.database.tables import (
+    feeds,
+    prompts,
+    subscription_plans,
+    user_subscriptions,
+    users_feeds,
+)
+from shared.faststream.digest_stream import (
+    DIGEST_EXECUTE_SUBJECT,
+    DIGEST_PENDING_SUBJECT,
+    DIGEST_STREAM_NAME,
+)
+from shared.services import digest_scheduler
+from shared.services.digest_scheduler import DigestScheduler, digest_msg_id
+from shared.services.digest_shaping import DigestScheduleShaper
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+@dataclass
+class _Ack:
+    duplicate: bool = False
+
+
+class StubBroker:
+    """Records publishes and acks them like a JetStream stream would.
+
+    A message id seen before is acked as a duplicate; the first failures
+    publishes of each message id raise.
+    """
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.calls: list[dict[str, Any]] = []
+        self._attempts: dict[str, int] = {}
+        self._stored: set[str] = set()
+
+    async def publish(self, **kwargs: Any) -> _Ack:
+        self.calls.append(kwargs)
+        msg_id = kwargs["headers"]["Nats-Msg-Id"]
+        self._attempts[msg_id] = self._attempts.get(msg_id, 0) + 1
+        if self._attempts[msg_id] <= self.failures:
+            raise ConnectionError("no responders")
+        duplicate = msg_id in self._stored
+        self._stored.add(msg_id)
+        return _Ack(duplicate=duplicate)
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(digest_scheduler, "INITIAL_RETRY_DELAY_SECONDS", 0)
+
+
+def _scheduler(broker: StubBroker) -> DigestScheduler:
+    return DigestScheduler(cast(NatsBroker, broker))
+
+
+def _msg_ids(broker: StubBroker) -> list[str]:
+    return [call["headers"]["Nats-Msg-Id"] for call in broker.calls]
+
+
+async def test_schedule_next_digest_publishes_with_msg_id() -> None:
+    broker = StubBroker()
+    prompt_id = uuid4()
+
+    await _scheduler(broker).schedule_next_digest(prompt_id, 24)
+
+    (call,) = broker.calls
+    assert call["subject"] == DIGEST_PENDING_SUBJECT
+    assert call["stream"] == DIGEST_STREAM_NAME
+    assert call["schedule"].target == DIGEST_EXECUTE_SUBJECT
+    scheduled_at = call["schedule"].time
+    assert scheduled_at.second == 0 and scheduled_at.microsecond == 0
+    assert call["headers"]["Nats-Msg-Id"] == f"digest:{prompt_id}:first"
+
+
+async def test_msg_id_is_keyed_on_the_replaced_run() -> None:
+    broker = StubBroker()
+    scheduler = _scheduler(broker)
+    prompt_id = uuid4()
+    fired = datetime(2026, 3, 1, 9, 30, tzinfo=timezone.utc)
+
+    # Same run followed up twice, with a different next run time
+    first = await scheduler.schedule_many([(prompt_id, 6)], replaces={prompt_id: fired})
+    again = await scheduler.schedule_many(
+        [(prompt_id, 12)], replaces={prompt_id: fired.astimezone(timezone.max)}
+    )
+    following = await scheduler.schedule_many(
+        [(prompt_id, 6)], replaces={prompt_id: fired + timedelta(hours=6)}
+    )
+
+    assert not first[0].duplicate
+    assert again[0].duplicate
+    assert not following[0].duplicate
+    assert _msg_ids(broker) == [
+        f"digest:{prompt_id}:20260301T093000",
+        f"digest:{prompt_id}:20260301T093000",
+        digest_msg_id(prompt_id, fired + timedelta(hours=6)),
+    ]
+
+
+async def test_schedule_many_reports_duplicates_in_input_order() -> None:
+    broker = StubBroker()
+    scheduler = _scheduler(broker)
+    items = [(uuid4(), 24) for _ in range(5)]
+
+    first = await scheduler.schedule_many(items, max_in_flight=2)
+    second = await scheduler.schedule_many(items, max_in_flight=2)
+
+    assert [r.prompt_id for r in first] == [prompt_id for prompt_id, _ in items]
+    assert all(r.ok and not r.duplicate for r in first)
+    assert [r.prompt_id for r in second] == [prompt_id for prompt_id, _ in items]
+    assert all(r.ok and r.duplicate for r in second)
+    assert len(set(_msg_ids(broker))) == len(items)
+
+
+async def test_schedule_many_retries_with_the_same_msg_id() -> None:
+    broker = StubBroker(failures=digest_scheduler.MAX_RETRY_ATTEMPTS - 1)
+    prompt_id = uuid4()
+
+    (result,) = await _scheduler(broker).schedule_many([(prompt_id, 6)])
+
+    assert result.ok and not result.duplicate
+    ids = _msg_ids(broker)
+    assert len(ids) == digest_scheduler.MAX_RETRY_ATTEMPTS
+    assert len(set(ids)) == 1
+
+
+async def test_schedule_many_reports_failures_without_raising() -> None:
+    broker = StubBroker(failures=digest_scheduler.MAX_RETRY_ATTEMPTS)
+    failing = uuid4()
+
+    (result,) = await _scheduler(broker).schedule_many([(failing, 6)])
+
+    assert not result.ok
+    assert isinstance(result.error, ConnectionError)
+    assert len(broker.calls) == digest_scheduler.MAX_RETRY_ATTEMPTS
+
+
+async def test_schedule_next_digest_raises_after_last_attempt() -> None:
+    broker = StubBroker(failures=digest_scheduler.MAX_RETRY_ATTEMPTS)
+
+    with pytest.raises(ConnectionError):
+        await _scheduler(broker).schedule_next_digest(uuid4(), 6)
+
+
+async def test_failed_and_duplicate_publishes_release_their_booking() -> None:
+    shaper = DigestScheduleShaper(slot_minutes=15)
+    prompt_id = uuid4()
+    fired = datetime.now(timezone.utc)
+
+    failing = DigestScheduler(
+        cast(NatsBroker, StubBroker(failures=digest_scheduler.MAX_RETRY_ATTEMPTS)),
+        shaper=shaper,
+    )
+    (failed,) = await failing.schedule_many(
+        [(prompt_id, 6)], plan_types={prompt_id: "PRO"}
+    )
+    assert not failed.ok
+    assert shaper._histogram == {}
+
+    scheduler = DigestScheduler(cast(NatsBroker, StubBroker()), shaper=shaper)
+    for _ in range(3):
+        await scheduler.schedule_many(
+            [(prompt_id, 6)],
+            plan_types={prompt_id: "PRO"},
+            replaces={prompt_id: fired},
+        )
+    # One message in the stream, one booking
+    assert sum(shaper._histogram.values()) == 1
+
+
+async def _digest_prompts(
+    db_engine: AsyncEngine, count: int, interval_hours: int, pro: bool = False
+) -> list[UUID]:
+    """DIGEST prompts, each on its own feed owned by a FREE or PRO user."""
+    async with db_engine.begin() as conn:
+        plan_id = None
+        if pro:
+            plan_id = (
+                await conn.execute(
+                    insert(subscription_plans)
+                    .values(plan_type="PRO", feeds_limit=10, sources_per_feed_limit=10)
+                    .returning(subscription_plans.c.id)
+                )
+            ).scalar_one()
+        prompt_ids = []
+        for i in range(count):
+            user_id = uuid4()
+            feed_id = (
+                await conn.execute(
+                    insert(feeds).values(name=f"digest {i}").returning(feeds.c.id)
+                )
+            ).scalar_one()
+            await conn.execute(
+                insert(users_feeds).values(user_id=user_id, feed_id=feed_id)
+            )
+            if plan_id is not None:
+                await conn.execute(
+                    insert(user_subscriptions).values(
+                        user_id=user_id,
+                        subscription_plan_id=plan_id,
+                        platform="APPLE",
+                        start_date=datetime.now(timezone.utc),
+                        expiry_date=datetime.now(timezone.utc) + timedelta(days=30),
+                        status="ACTIVE",
+                    )
+                )
+            prompt_ids.append(
+                (
+                    await conn.execute(
+                        insert(prompts)
+                        .values(
+                            prompt={},
+                            feed_id=feed_id,
+                            feed_type="DIGEST",
+                            digest_interval_hours=interval_hours,
+                        )
+                        .returning(prompts.c.id)
+                    )
+                ).scalar_one()
+            )
+    return prompt_ids
+
+
+async def _scheduled_at(
+    db_engine: AsyncEngine, prompt_ids: list[UUID]
+) -> list[datetime | None]:
+    async with db_engine.connect() as conn:
+        result = await conn.execute(
+            select(prompts.c.id, prompts.c.digest_scheduled_at).where(
+                prompts.c.id.in_(prompt_ids)
+            )
+        )
+        by_id = dict(result.fetchall())
+    return [by_id[prompt_id] for prompt_id in prompt_ids]
+
+
+async def test_schedule_prompts_records_shaped_times(db_engine: AsyncEngine) -> None:
+    prompt_ids = await _digest_prompts(db_engine, 3, interval_hours=6, pro=True)
+    broker = StubBroker()
+    scheduler = DigestScheduler(
+        cast(NatsBroker, broker), shaper=DigestScheduleShaper(slot_minutes=15)
+    )
+
+    results = await scheduler.schedule_prompts(
+        create_session_maker(db_engine), prompt_ids
+    )
+
+    # Settings come back in no particular order
+    scheduled = {r.prompt_id: r.scheduled_at for r in results}
+    assert sorted(scheduled) == sorted(prompt_ids)
+    assert await _scheduled_at(db_engine, prompt_ids) == [
+        scheduled[prompt_id] for prompt_id in prompt_ids
+    ]
+    base = datetime.now(timezone.utc) + timedelta(hours=6)
+    for call in broker.calls:
+        # PRO tolerance is 20 minutes
+        assert abs(call["schedule"].time - base) <= timedelta(minutes=21)
+
+
+async def test_schedule_prompts_shapes_against_recorded_runs(
+    db_engine: AsyncEngine,
+) -> None:
+    session_maker = create_session_maker(db_engine)
+    # Unshaped runs, all in the same slot
+    crowded = await _digest_prompts(db_engine, 20, interval_hours=12)
+    await _scheduler(StubBroker()).schedule_prompts(session_maker, crowded)
+
+    # A fresh process only knows those runs from digest_scheduled_at
+    shaper = DigestScheduleShaper(slot_minutes=15)
+    later = await _digest_prompts(db_engine, 40, interval_hours=12)
+    results = await DigestScheduler(
+        cast(NatsBroker, StubBroker()), shaper=shaper
+    ).schedule_prompts(session_maker, later)
+
+    (crowded_slot,) = {
+        shaper.slot_start(run_at) for run_at in await _scheduled_at(db_engine, crowded)
+    }
+    assert all(shaper.slot_start(r.scheduled_at) != crowded_slot for r in results)
+
+
+async def test_schedule_prompts_follows_up_the_stored_or_fired_run(
+    db_engine: AsyncEngine,
+) -> None:
+    session_maker = create_session_maker(db_engine)
+    (prompt_id,) = await _digest_prompts(db_engine, 1, interval_hours=6)
+    broker = StubBroker()
+    scheduler = _scheduler(broker)
+
+    (first,) = await scheduler.schedule_prompts(session_maker, [prompt_id])
+    # The run scheduled above fires; its digest.execute is delivered twice
+    for _ in range(2):
+        await scheduler.schedule_prompts(
+            session_maker, [prompt_id], replaces={prompt_id: first.scheduled_at}
+        )
+    # Without an explicit run, the stored digest_scheduled_at is followed up
+    (stored,) = await _scheduled_at(db_engine, [prompt_id])
+    await scheduler.schedule_prompts(session_maker, [prompt_id])
+
+    ids = _msg_ids(broker)
+    assert len(ids) == 4
+    assert ids[0] == f"digest:{prompt_id}:first"
+    assert ids[1] == ids[2] == digest_msg_id(prompt_id, first.scheduled_at)
+    assert ids[3] == digest_msg_id(prompt_id, stored)
+
+
+async def test_schedule_prompts_skips_prompts_that_are_not_digests(
+    db_engine: AsyncEngine,
+) -> None:
+    broker = StubBroker()
+
+    results = await _scheduler(broker).schedule_prompts(
+        create_session_maker(db_engine), [uuid4()]
+    )
+
+    assert results == []
+    assert broker.calls == []
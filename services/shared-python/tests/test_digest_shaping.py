@@ -0,0 +1,109 @@
+"""DigestScheduleShaper run placement (no database)."""
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+
+from shared.services.digest_shaping import DigestScheduleShaper
+
+
+@pytest.fixture
+def base() -> datetime:
+    """A slot-aligned unshaped run time, far enough ahead not to be pruned."""
+    shaper = DigestScheduleShaper(slot_minutes=15)
+    return shaper.slot_start(datetime.now(timezone.utc) + timedelta(hours=12))
+
+
+def test_jitter_is_deterministic_per_prompt(base: datetime) -> None:
+    prompt_id = UUID("0b7c2f4e-9a51-4d8e-8f0a-3c6d1e2b4a59")
+
+    first = DigestScheduleShaper().next_run_at(prompt_id, base, 12, "PRO")
+    again = DigestScheduleShaper().next_run_at(prompt_id, base, 12, "PRO")
+    next_day = DigestScheduleShaper().next_run_at(
+        prompt_id, base + timedelta(days=1), 12, "PRO"
+    )
+
+    assert first == again
+    # Same phase relative to the unshaped time
+    assert next_day - first == timedelta(days=1)
+
+
+def test_jitter_spreads_prompts_over_the_window(base: datetime) -> None:
+    offsets = {
+        DigestScheduleShaper().next_run_at(uuid4(), base, 12, "FREE") - base
+        for _ in range(50)
+    }
+
+    assert len(offsets) > 40
+    assert min(offsets) < timedelta(0) < max(offsets)
+
+
+@pytest.mark.parametrize(
+    ("interval_hours", "plan_type", "expected"),
+    [
+        (12, "FREE", timedelta(minutes=90)),
+        (12, "PRO", timedelta(minutes=20)),
+        (12, None, timedelta(minutes=30)),
+        (12, "ENTERPRISE", timedelta(minutes=30)),
+        # Capped at half the interval
+        (2, "FREE", timedelta(hours=1)),
+        (1, "FREE", timedelta(minutes=30)),
+    ],
+)
+def test_tolerance_per_plan_and_cap(
+    interval_hours: int, plan_type: str | None, expected: timedelta
+) -> None:
+    assert DigestScheduleShaper().tolerance(interval_hours, plan_type) == expected
+
+
+def test_runs_stay_within_the_capped_tolerance(base: datetime) -> None:
+    shaper = DigestScheduleShaper(slot_minutes=15)
+
+    for _ in range(200):
+        run_at = shaper.next_run_at(uuid4(), base, 1, "FREE")
+        assert abs(run_at - base) <= timedelta(minutes=30)
+
+
+def test_zero_tolerance_keeps_the_unshaped_time(base: datetime) -> None:
+    shaper = DigestScheduleShaper(plan_tolerance_minutes={"PRO": 0})
+
+    assert shaper.next_run_at(uuid4(), base, 12, "PRO") == base
+    assert shaper._histogram == {}
+
+
+def test_least_booked_slot_wins(base: datetime) -> None:
+    shaper = DigestScheduleShaper(slot_minutes=15, default_tolerance_minutes=30)
+    free_slot = base + timedelta(minutes=15)
+    shaper.load_histogram(
+        {base + timedelta(minutes=m): 5 for m in range(-30, 31, 15) if m != 15}
+    )
+
+    for _ in range(5):
+        run_at = shaper.next_run_at(uuid4(), base, 12)
+        assert shaper.slot_start(run_at) == free_slot
+
+
+def test_bookings_fill_slots_evenly(base: datetime) -> None:
+    shaper = DigestScheduleShaper(slot_minutes=15, default_tolerance_minutes=30)
+    prompt_id = uuid4()
+
+    runs = Counter(
+        shaper.slot_start(shaper.next_run_at(prompt_id, base, 12)) for _ in range(25)
+    )
+
+    # base +/- 30 minutes spans five 15-minute slots
+    assert len(runs) == 5
+    assert set(runs.values()) == {5}
+
+
+def test_release_returns_the_slot(base: datetime) -> None:
+    shaper = DigestScheduleShaper(slot_minutes=15)
+    prompt_id = uuid4()
+
+    run_at = shaper.next_run_at(prompt_id, base, 12, "PRO")
+    shaper.release(run_at)
+
+    assert shaper._histogram == {}
+    assert shaper.next_run_at(prompt_id, base, 12, "PRO") == run_at
@@ -0,0 +1,146 @@
+"""classify_media_url and the helpers built on it."""
+
+import pytest
+
+from shared.repositories.post import adapt_post_to_v1
+from shared.utils.media_converter import (
+    MediaKind,
+    classify_media_url,
+    convert_media_urls_to_objects,
+)
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://cdn.example.com/a/loop.gif", MediaKind("animation", "image/gif")),
+        ("https://cdn.example.com/a/LOOP.GIF", MediaKind("animation", "image/gif")),
+        (
+            "https://files.example.com/report.pdf",
+            MediaKind("document", "application/pdf"),
+        ),
+        ("https://cdn.example.com/a/photo.png", MediaKind("photo", "image/png")),
+        ("https://cdn.example.com/a/clip.mov", MediaKind("video", "video/quicktime")),
+        # No known extension
+        ("https://t.me/channel/123", MediaKind("photo", "image/jpeg")),
+        ("https://img.example.com/media/abc", MediaKind("photo", "image/jpeg")),
+        ("https://example.com/v1.2/media", MediaKind("photo", "image/jpeg")),
+        ("/relative/clip.webm", MediaKind("video", "video/webm")),
+    ],
+)
+def test_classify_by_extension(url: str, expected: MediaKind) -> None:
+    assert classify_media_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://cdn.example.com/clip.mp4?v=1", MediaKind("video", "video/mp4")),
+        ("https://cdn.example.com/a.jpg?format=png", MediaKind("photo", "image/jpeg")),
+        ("https://cdn.example.com/a.gif#t=10", MediaKind("animation", "image/gif")),
+        ("https://cdn.example.com/media?file=a.pdf", MediaKind("photo", "image/jpeg")),
+        ("https://cdn.example.com/a.png?x=1#y.mp4", MediaKind("photo", "image/png")),
+    ],
+)
+def test_query_string_and_fragment_are_ignored(url: str, expected: MediaKind) -> None:
+    assert classify_media_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.youtube.com/watch?v=abc",
+        "https://youtube.com/shorts/abc",
+        "https://youtu.be/abc",
+        "https://m.YouTube.com/watch?v=abc",
+        "https://vimeo.com:443/12345",
+        "https://user@player.vimeo.com/video/12345",
+        "https://www.dailymotion.com/video/x8abc",
+    ],
+)
+def test_video_hosts_are_matched_by_hostname(url: str) -> None:
+    assert classify_media_url(url) == MediaKind("video", "video/mp4")
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://notyoutube.com/watch",
+        "https://youtube.com.example.org/a",
+        "https://example.com/youtube.com/a",
+        "https://example.com/redirect?to=https://youtu.be/abc",
+    ],
+)
+def test_video_host_names_elsewhere_in_the_url_do_not_match(url: str) -> None:
+    assert classify_media_url(url) == MediaKind("photo", "image/jpeg")
+
+
+def test_an_extension_wins_over_a_video_host() -> None:
+    url = "https://i.ytimg.youtube.com/vi/abc/thumb.webp"
+    assert classify_media_url(url) == MediaKind("photo", "image/webp")
+
+
+def test_convert_media_urls_to_objects_shapes() -> None:
+    urls = [
+        "https://www.youtube.com/watch?v=abc",
+        "https://cdn.example.com/loop.gif",
+        "https://cdn.example.com/report.pdf",
+        "https://cdn.example.com/photo.jpg",
+    ]
+
+    assert convert_media_urls_to_objects(urls) == [
+        {
+            "type": "video",
+            "url": urls[0],
+            "mime_type": "video/mp4",
+            "preview_url": urls[0],
+            "width": None,
+            "height": None,
+            "duration": None,
+        },
+        {
+            "type": "animation",
+            "url": urls[1],
+            "mime_type": "image/gif",
+            "preview_url": urls[1],
+            "width": None,
+            "height": None,
+        },
+        {
+            "type": "document",
+            "url": urls[2],
+            "mime_type": "application/pdf",
+            "file_name": None,
+        },
+        {
+            "type": "photo",
+            "url": urls[3],
+            "mime_type": "image/jpeg",
+            "width": None,
+            "height": None,
+        },
+    ]
+    assert convert_media_urls_to_objects(None) == []
+
+
+def test_adapt_post_to_v1_normalizes_string_media() -> None:
+    stored = {"type": "photo", "url": "https://cdn.example.com/a.png"}
+    post = {
+        "views": {"full_text": "text", "summary": "short"},
+        "media_objects": [stored, "https://cdn.example.com/clip.mp4?v=2"],
+    }
+
+    adapted = adapt_post_to_v1(post)
+
+    assert adapted["media_objects"] == [
+        stored,
+        {
+            "type": "video",
+            "url": "https://cdn.example.com/clip.mp4?v=2",
+            "mime_type": "video/mp4",
+            "preview_url": "https://cdn.example.com/clip.mp4?v=2",
+        },
+    ]
+    assert adapt_post_to_v1({**post, "media_objects": [stored]})["media_objects"] == [
+        stored
+    ]
@@ -0,0 +1,102 @@
+"""Deferred feed purge: delete_user(defer_feed_purge=True), then RetentionJob.
+
+Needs TEST_DATABASE_URL (see conftest.py).
+"""
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from shared.database.connection import create_session_maker
+from shared.database.tables import feeds, posts, users_feeds
+from shared.repositories.user import ORPHANED_FEED_MIN_AGE, UserRepository
+from shared.services.retention_job import RetentionJob
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+async def _feed(
+    db_engine: AsyncEngine,
+    subscribers: list[UUID],
+    is_marketplace: bool = False,
+    age: timedelta = 2 * ORPHANED_FEED_MIN_AGE,
+    post_count: int = 3,
+) -> UUID:
+    async with db_engine.begin() as conn:
+        feed_id = (
+            await conn.execute(
+                insert(feeds)
+                .values(
+                    name="feed",
+                    is_marketplace=is_marketplace,
+                    created_at=datetime.now(timezone.utc) - age,
+                )
+                .returning(feeds.c.id)
+            )
+        ).scalar_one()
+        for user_id in subscribers:
+            await conn.execute(
+                insert(users_feeds).values(user_id=user_id, feed_id=feed_id)
+            )
+        await conn.execute(
+            insert(posts), [{"feed_id": feed_id} for _ in range(post_count)]
+        )
+    return feed_id
+
+
+async def _existing_feeds(db_engine: AsyncEngine, feed_ids: list[UUID]) -> set[UUID]:
+    async with db_engine.connect() as conn:
+        result = await conn.execute(select(feeds.c.id).where(feeds.c.id.in_(feed_ids)))
+        return set(result.scalars())
+
+
+async def _post_count(db_engine: AsyncEngine, feed_id: UUID) -> int:
+    async with db_engine.connect() as conn:
+        return (
+            await conn.execute(
+                select(func.count())
+                .select_from(posts)
+                .where(posts.c.feed_id == feed_id)
+            )
+        ).scalar_one()
+
+
+async def test_deferred_feed_purge_removes_only_reported_feeds(
+    db_engine: AsyncEngine,
+) -> None:
+    user_id, other_user_id = uuid4(), uuid4()
+    private = await _feed(db_engine, [user_id])
+    young = await _feed(db_engine, [user_id], age=timedelta(0))
+    marketplace = await _feed(db_engine, [user_id], is_marketplace=True)
+    shared = await _feed(db_engine, [user_id, other_user_id])
+    all_feeds = [private, young, marketplace, shared]
+
+    async with db_engine.begin() as conn:
+        stats = await UserRepository().delete_user(conn, user_id, defer_feed_purge=True)
+
+    assert set(stats["orphaned_feed_ids"]) == {private, young}
+    assert await _existing_feeds(db_engine, all_feeds) == set(all_feeds)
+
+    # Small batches: posts and feeds are deleted over several transactions
+    job = RetentionJob(
+        create_session_maker(db_engine), batch_size=2, purge_orphaned_feeds=True
+    )
+    result = await job.run_once()
+
+    # 3 posts and the feed row of the private feed
+    assert result["orphaned_feeds"] == 4
+    assert await _existing_feeds(db_engine, all_feeds) == {young, marketplace, shared}
+    assert await _post_count(db_engine, private) == 0
+    assert await _post_count(db_engine, marketplace) == 3
+    # The young feed goes once it is older than ORPHANED_FEED_MIN_AGE
+    async with db_engine.begin() as conn:
+        await conn.execute(
+            feeds.update()
+            .where(feeds.c.id == young)
+            .values(created_at=datetime.now(timezone.utc) - 2 * ORPHANED_FEED_MIN_AGE)
+        )
+    await job.run_once()
+    assert await _existing_feeds(db_engine, all_feeds) == {marketplace, shared}
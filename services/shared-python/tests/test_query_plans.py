@@ -0,0 +1,589 @@
+"""Plan regression checks for the hot repository reads.
+
+Each test runs a repository call, captures the SQL it sends and runs it
+again under EXPLAIN (ANALYZE, BUFFERS) as a generic plan (what a reused
+prepared statement gets). A test fails when the plan:
+- has a Seq Scan on one of TABLES_WITHOUT_SEQ_SCAN,
+- does not read through the index built for that query (where there is one),
+- or goes over the query's cost or shared-buffer budget.
+A dropped index, or a query change the index no longer matches, fails here
+instead of in production.
+
+    TEST_DATABASE_URL=... pytest tests/test_query_plans.py
+"""
+
+import re
+import uuid
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from shared.database.tables import (
+    chats,
+    chats_messages,
+    feeds,
+    posts,
+    pre_prompts,
+    prompts,
+    prompts_raw_feeds,
+    raw_feeds,
+    raw_posts,
+    tags,
+    users_feeds,
+    users_tags,
+)
+from shared.enums import PollingTier, PrePromptType, RawType
+from shared.repositories.chat import ChatRepository
+from shared.repositories.marketplace import (
+    MARKETPLACE_CATALOG_CACHE,
+    MarketplaceRepository,
+)
+from shared.repositories.post import PostRepository, encode_cursor
+from shared.repositories.prompt import PromptRepository
+from shared.repositories.raw_feed import RawFeedRepository
+from shared.repositories.raw_post import RawPostRepository
+from shared.utils.ttl_cache import invalidate_cache
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+RAW_FEEDS = 50
+RAW_POSTS_PER_FEED = 400
+POSTS = 5_000
+FEEDS = 2_000
+MARKETPLACE_FEEDS = 100
+TAGS = 50
+DUE_PROMPTS = 20
+CHATS = 2_000
+MESSAGES_PER_CHAT = 20
+
+# Tables that grow with users or content. Not included: raw_feeds, as
+# get_*_due_for_poll computes every feed's due time to order by it, and
+# marketplace_catalog, which only holds the curated marketplace feeds
+TABLES_WITHOUT_SEQ_SCAN = frozenset(
+    {
+        "raw_posts",
+        "posts",
+        "feeds",
+        "users_feeds",
+        "prompts",
+        "pre_prompts",
+        "chats",
+        "chats_messages",
+    }
+)
+
+RAW_POSTS_VISIBLE_INDEX = "ix_raw_posts_raw_feed_id_created_at_visible"
+POSTS_FEED_INDEX = "ix_posts_feed_id_created_at_id"
+PROMPTS_SINGLE_POST_INDEX = "ix_prompts_next_run_at_single_post"
+PROMPTS_DIGEST_INDEX = "ix_prompts_next_run_at_digest"
+FEEDS_MARKETPLACE_TAGS_INDEX = "ix_feeds_tags_marketplace"
+CHATS_MESSAGES_INDEX = "ix_chats_messages_sequence"
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Upper bounds for one query on the seeded data.
+
+    cost is the planner's total cost estimate; buffers counts shared
+    buffers hit or read while executing it. Each is set at two to three
+    times what the query needs here.
+    """
+
+    cost: float
+    buffers: int
+
+
+TIER_INTERVALS = {
+    PollingTier.HOT: 30,
+    PollingTier.WARM: 120,
+    PollingTier.COLD: 600,
+    PollingTier.QUARANTINE: 3600,
+}
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def seeded(marketplace_catalog: AsyncEngine) -> dict[str, Any]:
+    """Rows enough that a sequential scan is not the cheap plan."""
+    db_engine = marketplace_catalog
+    now = datetime.now(timezone.utc)
+    async with db_engine.begin() as conn:
+        raw_feed_ids = (
+            (
+                await conn.execute(
+                    insert(raw_feeds).returning(raw_feeds.c.id),
+                    [
+                        {
+                            "name": f"feed {i}",
+                            "raw_type": RawType.RSS if i % 2 else RawType.WEBSITE,
+                            "last_polled_at": now - timedelta(seconds=10 * i),
+                        }
+                        for i in range(RAW_FEEDS)
+                    ],
+                )
+            )
+            .scalars()
+            .all()
+        )
+        await conn.execute(
+            insert(raw_posts),
+            [
+                {
+                    "raw_feed_id": raw_feed_id,
+                    "content": "Lorem ipsum dolor sit amet. " * 5,
+                    "rp_unique_code": f"{raw_feed_id}:{i}",
+                    "created_at": now - timedelta(minutes=i),
+                    "moderation_action": "block" if i % 10 == 0 else None,
+                }
+                for raw_feed_id in raw_feed_ids
+                for i in range(RAW_POSTS_PER_FEED)
+            ],
+        )
+
+        feed_id = (
+            await conn.execute(insert(feeds).values(name="plans").returning(feeds.c.id))
+        ).scalar_one()
+        prompt_id = (
+            await conn.execute(
+                insert(prompts)
+                .values(prompt={}, feed_id=feed_id)
+                .returning(prompts.c.id)
+            )
+        ).scalar_one()
+        await conn.execute(
+            insert(prompts_raw_feeds),
+            [
+                {"prompt_id": prompt_id, "raw_feed_id": raw_feed_id}
+                for raw_feed_id in raw_feed_ids[:3]
+            ],
+        )
+        await conn.execute(
+            insert(posts),
+            [
+                {
+                    "feed_id": feed_id,
+                    "title": f"Post {i}",
+                    "created_at": now - timedelta(minutes=i),
+                }
+                for i in range(POSTS)
+            ],
+        )
+        # Posts of other feeds, so feed_id alone is selective
+        other_feed_ids = (
+            (
+                await conn.execute(
+                    insert(feeds).returning(feeds.c.id),
+                    [{"name": f"other {i}"} for i in range(20)],
+                )
+            )
+            .scalars()
+            .all()
+        )
+        await conn.execute(
+            insert(posts),
+            [
+                {
+                    "feed_id": other_feed_id,
+                    "title": f"Post {i}",
+                    "created_at": now - timedelta(minutes=i),
+                }
+                for other_feed_id in other_feed_ids
+                for i in range(POSTS // 10)
+            ],
+        )
+
+        await _seed_feeds_and_prompts(conn, now)
+        reader_id = await _seed_marketplace_reader(conn)
+        chat_id = await _seed_chats(conn, now)
+        await conn.execute(text("REFRESH MATERIALIZED VIEW marketplace_catalog"))
+        await conn.execute(text("ANALYZE"))
+
+    return {
+        "raw_feed_id": raw_feed_ids[0],
+        "prompt_id": prompt_id,
+        "feed_id": feed_id,
+        "since": now - timedelta(days=1),
+        "cursor": encode_cursor(now - timedelta(minutes=100), uuid.uuid4()),
+        "reader_id": reader_id,
+        "chat_id": chat_id,
+    }
+
+
+async def _seed_feeds_and_prompts(conn: AsyncConnection, now: datetime) -> None:
+    """FEEDS feeds, each with a prompt; a few marketplace feeds and due prompts.
+
+    Every feed is tagged, so only the marketplace ones are in the partial
+    tags index. Most prompts are scheduled in the future.
+    """
+    owner_ids = [uuid.uuid4() for _ in range(MARKETPLACE_FEEDS)]
+    await conn.execute(
+        text("INSERT INTO auth.users (id, raw_user_meta_data) VALUES (:id, '{}')"),
+        [{"id": owner_id} for owner_id in owner_ids],
+    )
+    feed_ids = (
+        (
+            await conn.execute(
+                insert(feeds).returning(feeds.c.id),
+                [
+                    {
+                        "name": f"feed {i}",
+                        "tags": [f"tag{i % TAGS}", f"tag{(i * 7) % TAGS}"],
+                        "is_marketplace": i < MARKETPLACE_FEEDS,
+                    }
+                    for i in range(FEEDS)
+                ],
+            )
+        )
+        .scalars()
+        .all()
+    )
+    await conn.execute(
+        insert(users_feeds),
+        [
+            {
+                "user_id": owner_ids[i] if i < MARKETPLACE_FEEDS else uuid.uuid4(),
+                "feed_id": feed_id,
+            }
+            for i, feed_id in enumerate(feed_ids)
+        ],
+    )
+
+    prompt_types = [
+        PrePromptType.DIGEST if i % 5 == 0 else PrePromptType.SINGLE_POST
+        for i in range(FEEDS)
+    ]
+    pre_prompt_ids = (
+        (
+            await conn.execute(
+                insert(pre_prompts).returning(pre_prompts.c.id),
+                [{"type": prompt_type} for prompt_type in prompt_types],
+            )
+        )
+        .scalars()
+        .all()
+    )
+    await conn.execute(
+        insert(prompts),
+        [
+            {
+                "prompt": {},
+                "feed_id": feed_id,
+                "pre_prompt_id": pre_prompt_id,
+                "feed_type": prompt_type,
+                "next_run_at": (
+                    now - timedelta(minutes=i)
+                    if i < DUE_PROMPTS
+                    else now + timedelta(minutes=i)
+                ),
+            }
+            for i, (feed_id, pre_prompt_id, prompt_type) in enumerate(
+                zip(feed_ids, pre_prompt_ids, prompt_types, strict=True)
+            )
+        ],
+    )
+
+
+async def _seed_marketplace_reader(conn: AsyncConnection) -> uuid.UUID:
+    """A user following two tags."""
+    reader_id = uuid.uuid4()
+    tag_ids = (
+        (
+            await conn.execute(
+                insert(tags).returning(tags.c.id),
+                [{"name": "tag3"}, {"name": "tag11"}],
+            )
+        )
+        .scalars()
+        .all()
+    )
+    await conn.execute(
+        insert(users_tags),
+        [{"user_id": reader_id, "tag_id": tag_id} for tag_id in tag_ids],
+    )
+    return reader_id
+
+
+async def _seed_chats(conn: AsyncConnection, now: datetime) -> uuid.UUID:
+    """CHATS chats with MESSAGES_PER_CHAT messages each; returns one chat id."""
+    pre_prompt_ids = (
+        (
+            await conn.execute(
+                insert(pre_prompts).returning(pre_prompts.c.id),
+                [{} for _ in range(CHATS)],
+            )
+        )
+        .scalars()
+        .all()
+    )
+    chat_ids = (
+        (
+            await conn.execute(
+                insert(chats).returning(chats.c.id),
+                [
+                    {"pre_prompt_id": pre_prompt_id, "user_id": uuid.uuid4()}
+                    for pre_prompt_id in pre_prompt_ids
+                ],
+            )
+        )
+        .scalars()
+        .all()
+    )
+    await conn.execute(
+        insert(chats_messages),
+        [
+            {
+                "chat_id": chat_id,
+                "message": f"message {sequence}",
+                "type": "HUMAN" if sequence % 2 else "AI",
+                "sequence": sequence,
+                "created_at": now - timedelta(minutes=MESSAGES_PER_CHAT - sequence),
+            }
+            for chat_id in chat_ids
+            for sequence in range(1, MESSAGES_PER_CHAT + 1)
+        ],
+    )
+    return chat_ids[0]
+
+
+def _literal(value: Any) -> str:
+    """Render a bound value as an untyped SQL literal for EXECUTE."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, (list, tuple)):
+        value = "{" + ",".join(f'"{item}"' for item in value) + "}"
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+async def _captured_statements(
+    conn: AsyncConnection, call: Callable[[], Awaitable[Any]]
+) -> list[tuple[str, tuple[Any, ...]]]:
+    """Run call and return the (statement, parameters) pairs it executed."""
+    statements: list[tuple[str, tuple[Any, ...]]] = []
+
+    def capture(_conn, _cursor, statement, parameters, _context, _executemany):
+        statements.append((statement, tuple(parameters or ())))
+
+    sync_conn = conn.sync_connection
+    assert sync_conn is not None
+    event.listen(sync_conn, "before_cursor_execute", capture)
+    try:
+        await call()
+    finally:
+        event.remove(sync_conn, "before_cursor_execute", capture)
+    return statements
+
+
+async def _analyzed_generic_plan(
+    conn: AsyncConnection, statement: str, parameters: tuple[Any, ...]
+) -> dict[str, Any]:
+    """EXPLAIN ANALYZE statement the way a cached prepared statement runs it."""
+    await conn.exec_driver_sql("SET plan_cache_mode = force_generic_plan")
+    await conn.exec_driver_sql(f"PREPARE plan_check AS {statement}")
+    try:
+        args = ", ".join(_literal(p) for p in parameters)
+        execute = f"EXECUTE plan_check({args})" if parameters else "EXECUTE plan_check"
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {execute}"
+        )
+        return result.scalar_one()[0]["Plan"]
+    finally:
+        await conn.exec_driver_sql("DEALLOCATE plan_check")
+        await conn.exec_driver_sql("RESET plan_cache_mode")
+
+
+def _nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _nodes(child)
+
+
+def _index_scans(plan: dict[str, Any]) -> set[str]:
+    """Indexes plan reads through.
+
+    Bitmap Index Scan counts too: with few rows per outer row (the prompt
+    join) the planner may bitmap-scan the same index instead of walking it.
+    """
+    return {
+        node["Index Name"]
+        for node in _nodes(plan)
+        if node["Node Type"] in ("Index Scan", "Index Only Scan", "Bitmap Index Scan")
+    }
+
+
+def _seq_scanned_tables(plan: dict[str, Any]) -> set[str]:
+    """Tables from TABLES_WITHOUT_SEQ_SCAN that plan reads sequentially."""
+    return {
+        node["Relation Name"]
+        for node in _nodes(plan)
+        if node["Node Type"] == "Seq Scan"
+        and node["Relation Name"] in TABLES_WITHOUT_SEQ_SCAN
+    }
+
+
+def _shared_buffers(plan: dict[str, Any]) -> int:
+    """Shared buffers the whole plan hit or read (the root counts its children)."""
+    return plan["Shared Hit Blocks"] + plan["Shared Read Blocks"]
+
+
+async def _check_plan(
+    db_engine: AsyncEngine,
+    call: Callable[[AsyncConnection], Awaitable[Any]],
+    table: str,
+    budget: Budget,
+    index: str | None = None,
+) -> None:
+    """Check the plan of the one statement call sends that reads table.
+
+    Runs in a transaction that is rolled back, since claiming queries lock
+    (and ANALYZE executes) what they select.
+    """
+    async with db_engine.connect() as conn:
+        statements = await _captured_statements(conn, lambda: call(conn))
+        matching = [
+            (statement, parameters)
+            for statement, parameters in statements
+            if re.search(rf"\b(FROM|JOIN) {table}\b", statement)
+            and "count(" not in statement.lower()
+        ]
+        assert len(matching) == 1, statements
+        plan = await _analyzed_generic_plan(conn, *matching[0])
+
+    assert not _seq_scanned_tables(plan), plan
+    if index is not None:
+        assert index in _index_scans(plan), plan
+    assert plan["Total Cost"] <= budget.cost, plan
+    assert _shared_buffers(plan) <= budget.buffers, plan
+
+
+async def test_get_by_raw_feed(db_engine: AsyncEngine, seeded: dict[str, Any]) -> None:
+    await _check_plan(
+        db_engine,
+        lambda conn: RawPostRepository().get_by_raw_feed(
+            conn, seeded["raw_feed_id"], limit=50
+        ),
+        "raw_posts",
+        Budget(cost=250, buffers=20),
+        index=RAW_POSTS_VISIBLE_INDEX,
+    )
+
+
+async def test_raw_posts_by_prompt(
+    db_engine: AsyncEngine, seeded: dict[str, Any]
+) -> None:
+    await _check_plan(
+        db_engine,
+        lambda conn: RawPostRepository().get_raw_posts_by_prompt(
+            conn, seeded["prompt_id"], seeded["since"], limit=100, use_offsets=False
+        ),
+        "raw_posts",
+        Budget(cost=450, buffers=150),
+        index=RAW_POSTS_VISIBLE_INDEX,
+    )
+
+
+@pytest.mark.parametrize("with_cursor", [False, True])
+async def test_feed_posts_page(
+    db_engine: AsyncEngine, seeded: dict[str, Any], with_cursor: bool
+) -> None:
+    cursor = seeded["cursor"] if with_cursor else None
+    await _check_plan(
+        db_engine,
+        lambda conn: PostRepository().get_feed_posts_paginated(
+            conn, seeded["feed_id"], uuid.uuid4(), limit=20, cursor=cursor
+        ),
+        "posts",
+        Budget(cost=150, buffers=15),
+        index=POSTS_FEED_INDEX,
+    )
+
+
+@pytest.mark.parametrize("method", ["rss", "web"])
+@pytest.mark.usefixtures("seeded")
+async def test_feeds_due_for_poll(db_engine: AsyncEngine, method: str) -> None:
+    repository = RawFeedRepository()
+    due_for_poll = (
+        repository.get_rss_feeds_due_for_poll
+        if method == "rss"
+        else repository.get_web_feeds_due_for_poll
+    )
+    await _check_plan(
+        db_engine,
+        lambda conn: due_for_poll(conn, TIER_INTERVALS),
+        "raw_feeds",
+        Budget(cost=10, buffers=60),
+    )
+
+
+@pytest.mark.parametrize(
+    ("preferred_type", "index"),
+    [
+        (PrePromptType.SINGLE_POST, PROMPTS_SINGLE_POST_INDEX),
+        (PrePromptType.DIGEST, PROMPTS_DIGEST_INDEX),
+    ],
+)
+@pytest.mark.usefixtures("seeded")
+async def test_claim_prompts_for_background_processing(
+    db_engine: AsyncEngine,
+    preferred_type: PrePromptType,
+    index: str,
+) -> None:
+    await _check_plan(
+        db_engine,
+        lambda conn: PromptRepository().claim_prompts_for_background_processing(
+            conn, preferred_type, limit=10
+        ),
+        "prompts",
+        Budget(cost=150, buffers=120),
+        index=index,
+    )
+
+
+async def test_marketplace_feeds_by_tags(
+    db_engine: AsyncEngine, seeded: dict[str, Any]
+) -> None:
+    # The catalog lookup is cached per tag set; make the call query it
+    invalidate_cache(MARKETPLACE_CATALOG_CACHE)
+    await _check_plan(
+        db_engine,
+        lambda conn: MarketplaceRepository().get_marketplace_feeds(
+            conn, seeded["reader_id"]
+        ),
+        "marketplace_catalog",
+        Budget(cost=60, buffers=25),
+        index=FEEDS_MARKETPLACE_TAGS_INDEX,
+    )
+
+
+async def test_chat_with_history(
+    db_engine: AsyncEngine, seeded: dict[str, Any]
+) -> None:
+    await _check_plan(
+        db_engine,
+        lambda conn: ChatRepository().get_chat_with_pre_prompt_and_history(
+            conn, seeded["chat_id"]
+        ),
+        "chats",
+        Budget(cost=75, buffers=30),
+        index=CHATS_MESSAGES_INDEX,
+    )
+
+
+async def test_chat_messages_before(
+    db_engine: AsyncEngine, seeded: dict[str, Any]
+) -> None:
+    await _check_plan(
+        db_engine,
+        lambda conn: ChatRepository().get_chat_messages_before(
+            conn, seeded["chat_id"], before_sequence=30, limit=20
+        ),
+        "chats_messages",
+        Budget(cost=15, buffers=10),
+        index=CHATS_MESSAGES_INDEX,
+    )
@@ -0,0 +1,111 @@
+"""RawPostRepository batch ingest: VALUES up to the threshold, COPY above it.
+
+Needs TEST_DATABASE_URL (see conftest.py).
+"""
+
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+import pytest
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from shared.database.tables import raw_feeds, raw_posts
+from shared.repositories import raw_post
+from shared.repositories.raw_post import RawPostRepository
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+async def _raw_feed(db_engine: AsyncEngine) -> UUID:
+    async with db_engine.begin() as conn:
+        return (
+            await conn.execute(
+                insert(raw_feeds).values(name="ingest").returning(raw_feeds.c.id)
+            )
+        ).scalar_one()
+
+
+def _rss_posts(raw_feed_id: UUID, start: int, count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "raw_feed_id": raw_feed_id,
+            "content": f"content {i}",
+            "title": f"Post {i}",
+            "media_objects": [],
+            "rp_unique_code": f"{raw_feed_id}_{i}",
+            "created_at": datetime.now(timezone.utc),
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def _telegram_posts(raw_feed_id: UUID, start: int, count: int) -> list[dict[str, Any]]:
+    chat_id = raw_feed_id.int % 10**12
+    return [
+        {
+            "raw_feed_id": raw_feed_id,
+            "content": f"content {i}",
+            "title": "",
+            "media_objects": [],
+            "telegram_message_id": i,
+            "telegram_chat_id": chat_id,
+        }
+        for i in range(start, start + count)
+    ]
+
+
+async def _count(db_engine: AsyncEngine, raw_feed_id: UUID) -> int:
+    async with db_engine.connect() as conn:
+        return (
+            await conn.execute(
+                select(func.count())
+                .select_from(raw_posts)
+                .where(raw_posts.c.raw_feed_id == raw_feed_id)
+            )
+        ).scalar_one()
+
+
+@pytest.fixture
+def copy_calls(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Lower the threshold to 3 posts and record COPY batch sizes."""
+    monkeypatch.setattr(raw_post, "BULK_INGEST_THRESHOLD", 3)
+    calls: list[int] = []
+    copy_insert = RawPostRepository._copy_insert_raw_posts
+
+    async def recording(self, conn, records, chunk_size):
+        calls.append(len(records))
+        return await copy_insert(self, conn, records, chunk_size)
+
+    monkeypatch.setattr(RawPostRepository, "_copy_insert_raw_posts", recording)
+    return calls
+
+
+@pytest.mark.parametrize(
+    ("method", "build"),
+    [
+        ("batch_create_rss_raw_posts", _rss_posts),
+        ("batch_create_telegram_raw_posts", _telegram_posts),
+    ],
+)
+async def test_batch_create_switches_to_copy_above_threshold(
+    db_engine: AsyncEngine, copy_calls: list[int], method: str, build: Any
+) -> None:
+    repository = RawPostRepository()
+    raw_feed_id = await _raw_feed(db_engine)
+    create = getattr(repository, method)
+    small = build(raw_feed_id, 0, 3)
+    large = build(raw_feed_id, 3, 5)
+
+    async with db_engine.begin() as conn:
+        small_ids = await create(conn, small)
+        large_ids = await create(conn, large)
+        again = await create(conn, large)
+
+    assert len(small_ids) == 3
+    assert len(large_ids) == 5
+    # Duplicates are skipped on the COPY path as on the VALUES path
+    assert again == []
+    assert copy_calls == [5, 5]
+    assert await _count(db_engine, raw_feed_id) == 8
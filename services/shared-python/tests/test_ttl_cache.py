@@ -0,0 +1,102 @@
+"""TTLCache read-through loading, stampede protection and cancellation."""
+
+import asyncio
+
+import pytest
+
+from shared.utils.ttl_cache import TTLCache
+
+pytestmark = pytest.mark.asyncio
+
+
+class _Loader:
+    """Loader that counts calls and blocks until released."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        self.started.set()
+        await self.release.wait()
+        return f"value {self.calls}"
+
+
+async def test_concurrent_misses_share_one_load() -> None:
+    cache = TTLCache("test")
+    loader = _Loader()
+
+    tasks = [asyncio.create_task(cache.get_or_load("k", loader)) for _ in range(5)]
+    await loader.started.wait()
+    loader.release.set()
+
+    assert await asyncio.gather(*tasks) == ["value 1"] * 5
+    assert loader.calls == 1
+    assert await cache.get_or_load("k", loader) == "value 1"
+
+
+async def test_loader_error_reaches_every_waiter_and_is_not_cached() -> None:
+    cache = TTLCache("test")
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def failing() -> str:
+        started.set()
+        await release.wait()
+        raise ValueError("boom")
+
+    first = asyncio.create_task(cache.get_or_load("k", failing))
+    await started.wait()
+    second = asyncio.create_task(cache.get_or_load("k", failing))
+    await asyncio.sleep(0)
+    release.set()
+
+    for task in (first, second):
+        with pytest.raises(ValueError):
+            await task
+
+    async def ok() -> str:
+        return "ok"
+
+    assert await cache.get_or_load("k", ok) == "ok"
+
+
+async def test_cancelling_the_loading_caller_does_not_cancel_waiters() -> None:
+    cache = TTLCache("test")
+    loader = _Loader()
+
+    first = asyncio.create_task(cache.get_or_load("k", loader))
+    await loader.started.wait()
+    second = asyncio.create_task(cache.get_or_load("k", loader))
+    third = asyncio.create_task(cache.get_or_load("k", loader))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    # One waiter takes over the load; the other waits on it
+    await asyncio.sleep(0)
+    loader.release.set()
+    assert await asyncio.gather(second, third) == ["value 2", "value 2"]
+    assert loader.calls == 2
+
+
+async def test_cancelled_waiter_leaves_the_load_running() -> None:
+    cache = TTLCache("test")
+    loader = _Loader()
+
+    first = asyncio.create_task(cache.get_or_load("k", loader))
+    await loader.started.wait()
+    second = asyncio.create_task(cache.get_or_load("k", loader))
+    await asyncio.sleep(0)
+
+    second.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await second
+
+    loader.release.set()
+    assert await first == "value 1"
+    assert loader.calls == 1